@@ -0,0 +1,33 @@
+"""Add task tombstones and updated_at index for delta sync.
+
+Revision ID: 010
+Revises: 009
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision = "010"
+down_revision = "009"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "task_tombstones",
+        sa.Column("task_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("workspace_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("deleted_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.PrimaryKeyConstraint("task_id"),
+        sa.ForeignKeyConstraint(["workspace_id"], ["workspaces.id"], ondelete="CASCADE"),
+    )
+    op.create_index(
+        "ix_task_tombstone_workspace_deleted", "task_tombstones", ["workspace_id", "deleted_at", "task_id"]
+    )
+    op.create_index("ix_task_workspace_updated", "tasks", ["workspace_id", "updated_at", "id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_task_workspace_updated", table_name="tasks")
+    op.drop_table("task_tombstones")
@@ -0,0 +1,40 @@
+"""Add full-text search vectors to tasks and comments.
+
+Revision ID: 011
+Revises: 010
+"""
+from alembic import op
+from sqlalchemy import text
+
+revision = "011"
+down_revision = "010"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    conn.execute(text("""
+        ALTER TABLE tasks ADD COLUMN IF NOT EXISTS search_vector tsvector
+        GENERATED ALWAYS AS (
+            setweight(to_tsvector('simple', coalesce(name, '')), 'A') ||
+            setweight(to_tsvector('simple', coalesce(description, '')), 'B')
+        ) STORED
+    """))
+    conn.execute(text("""
+        ALTER TABLE comments ADD COLUMN IF NOT EXISTS search_vector tsvector
+        GENERATED ALWAYS AS (to_tsvector('simple', coalesce(body, ''))) STORED
+    """))
+    conn.execute(text(
+        "CREATE INDEX IF NOT EXISTS ix_task_search_vector ON tasks USING gin (search_vector)"
+    ))
+    conn.execute(text(
+        "CREATE INDEX IF NOT EXISTS ix_comment_search_vector ON comments USING gin (search_vector)"
+    ))
+
+
+def downgrade() -> None:
+    op.drop_index("ix_comment_search_vector")
+    op.drop_index("ix_task_search_vector")
+    op.drop_column("comments", "search_vector")
+    op.drop_column("tasks", "search_vector")
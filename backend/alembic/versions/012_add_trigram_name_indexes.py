@@ -0,0 +1,34 @@
+"""Add pg_trgm indexes on entity names for global quick search.
+
+Revision ID: 012
+Revises: 011
+"""
+from alembic import op
+from sqlalchemy import text
+
+revision = "012"
+down_revision = "011"
+branch_labels = None
+depends_on = None
+
+TRIGRAM_INDEXES = {
+    "ix_task_name_trgm": "tasks",
+    "ix_project_name_trgm": "projects",
+    "ix_team_name_trgm": "teams",
+    "ix_user_name_trgm": "users",
+    "ix_client_name_trgm": "clients",
+}
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+    for name, table in TRIGRAM_INDEXES.items():
+        conn.execute(text(
+            f"CREATE INDEX IF NOT EXISTS {name} ON {table} USING gin (name gin_trgm_ops)"
+        ))
+
+
+def downgrade() -> None:
+    for name in TRIGRAM_INDEXES:
+        op.drop_index(name)
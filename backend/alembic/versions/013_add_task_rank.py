@@ -0,0 +1,41 @@
+"""Add fractional rank keys to tasks.
+
+Revision ID: 013
+Revises: 012
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "013"
+down_revision = "012"
+branch_labels = None
+depends_on = None
+
+DIGITS = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"
+
+
+def upgrade() -> None:
+    op.add_column("tasks", sa.Column("rank", sa.String(255, collation="C"), nullable=True))
+    op.create_index("ix_task_project_rank", "tasks", ["workspace_id", "project_id", "rank"])
+
+    # Spread existing tasks evenly over four base-62 digits per project, in
+    # their current board order. Trailing zero digits are trimmed so every
+    # key leaves room before it (see app.services.rank_service).
+    digit = "substr('{digits}', (pos / {scale} % 62)::int + 1, 1)"
+    key = " || ".join(digit.format(digits=DIGITS, scale=62**i) for i in (3, 2, 1, 0))
+    op.execute(f"""
+        UPDATE tasks SET rank = rtrim({key}, '0')
+        FROM (
+            SELECT id,
+                   row_number() OVER w * {62**4} / (count(*) OVER p + 1) AS pos
+            FROM tasks
+            WINDOW p AS (PARTITION BY workspace_id, project_id),
+                   w AS (p ORDER BY sort_order, created_at)
+        ) AS ranked
+        WHERE tasks.id = ranked.id
+    """)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_task_project_rank", table_name="tasks")
+    op.drop_column("tasks", "rank")
@@ -0,0 +1,86 @@
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import get_db
+from app.models.api_token import ApiToken
+from app.models.user import User
+from app.schemas.api_token import ApiTokenCreate, ApiTokenCreated, ApiTokenResponse
+from app.services.api_token_service import (
+    generate_api_token,
+    hash_api_token,
+    invalidate_api_tokens,
+)
+from app.utils.auth import get_current_user, get_session_user
+
+router = APIRouter(
+    prefix="/workspaces/{workspace_id}/api-tokens",
+    tags=["api-tokens"],
+)
+
+
+@router.get("", response_model=list[ApiTokenResponse])
+async def list_api_tokens(
+    workspace_id: uuid.UUID,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    result = await db.execute(
+        select(ApiToken)
+        .where(ApiToken.workspace_id == workspace_id, ApiToken.user_id == current_user.id)
+        .order_by(ApiToken.created_at.desc())
+    )
+    return result.scalars().all()
+
+
+@router.post("", response_model=ApiTokenCreated, status_code=201)
+async def create_api_token(
+    workspace_id: uuid.UUID,
+    data: ApiTokenCreate,
+    current_user: User = Depends(get_session_user),
+    db: AsyncSession = Depends(get_db),
+):
+    token = generate_api_token()
+    api_token = ApiToken(
+        name=data.name,
+        token_hash=hash_api_token(token),
+        token_prefix=token[:10],
+        # write implies read
+        scopes=["read", "write"] if "write" in data.scopes else ["read"],
+        expires_at=(
+            datetime.now(timezone.utc) + timedelta(days=data.expires_in_days)
+            if data.expires_in_days else None
+        ),
+        user_id=current_user.id,
+        workspace_id=workspace_id,
+    )
+    db.add(api_token)
+    await db.commit()
+    await db.refresh(api_token)
+    return ApiTokenCreated(**ApiTokenResponse.model_validate(api_token).model_dump(), token=token)
+
+
+@router.delete("/{token_id}", status_code=204)
+async def revoke_api_token(
+    workspace_id: uuid.UUID,
+    token_id: uuid.UUID,
+    current_user: User = Depends(get_session_user),
+    db: AsyncSession = Depends(get_db),
+):
+    result = await db.execute(
+        select(ApiToken).where(
+            ApiToken.id == token_id,
+            ApiToken.workspace_id == workspace_id,
+            ApiToken.user_id == current_user.id,
+        )
+    )
+    api_token = result.scalar_one_or_none()
+    if not api_token:
+        raise HTTPException(status_code=404, detail="API token not found")
+
+    await db.delete(api_token)
+    await db.commit()
+    await invalidate_api_tokens(api_token.token_hash)
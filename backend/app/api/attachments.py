@@ -12,11 +12,12 @@ from app.database import get_db
 from app.models.attachment import Attachment
 from app.models.user import User
 from app.schemas.attachment import AttachmentResponse
-from app.utils.auth import get_current_user
+from app.utils.auth import get_current_user, get_workspace_task
 
 router = APIRouter(
     prefix="/workspaces/{workspace_id}/tasks/{task_id}/attachments",
     tags=["attachments"],
+    dependencies=[Depends(get_workspace_task)],
 )
 
 
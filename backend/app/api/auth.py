@@ -10,11 +10,13 @@ from app.database import get_db
 from app.models.user import User
 from app.models.workspace import Workspace
 from app.schemas.user import TokenRefresh, TokenResponse, UserLogin, UserRegister, UserResponse
+from app.services.principal_cache import invalidate_principals
 from app.utils.auth import (
     create_access_token,
     create_refresh_token,
     decode_token,
     get_current_user,
+    get_session_user,
     hash_password,
     verify_password,
 )
@@ -48,7 +50,7 @@ async def register(data: UserRegister, db: AsyncSession = Depends(get_db)):
     user = User(
         name=data.name,
         email=data.email,
-        password_hash=hash_password(data.password),
+        password_hash=await hash_password(data.password),
         initials=initials,
         role="owner",
         workspace_id=workspace.id,
@@ -73,7 +75,7 @@ class LoginRequest(BaseModel):
 async def login(data: LoginRequest, db: AsyncSession = Depends(get_db)):
     result = await db.execute(select(User).where(User.email == data.email))
     user = result.scalar_one_or_none()
-    if not user or not user.password_hash or not verify_password(data.password, user.password_hash):
+    if not user or not user.password_hash or not await verify_password(data.password, user.password_hash):
         raise HTTPException(status_code=401, detail="Invalid email or password")
 
     if user.totp_enabled and user.totp_secret:
@@ -122,16 +124,18 @@ class ChangePasswordRequest(BaseModel):
 @router.post("/change-password", status_code=204)
 async def change_password(
     data: ChangePasswordRequest,
-    current_user: User = Depends(get_current_user),
+    current_user: User = Depends(get_session_user),
     db: AsyncSession = Depends(get_db),
 ):
-    if not current_user.password_hash or not verify_password(data.current_password, current_user.password_hash):
+    await db.refresh(current_user, ["password_hash"])
+    if not current_user.password_hash or not await verify_password(data.current_password, current_user.password_hash):
         raise HTTPException(status_code=400, detail="Current password is incorrect")
     if len(data.new_password) < 6:
         raise HTTPException(status_code=400, detail="New password must be at least 6 characters")
 
-    current_user.password_hash = hash_password(data.new_password)
+    current_user.password_hash = await hash_password(data.new_password)
     await db.commit()
+    await invalidate_principals(current_user.id)
 
 
 # --- 2FA (TOTP) ---
@@ -149,7 +153,7 @@ class TotpVerifyRequest(BaseModel):
 
 @router.post("/2fa/setup", response_model=TotpSetupResponse)
 async def setup_2fa(
-    current_user: User = Depends(get_current_user),
+    current_user: User = Depends(get_session_user),
     db: AsyncSession = Depends(get_db),
 ):
     if not HAS_TOTP:
@@ -160,6 +164,7 @@ async def setup_2fa(
     secret = pyotp.random_base32()
     current_user.totp_secret = secret
     await db.commit()
+    await invalidate_principals(current_user.id)
 
     totp = pyotp.TOTP(secret)
     uri = totp.provisioning_uri(name=current_user.email or current_user.name, issuer_name="Planview")
@@ -175,11 +180,12 @@ async def setup_2fa(
 @router.post("/2fa/verify", status_code=204)
 async def verify_2fa(
     data: TotpVerifyRequest,
-    current_user: User = Depends(get_current_user),
+    current_user: User = Depends(get_session_user),
     db: AsyncSession = Depends(get_db),
 ):
     if not HAS_TOTP:
         raise HTTPException(status_code=501, detail="2FA libraries not installed")
+    await db.refresh(current_user, ["totp_secret"])
     if not current_user.totp_secret:
         raise HTTPException(status_code=400, detail="2FA not set up — call /2fa/setup first")
 
@@ -189,12 +195,13 @@ async def verify_2fa(
 
     current_user.totp_enabled = True
     await db.commit()
+    await invalidate_principals(current_user.id)
 
 
 @router.post("/2fa/disable", status_code=204)
 async def disable_2fa(
     data: TotpVerifyRequest,
-    current_user: User = Depends(get_current_user),
+    current_user: User = Depends(get_session_user),
     db: AsyncSession = Depends(get_db),
 ):
     if not HAS_TOTP:
@@ -202,6 +209,7 @@ async def disable_2fa(
     if not current_user.totp_enabled:
         raise HTTPException(status_code=400, detail="2FA is not enabled")
 
+    await db.refresh(current_user, ["totp_secret"])
     totp = pyotp.TOTP(current_user.totp_secret)
     if not totp.verify(data.code):
         raise HTTPException(status_code=400, detail="Invalid 2FA code")
@@ -209,3 +217,4 @@ async def disable_2fa(
     current_user.totp_enabled = False
     current_user.totp_secret = None
     await db.commit()
+    await invalidate_principals(current_user.id)
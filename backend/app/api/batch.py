@@ -0,0 +1,162 @@
+"""
+Batched reads: several API GETs in one HTTP request.
+
+Each sub-request is dispatched in-process through the whole ASGI app, so it
+gets the same middleware, exception handlers and per-route query budget as a
+direct call. The batch is rate limited as one request: sub-requests carry a
+scope flag the rate limiter skips. Sub-requests run concurrently, each with its own session — asyncpg can't overlap
+queries on a single connection — and reuse the caller's credentials, which
+the principal cache resolves without touching the database.
+"""
+import asyncio
+import logging
+from urllib.parse import urlsplit
+
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from pydantic import BaseModel, Field
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.types import Message
+
+from app.database import get_db
+from app.middleware.rate_limit import BATCHED, DEFAULT_POLICIES
+from app.models.user import User
+from app.services.api_token_service import API_TOKEN_PREFIX
+from app.utils.auth import authenticate_api_token, authenticate_token, oauth2_scheme
+from app.utils.serialization import dumps
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/batch", tags=["batch"])
+
+API_PREFIX = "/api/v1"
+MAX_SUB_REQUESTS = 20
+MAX_CONCURRENCY = 5  # per batch, well inside the connection pool
+
+# Headers a sub-request may set; credentials always come from the batch itself
+FORWARDED_HEADERS = {"accept", "if-none-match"}
+
+
+class SubRequest(BaseModel):
+    id: str | None = None  # echoed back; defaults to the position in the list
+    method: str = Field("GET", pattern="^GET$")
+    url: str  # relative to /api/v1, e.g. "/workspaces/{id}/stats?days=7"
+    headers: dict[str, str] = {}
+
+
+class BatchRequest(BaseModel):
+    requests: list[SubRequest] = Field(..., min_length=1, max_length=MAX_SUB_REQUESTS)
+
+
+class SubResponse(BaseModel):
+    id: str
+    status: int
+    headers: dict[str, str]
+    body: object | None
+
+
+class BatchResponse(BaseModel):
+    responses: list[SubResponse]
+
+
+async def get_batch_caller(
+    token: str = Depends(oauth2_scheme),
+    db: AsyncSession = Depends(get_db),
+) -> User:
+    # Only GETs can be batched, so read-only API tokens are welcome too
+    if token.startswith(API_TOKEN_PREFIX):
+        return await authenticate_api_token(db, token, "GET")
+    return await authenticate_token(db, token)
+
+
+def _check_url(url: str) -> tuple[str, str]:
+    parts = urlsplit(url)
+    if parts.scheme or parts.netloc or not parts.path.startswith("/"):
+        raise HTTPException(status_code=400, detail=f"Batch URLs must be API paths: {url}")
+    path = API_PREFIX + parts.path
+    if path.startswith(f"{API_PREFIX}/batch"):
+        raise HTTPException(status_code=400, detail="Batches can't be nested")
+    # Routes with a rate limit policy of their own can't be slipped into a batch
+    policy = next((p for p in DEFAULT_POLICIES if p.matches("GET", path)), None)
+    if policy is not None and policy.path is not None:
+        raise HTTPException(status_code=400, detail=f"{url} can't be batched")
+    return path, parts.query
+
+
+async def _dispatch(request: Request, sub: SubRequest, path: str, query: str) -> tuple[int, dict[str, str], bytes]:
+    headers = [
+        (name.lower().encode(), value.encode())
+        for name, value in sub.headers.items()
+        if name.lower() in FORWARDED_HEADERS
+    ]
+    authorization = request.headers.get("authorization")
+    if authorization:
+        headers.append((b"authorization", authorization.encode()))
+
+    scope = {
+        **{key: request.scope[key] for key in ("type", "asgi", "http_version", "scheme", "server", "client", "app")},
+        "method": "GET",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": request.scope.get("root_path", ""),
+        "query_string": query.encode(),
+        "headers": headers,
+        "state": dict(request.scope.get("state", {})),
+        BATCHED: True,
+    }
+    status = 500
+    response_headers: dict[str, str] = {}
+    chunks: list[bytes] = []
+
+    async def receive() -> Message:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: Message) -> None:
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+            for name, value in message.get("headers", []):
+                if name != b"content-length":
+                    response_headers[name.decode("latin-1")] = value.decode("latin-1")
+        elif message["type"] == "http.response.body":
+            chunks.append(message.get("body", b""))
+
+    try:
+        await request.app(scope, receive, send)
+    except Exception:
+        # The app has logged it and sent its 500 response before re-raising
+        if status == 500 and chunks:
+            return status, response_headers, b"".join(chunks)
+        logger.exception("Unhandled error in batched GET %s", path)
+        return 500, {"content-type": "application/json"}, b'{"detail":"Internal server error"}'
+    return status, response_headers, b"".join(chunks)
+
+
+@router.post("", response_model=BatchResponse)
+async def batch(
+    request: Request,
+    data: BatchRequest,
+    current_user: User = Depends(get_batch_caller),
+):
+    """Run up to 20 GETs and return their responses in order.
+
+    A failing sub-request doesn't fail the batch; check each ``status``.
+    """
+    targets = [_check_url(sub.url) for sub in data.requests]
+    limit = asyncio.Semaphore(MAX_CONCURRENCY)
+
+    async def run(sub: SubRequest, path: str, query: str):
+        async with limit:
+            return await _dispatch(request, sub, path, query)
+
+    results = await asyncio.gather(*(run(sub, *target) for sub, target in zip(data.requests, targets)))
+
+    # JSON bodies are embedded as they are rather than parsed and re-encoded
+    items = []
+    for position, (sub, (status, headers, body)) in enumerate(zip(data.requests, results)):
+        if not body:
+            body = b"null"
+        elif not headers.get("content-type", "").startswith("application/json"):
+            body = dumps(body.decode(errors="replace"))
+        meta = dumps({"id": sub.id or str(position), "status": status, "headers": headers})
+        items.append(meta[:-1] + b',"body":' + body + b"}")
+    return Response(b'{"responses":[' + b",".join(items) + b"]}", media_type="application/json")
@@ -8,12 +8,14 @@ from app.database import get_db
 from app.models.client import Client
 from app.models.user import User
 from app.schemas.client import ClientCreate, ClientResponse, ClientUpdate
+from app.services.response_cache import cached_response, invalidate_tags
 from app.utils.auth import get_current_user
 
 router = APIRouter(prefix="/workspaces/{workspace_id}/clients", tags=["clients"])
 
 
 @router.get("", response_model=list[ClientResponse])
+@cached_response(list[ClientResponse], "workspace:{workspace_id}:clients")
 async def list_clients(
     workspace_id: uuid.UUID,
     current_user: User = Depends(get_current_user),
@@ -35,6 +37,7 @@ async def create_client(
     client = Client(name=data.name, workspace_id=workspace_id)
     db.add(client)
     await db.commit()
+    await invalidate_tags(f"workspace:{workspace_id}:clients")
     await db.refresh(client)
     return client
 
@@ -58,6 +61,7 @@ async def update_client(
         setattr(client, field, value)
 
     await db.commit()
+    await invalidate_tags(f"workspace:{workspace_id}:clients")
     await db.refresh(client)
     return client
 
@@ -78,3 +82,5 @@ async def delete_client(
 
     await db.delete(client)
     await db.commit()
+    # Projects keep their row but lose the client
+    await invalidate_tags(f"workspace:{workspace_id}:clients", f"workspace:{workspace_id}:projects")
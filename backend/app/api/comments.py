@@ -14,12 +14,13 @@ from app.schemas.comment import CommentCreate, CommentResponse, CommentUpdate
 from app.services.notification_service import notify_comment_added
 from app.services.webhook_service import deliver_webhooks
 from app.services.email_service import send_comment_email
-from app.utils.auth import get_current_user
+from app.utils.auth import get_current_user, get_workspace_task
 from app.websocket.events import emit_event
 
 router = APIRouter(
     prefix="/workspaces/{workspace_id}/tasks/{task_id}/comments",
     tags=["comments"],
+    dependencies=[Depends(get_workspace_task)],
 )
 
 
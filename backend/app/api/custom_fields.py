@@ -14,7 +14,8 @@ from app.schemas.custom_field import (
     CustomFieldValueResponse,
     CustomFieldValueSet,
 )
-from app.utils.auth import get_current_user
+from app.services.response_cache import cached_response, invalidate_tags
+from app.utils.auth import get_current_user, get_workspace_task
 
 router = APIRouter(
     prefix="/workspaces/{workspace_id}/custom-fields",
@@ -23,6 +24,7 @@ router = APIRouter(
 
 
 @router.get("", response_model=list[CustomFieldResponse])
+@cached_response(list[CustomFieldResponse], "workspace:{workspace_id}:custom_fields")
 async def list_custom_fields(
     workspace_id: uuid.UUID,
     current_user: User = Depends(get_current_user),
@@ -52,6 +54,7 @@ async def create_custom_field(
     )
     db.add(field)
     await db.commit()
+    await invalidate_tags(f"workspace:{workspace_id}:custom_fields")
     await db.refresh(field)
     return field
 
@@ -76,6 +79,7 @@ async def update_custom_field(
     for k, v in data.model_dump(exclude_unset=True).items():
         setattr(field, k, v)
     await db.commit()
+    await invalidate_tags(f"workspace:{workspace_id}:custom_fields")
     await db.refresh(field)
     return field
 
@@ -98,12 +102,17 @@ async def delete_custom_field(
         raise HTTPException(status_code=404, detail="Custom field not found")
     await db.delete(field)
     await db.commit()
+    await invalidate_tags(f"workspace:{workspace_id}:custom_fields")
 
 
 # --- Field values on tasks ---
 
 
-@router.get("/tasks/{task_id}/values", response_model=list[CustomFieldValueResponse])
+@router.get(
+    "/tasks/{task_id}/values",
+    response_model=list[CustomFieldValueResponse],
+    dependencies=[Depends(get_workspace_task)],
+)
 async def get_task_field_values(
     workspace_id: uuid.UUID,
     task_id: uuid.UUID,
@@ -116,7 +125,11 @@ async def get_task_field_values(
     return result.scalars().all()
 
 
-@router.put("/tasks/{task_id}/values", response_model=list[CustomFieldValueResponse])
+@router.put(
+    "/tasks/{task_id}/values",
+    response_model=list[CustomFieldValueResponse],
+    dependencies=[Depends(get_workspace_task)],
+)
 async def set_task_field_values(
     workspace_id: uuid.UUID,
     task_id: uuid.UUID,
@@ -124,6 +137,14 @@ async def set_task_field_values(
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
+    field_ids = {item.field_id for item in data}
+    if field_ids:
+        found = await db.scalars(
+            select(CustomField.id).where(CustomField.id.in_(field_ids), CustomField.workspace_id == workspace_id)
+        )
+        if set(found) != field_ids:
+            raise HTTPException(status_code=400, detail="Custom field not found")
+
     for item in data:
         existing = await db.execute(
             select(CustomFieldValue).where(
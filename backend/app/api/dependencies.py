@@ -5,6 +5,7 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
+from app.models.task import Task
 from app.models.task_dependency import TaskDependency
 from app.models.user import User
 from app.schemas.task_dependency import DependencyCreate, DependencyResponse
@@ -47,6 +48,12 @@ async def create_dependency(
     if data.blocker_id == data.blocked_id:
         raise HTTPException(status_code=400, detail="A task cannot depend on itself")
 
+    found = await db.scalars(
+        select(Task.id).where(Task.id.in_([data.blocker_id, data.blocked_id]), Task.workspace_id == workspace_id)
+    )
+    if len(found.all()) != 2:
+        raise HTTPException(status_code=400, detail="Task not found")
+
     existing = await db.execute(
         select(TaskDependency).where(
             TaskDependency.blocker_id == data.blocker_id,
@@ -75,7 +82,10 @@ async def delete_dependency(
     db: AsyncSession = Depends(get_db),
 ):
     result = await db.execute(
-        select(TaskDependency).where(TaskDependency.id == dependency_id)
+        select(TaskDependency).where(
+            TaskDependency.id == dependency_id,
+            TaskDependency.blocker.has(workspace_id=workspace_id),
+        )
     )
     dep = result.scalar_one_or_none()
     if not dep:
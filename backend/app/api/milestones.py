@@ -8,12 +8,14 @@ from app.database import get_db
 from app.models.milestone import Milestone
 from app.models.user import User
 from app.schemas.milestone import MilestoneCreate, MilestoneResponse, MilestoneUpdate
+from app.services.response_cache import cached_response, invalidate_tags
 from app.utils.auth import get_current_user
 
 router = APIRouter(prefix="/workspaces/{workspace_id}/milestones", tags=["milestones"])
 
 
 @router.get("", response_model=list[MilestoneResponse])
+@cached_response(list[MilestoneResponse], "workspace:{workspace_id}:milestones")
 async def list_milestones(
     workspace_id: uuid.UUID,
     current_user: User = Depends(get_current_user),
@@ -43,6 +45,7 @@ async def create_milestone(
     )
     db.add(milestone)
     await db.commit()
+    await invalidate_tags(f"workspace:{workspace_id}:milestones")
     await db.refresh(milestone)
     return milestone
 
@@ -68,6 +71,7 @@ async def update_milestone(
         setattr(milestone, field, value)
 
     await db.commit()
+    await invalidate_tags(f"workspace:{workspace_id}:milestones")
     await db.refresh(milestone)
     return milestone
 
@@ -90,3 +94,4 @@ async def delete_milestone(
 
     await db.delete(milestone)
     await db.commit()
+    await invalidate_tags(f"workspace:{workspace_id}:milestones")
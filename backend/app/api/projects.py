@@ -1,7 +1,7 @@
 import uuid
 
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy import select
+from sqlalchemy import or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -9,16 +9,20 @@ from app.database import get_db
 from app.models.project import Project
 from app.models.segment import Segment
 from app.models.tag import Tag
+from app.models.task import Task, task_tags
 from app.models.user import User
 from app.schemas.project import ProjectCreate, ProjectResponse, ProjectUpdate
 from app.schemas.segment import SegmentCreate, SegmentResponse, SegmentUpdate
 from app.schemas.tag import TagCreate, TagResponse, TagUpdate
-from app.utils.auth import get_current_user
+from app.services.response_cache import cached_response, invalidate_tags
+from app.services.task_sync_service import touch_tasks
+from app.utils.auth import get_current_user, get_workspace_project
 
 router = APIRouter(prefix="/workspaces/{workspace_id}/projects", tags=["projects"])
 
 
 @router.get("", response_model=list[ProjectResponse])
+@cached_response(list[ProjectResponse], "workspace:{workspace_id}:projects")
 async def list_projects(
     workspace_id: uuid.UUID,
     current_user: User = Depends(get_current_user),
@@ -47,6 +51,7 @@ async def create_project(
     )
     db.add(project)
     await db.commit()
+    await invalidate_tags(f"workspace:{workspace_id}:projects")
     await db.refresh(project)
     return project
 
@@ -86,6 +91,7 @@ async def update_project(
         setattr(project, field, value)
 
     await db.commit()
+    await invalidate_tags(f"workspace:{workspace_id}:projects")
     await db.refresh(project)
     return project
 
@@ -104,13 +110,30 @@ async def delete_project(
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
 
+    # Its tasks lose their project, segment and tags in the database
+    project_tags = (
+        select(task_tags.c.task_id)
+        .join(Tag, Tag.id == task_tags.c.tag_id)
+        .where(Tag.project_id == project_id)
+    )
+    await touch_tasks(db, or_(Task.project_id == project_id, Task.id.in_(project_tags)))
     await db.delete(project)
     await db.commit()
+    # Tags and milestones go with the project
+    await invalidate_tags(
+        f"workspace:{workspace_id}:projects",
+        f"workspace:{workspace_id}:tags",
+        f"workspace:{workspace_id}:milestones",
+    )
 
 
 # --- Segments ---
 
-@router.get("/{project_id}/segments", response_model=list[SegmentResponse])
+@router.get(
+    "/{project_id}/segments",
+    response_model=list[SegmentResponse],
+    dependencies=[Depends(get_workspace_project)],
+)
 async def list_segments(
     workspace_id: uuid.UUID,
     project_id: uuid.UUID,
@@ -123,7 +146,12 @@ async def list_segments(
     return result.scalars().all()
 
 
-@router.post("/{project_id}/segments", response_model=SegmentResponse, status_code=201)
+@router.post(
+    "/{project_id}/segments",
+    response_model=SegmentResponse,
+    status_code=201,
+    dependencies=[Depends(get_workspace_project)],
+)
 async def create_segment(
     workspace_id: uuid.UUID,
     project_id: uuid.UUID,
@@ -138,7 +166,11 @@ async def create_segment(
     return segment
 
 
-@router.put("/{project_id}/segments/{segment_id}", response_model=SegmentResponse)
+@router.put(
+    "/{project_id}/segments/{segment_id}",
+    response_model=SegmentResponse,
+    dependencies=[Depends(get_workspace_project)],
+)
 async def update_segment(
     workspace_id: uuid.UUID,
     project_id: uuid.UUID,
@@ -162,7 +194,11 @@ async def update_segment(
     return segment
 
 
-@router.delete("/{project_id}/segments/{segment_id}", status_code=204)
+@router.delete(
+    "/{project_id}/segments/{segment_id}",
+    status_code=204,
+    dependencies=[Depends(get_workspace_project)],
+)
 async def delete_segment(
     workspace_id: uuid.UUID,
     project_id: uuid.UUID,
@@ -177,13 +213,19 @@ async def delete_segment(
     if not segment:
         raise HTTPException(status_code=404, detail="Segment not found")
 
+    await touch_tasks(db, Task.segment_id == segment_id)
     await db.delete(segment)
     await db.commit()
 
 
 # --- Tags ---
 
-@router.get("/{project_id}/tags", response_model=list[TagResponse])
+@router.get(
+    "/{project_id}/tags",
+    response_model=list[TagResponse],
+    dependencies=[Depends(get_workspace_project)],
+)
+@cached_response(list[TagResponse], "workspace:{workspace_id}:tags")
 async def list_tags(
     workspace_id: uuid.UUID,
     project_id: uuid.UUID,
@@ -196,7 +238,12 @@ async def list_tags(
     return result.scalars().all()
 
 
-@router.post("/{project_id}/tags", response_model=TagResponse, status_code=201)
+@router.post(
+    "/{project_id}/tags",
+    response_model=TagResponse,
+    status_code=201,
+    dependencies=[Depends(get_workspace_project)],
+)
 async def create_tag(
     workspace_id: uuid.UUID,
     project_id: uuid.UUID,
@@ -207,11 +254,16 @@ async def create_tag(
     tag = Tag(name=data.name, colour=data.colour, project_id=project_id)
     db.add(tag)
     await db.commit()
+    await invalidate_tags(f"workspace:{workspace_id}:tags")
     await db.refresh(tag)
     return tag
 
 
-@router.put("/{project_id}/tags/{tag_id}", response_model=TagResponse)
+@router.put(
+    "/{project_id}/tags/{tag_id}",
+    response_model=TagResponse,
+    dependencies=[Depends(get_workspace_project)],
+)
 async def update_tag(
     workspace_id: uuid.UUID,
     project_id: uuid.UUID,
@@ -231,11 +283,16 @@ async def update_tag(
         setattr(tag, field, value)
 
     await db.commit()
+    await invalidate_tags(f"workspace:{workspace_id}:tags")
     await db.refresh(tag)
     return tag
 
 
-@router.delete("/{project_id}/tags/{tag_id}", status_code=204)
+@router.delete(
+    "/{project_id}/tags/{tag_id}",
+    status_code=204,
+    dependencies=[Depends(get_workspace_project)],
+)
 async def delete_tag(
     workspace_id: uuid.UUID,
     project_id: uuid.UUID,
@@ -250,5 +307,7 @@ async def delete_tag(
     if not tag:
         raise HTTPException(status_code=404, detail="Tag not found")
 
+    await touch_tasks(db, Task.id.in_(select(task_tags.c.task_id).where(task_tags.c.tag_id == tag_id)))
     await db.delete(tag)
     await db.commit()
+    await invalidate_tags(f"workspace:{workspace_id}:tags")
@@ -16,6 +16,7 @@ from app.schemas.rota import (
     RotaResponse,
     RotaUpdate,
 )
+from app.services.response_cache import cached_response, invalidate_tags
 from app.utils.auth import get_current_user
 
 router = APIRouter(
@@ -35,6 +36,7 @@ def _rota_query(workspace_id: uuid.UUID):
 
 
 @router.get("", response_model=list[RotaResponse])
+@cached_response(list[RotaResponse], "workspace:{workspace_id}:rotas", "workspace:{workspace_id}:members")
 async def list_rotas(
     workspace_id: uuid.UUID,
     rota_type: str | None = Query(None, description="callout|weekday|24hour"),
@@ -70,6 +72,7 @@ async def create_rota(
     )
     db.add(rota)
     await db.commit()
+    await invalidate_tags(f"workspace:{workspace_id}:rotas")
 
     result = await db.execute(_rota_query(workspace_id).where(Rota.id == rota.id))
     return result.scalar_one()
@@ -112,6 +115,7 @@ async def update_rota(
         setattr(rota, field, value)
 
     await db.commit()
+    await invalidate_tags(f"workspace:{workspace_id}:rotas")
 
     result = await db.execute(_rota_query(workspace_id).where(Rota.id == rota_id))
     return result.scalar_one()
@@ -132,6 +136,7 @@ async def delete_rota(
         raise HTTPException(status_code=404, detail="Rota not found")
     await db.delete(rota)
     await db.commit()
+    await invalidate_tags(f"workspace:{workspace_id}:rotas")
 
 
 # --- Rota Entries ---
@@ -190,6 +195,7 @@ async def create_rota_entry(
     )
     db.add(entry)
     await db.commit()
+    await invalidate_tags(f"workspace:{workspace_id}:rotas")
 
     result = await db.execute(
         select(RotaEntry)
@@ -223,6 +229,7 @@ async def update_rota_entry(
         setattr(entry, field, value)
 
     await db.commit()
+    await invalidate_tags(f"workspace:{workspace_id}:rotas")
 
     result = await db.execute(
         select(RotaEntry)
@@ -252,3 +259,4 @@ async def delete_rota_entry(
         raise HTTPException(status_code=404, detail="Rota entry not found")
     await db.delete(entry)
     await db.commit()
+    await invalidate_tags(f"workspace:{workspace_id}:rotas")
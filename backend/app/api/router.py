@@ -1,33 +1,42 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
 
 from app.api import (
-    activity, attachments, auth, clients, comments, custom_fields, dependencies,
-    export, imports, milestones, notifications, projects, rotas, sharing, stats,
-    tags, tasks, teams, templates, time_off, timeline, users, webhooks, workspaces,
+    activity, api_tokens, attachments, auth, batch, clients, comments, custom_fields,
+    dependencies, export, imports, milestones, notifications, projects, rotas,
+    search, sharing, stats, tags, tasks, teams, templates, time_off, timeline,
+    users, webhooks, workspaces,
 )
+from app.utils.auth import get_workspace_member
 
 api_router = APIRouter(prefix="/api/v1")
+
+# Every route under /workspaces/{workspace_id}/ requires membership of that workspace
+member_only = [Depends(get_workspace_member)]
+
 api_router.include_router(auth.router)
 api_router.include_router(workspaces.router)
-api_router.include_router(users.router)
-api_router.include_router(teams.router)
-api_router.include_router(clients.router)
-api_router.include_router(projects.router)
-api_router.include_router(tasks.router)
-api_router.include_router(milestones.router)
-api_router.include_router(timeline.router)
-api_router.include_router(comments.router)
-api_router.include_router(notifications.router)
-api_router.include_router(attachments.router)
-api_router.include_router(export.router)
-api_router.include_router(imports.router)
+api_router.include_router(users.router, dependencies=member_only)
+api_router.include_router(teams.router, dependencies=member_only)
+api_router.include_router(clients.router, dependencies=member_only)
+api_router.include_router(projects.router, dependencies=member_only)
+api_router.include_router(tasks.router, dependencies=member_only)
+api_router.include_router(milestones.router, dependencies=member_only)
+api_router.include_router(timeline.router, dependencies=member_only)
+api_router.include_router(comments.router, dependencies=member_only)
+api_router.include_router(notifications.router, dependencies=member_only)
+api_router.include_router(attachments.router, dependencies=member_only)
+api_router.include_router(export.router, dependencies=member_only)
+api_router.include_router(imports.router, dependencies=member_only)
 api_router.include_router(sharing.router)
-api_router.include_router(time_off.router)
-api_router.include_router(tags.router)
-api_router.include_router(stats.router)
-api_router.include_router(activity.router)
-api_router.include_router(dependencies.router)
-api_router.include_router(custom_fields.router)
-api_router.include_router(templates.router)
-api_router.include_router(webhooks.router)
-api_router.include_router(rotas.router)
+api_router.include_router(time_off.router, dependencies=member_only)
+api_router.include_router(tags.router, dependencies=member_only)
+api_router.include_router(stats.router, dependencies=member_only)
+api_router.include_router(activity.router, dependencies=member_only)
+api_router.include_router(dependencies.router, dependencies=member_only)
+api_router.include_router(custom_fields.router, dependencies=member_only)
+api_router.include_router(templates.router, dependencies=member_only)
+api_router.include_router(webhooks.router, dependencies=member_only)
+api_router.include_router(rotas.router, dependencies=member_only)
+api_router.include_router(search.router, dependencies=member_only)
+api_router.include_router(api_tokens.router, dependencies=member_only)
+api_router.include_router(batch.router)
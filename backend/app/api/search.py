@@ -0,0 +1,23 @@
+import uuid
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import get_db
+from app.models.user import User
+from app.schemas.search import QuickSearchResponse
+from app.services.search_service import quick_search
+from app.utils.auth import get_current_user
+
+router = APIRouter(prefix="/workspaces/{workspace_id}/search", tags=["search"])
+
+
+@router.get("", response_model=QuickSearchResponse)
+async def global_search(
+    workspace_id: uuid.UUID,
+    q: str = Query(..., min_length=1, max_length=200),
+    limit: int = Query(5, ge=1, le=20, description="Max results per entity type"),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    return await quick_search(db, workspace_id, q, limit=limit)
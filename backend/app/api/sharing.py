@@ -1,7 +1,7 @@
 import secrets
 import uuid
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
@@ -11,7 +11,14 @@ from app.models.sharing import SharedTimeline
 from app.models.task import Task
 from app.models.user import User
 from app.schemas.sharing import SharedTimelineCreate, SharedTimelineResponse
-from app.utils.auth import get_current_user
+from app.schemas.task import TaskListNormalised, TaskResponse
+from app.services.task_query_service import (
+    normalise_tasks,
+    task_list_scopes,
+    task_responses,
+)
+from app.utils.auth import get_current_user, get_workspace_member
+from app.utils.etag import is_fresh, not_modified, scope_etag
 
 router = APIRouter(tags=["sharing"])
 
@@ -20,6 +27,7 @@ router = APIRouter(tags=["sharing"])
     "/workspaces/{workspace_id}/shared-timelines",
     response_model=SharedTimelineResponse,
     status_code=201,
+    dependencies=[Depends(get_workspace_member)],
 )
 async def create_shared_timeline(
     workspace_id: uuid.UUID,
@@ -44,6 +52,7 @@ async def create_shared_timeline(
 @router.get(
     "/workspaces/{workspace_id}/shared-timelines",
     response_model=list[SharedTimelineResponse],
+    dependencies=[Depends(get_workspace_member)],
 )
 async def list_shared_timelines(
     workspace_id: uuid.UUID,
@@ -61,6 +70,7 @@ async def list_shared_timelines(
 @router.delete(
     "/workspaces/{workspace_id}/shared-timelines/{timeline_id}",
     status_code=204,
+    dependencies=[Depends(get_workspace_member)],
 )
 async def delete_shared_timeline(
     workspace_id: uuid.UUID,
@@ -82,11 +92,14 @@ async def delete_shared_timeline(
 
 
 # Public endpoint — no auth required
-@router.get("/shared/{token}/tasks")
+@router.get("/shared/{token}/tasks", response_model=list[TaskResponse] | TaskListNormalised)
 async def get_shared_timeline_tasks(
+    request: Request,
+    response: Response,
     token: str,
     since: str | None = Query(None),
     until: str | None = Query(None),
+    format: str = Query("list", pattern="^(list|normalised)$", description="list|normalised"),
     db: AsyncSession = Depends(get_db),
 ):
     result = await db.execute(
@@ -96,9 +109,22 @@ async def get_shared_timeline_tasks(
     if not shared:
         raise HTTPException(status_code=404, detail="Shared timeline not found or inactive")
 
+    criteria = []
+    if shared.project_id:
+        criteria.append(Task.project_id == shared.project_id)
+    if since:
+        criteria.append(Task.date_to >= since)
+    if until:
+        criteria.append(Task.date_from <= until)
+
+    etag = await scope_etag(db, request, *task_list_scopes(shared.workspace_id, *criteria))
+    if is_fresh(request, etag):
+        return not_modified(etag)
+    response.headers["ETag"] = etag
+
     q = (
         select(Task)
-        .where(Task.workspace_id == shared.workspace_id)
+        .where(Task.workspace_id == shared.workspace_id, *criteria)
         .options(
             selectinload(Task.assignees),
             selectinload(Task.tags),
@@ -107,12 +133,9 @@ async def get_shared_timeline_tasks(
             selectinload(Task.subtasks),
         )
     )
-    if shared.project_id:
-        q = q.where(Task.project_id == shared.project_id)
-    if since:
-        q = q.where(Task.date_to >= since)
-    if until:
-        q = q.where(Task.date_from <= until)
 
-    tasks = await db.execute(q.order_by(Task.date_from))
-    return tasks.scalars().all()
+    result = await db.execute(q.order_by(Task.date_from))
+    tasks = result.scalars().all()
+    if format == "normalised":
+        return normalise_tasks(tasks)
+    return task_responses(tasks)
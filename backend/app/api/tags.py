@@ -6,17 +6,22 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
 from app.models.tag import Tag
+from app.models.task import Task, task_tags
 from app.models.user import User
 from app.schemas.tag import TagCreate, TagResponse, TagUpdate
-from app.utils.auth import get_current_user
+from app.services.response_cache import cached_response, invalidate_tags
+from app.services.task_sync_service import touch_tasks
+from app.utils.auth import get_current_user, get_workspace_project
 
 router = APIRouter(
     prefix="/workspaces/{workspace_id}/projects/{project_id}/tags",
     tags=["tags"],
+    dependencies=[Depends(get_workspace_project)],
 )
 
 
 @router.get("", response_model=list[TagResponse])
+@cached_response(list[TagResponse], "workspace:{workspace_id}:tags")
 async def list_tags(
     workspace_id: uuid.UUID,
     project_id: uuid.UUID,
@@ -39,6 +44,7 @@ async def create_tag(
     tag = Tag(name=data.name, colour=data.colour, project_id=project_id)
     db.add(tag)
     await db.commit()
+    await invalidate_tags(f"workspace:{workspace_id}:tags")
     await db.refresh(tag)
     return tag
 
@@ -58,6 +64,7 @@ async def update_tag(
     for field, value in data.model_dump(exclude_unset=True).items():
         setattr(tag, field, value)
     await db.commit()
+    await invalidate_tags(f"workspace:{workspace_id}:tags")
     await db.refresh(tag)
     return tag
 
@@ -73,5 +80,7 @@ async def delete_tag(
     tag = await db.get(Tag, tag_id)
     if not tag or tag.project_id != project_id:
         raise HTTPException(status_code=404, detail="Tag not found")
+    await touch_tasks(db, Task.id.in_(select(task_tags.c.task_id).where(task_tags.c.tag_id == tag_id)))
     await db.delete(tag)
     await db.commit()
+    await invalidate_tags(f"workspace:{workspace_id}:tags")
@@ -1,15 +1,32 @@
-import asyncio
 import uuid
-from datetime import date, timedelta
-
-from fastapi import APIRouter, Depends, HTTPException, Query
-from pydantic import BaseModel
-from sqlalchemy import select
+from datetime import date, datetime, timedelta
+from typing import Any
+
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Request, Response
+from pydantic import BaseModel, Field
+from sqlalchemy import (
+    Integer,
+    String,
+    any_,
+    bindparam,
+    column,
+    delete,
+    func,
+    insert,
+    literal,
+    select,
+    tuple_,
+    union_all,
+    update,
+    values,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, UUID as PG_UUID
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
 from app.database import get_db
 from app.models.checklist import Checklist
+from app.models.project import Project
+from app.models.segment import Segment
 from app.models.tag import Tag
 from app.models.task import Task, task_assignees, task_tags
 from app.models.user import User
@@ -17,42 +34,144 @@ from app.schemas.task import (
     ChecklistCreate,
     ChecklistResponse,
     ChecklistUpdate,
+    TagBrief,
+    TaskChanges,
     TaskCreate,
+    TaskListNormalised,
     TaskResponse,
+    TaskSearchResult,
+    TaskStatus,
+    TaskSummary,
     TaskUpdate,
 )
-from app.utils.auth import get_current_user
-from app.websocket.events import emit_event
-from app.services.notification_service import notify_task_assigned
-from app.services.activity_service import record_activity
+from app.schemas.user import UserResponse
+from app.utils.auth import get_current_user, get_workspace_task
+from app.utils.etag import is_fresh, not_modified, scope_etag
+from app.utils.serialization import Encoded, encoded_response
+from app.services.activity_service import record_activities, record_activity
+from app.services.domain_events import DomainEvent, publish
 from app.services.recurrence_service import expand_recurrence
-from app.services.webhook_service import deliver_webhooks
-from app.services.email_service import send_task_assigned_email
+from app.services.rank_service import (
+    REBALANCE_LENGTH,
+    append_ranks,
+    key_between,
+    last_ranks,
+    next_rank,
+    rebalance_in_background,
+    rebalance_ranks,
+)
+from app.services.search_service import search_tasks, task_search_filter
+from app.services.task_query_service import (
+    fetch_task_summaries,
+    normalise_tasks,
+    task_list_scopes,
+    task_response_query,
+    task_responses,
+    task_summary_query,
+)
+from app.services.task_sync_service import (
+    cursor_expired,
+    decode_cursor,
+    encode_cursor,
+    fetch_tombstones,
+    record_task_deletion,
+    sync_horizon,
+    touch_tasks,
+)
 
 router = APIRouter(prefix="/workspaces/{workspace_id}/tasks", tags=["tasks"])
 
 
-def _task_to_dict(task) -> dict:
-    """Serialize a Task ORM object to a JSON-safe dict for WS broadcast."""
-    return TaskResponse.model_validate(task).model_dump(mode="json")
+def _task_snapshot(task) -> Encoded:
+    """Validate and encode a task once for its event and the HTTP response."""
+    return Encoded(TaskResponse.model_validate(task))
 
 
-def _task_query(workspace_id: uuid.UUID):
-    return (
-        select(Task)
-        .where(Task.workspace_id == workspace_id)
-        .options(
-            selectinload(Task.assignees),
-            selectinload(Task.tags),
-            selectinload(Task.checklists),
-            selectinload(Task.project),
-            selectinload(Task.subtasks),
+def _publish_task_event(
+    db: AsyncSession,
+    name: str,
+    workspace_id: uuid.UUID,
+    actor: User,
+    payload: dict,
+    new_assignee_ids: tuple[uuid.UUID, ...] = (),
+) -> None:
+    """Queue a task event; broadcasts, webhooks and notifications run after commit."""
+    publish(db, DomainEvent(
+        name=name,
+        workspace_id=workspace_id,
+        payload=payload,
+        actor_id=actor.id,
+        actor_name=actor.name,
+        new_assignee_ids=new_assignee_ids,
+    ))
+
+
+async def _workspace_project(
+    db: AsyncSession,
+    workspace_id: uuid.UUID,
+    project_id: uuid.UUID | None,
+) -> Project | None:
+    if project_id is None:
+        return None
+    project = await db.get(Project, project_id)
+    if not project or project.workspace_id != workspace_id:
+        raise HTTPException(status_code=400, detail="Project not found")
+    return project
+
+
+def _rebalance_if_long(
+    background_tasks: BackgroundTasks,
+    workspace_id: uuid.UUID,
+    project_id: uuid.UUID | None,
+    rank: str | None,
+) -> None:
+    """Re-spread a project's keys after the response once one gets too long."""
+    if rank is not None and len(rank) > REBALANCE_LENGTH:
+        background_tasks.add_task(rebalance_in_background, workspace_id, project_id)
+
+
+async def _check_workspace_links(
+    db: AsyncSession,
+    workspace_id: uuid.UUID,
+    segment_id: uuid.UUID | None,
+    parent_id: uuid.UUID | None,
+) -> None:
+    """400 unless the segment and parent task, where given, are in the workspace."""
+    if segment_id is not None:
+        found = await db.scalar(
+            select(Segment.id)
+            .join(Project, Project.id == Segment.project_id)
+            .where(Segment.id == segment_id, Project.workspace_id == workspace_id)
         )
-    )
+        if found is None:
+            raise HTTPException(status_code=400, detail="Segment not found")
+    if parent_id is not None:
+        found = await db.scalar(select(Task.id).where(Task.id == parent_id, Task.workspace_id == workspace_id))
+        if found is None:
+            raise HTTPException(status_code=400, detail="Parent task not found")
+
+
+async def _workspace_users(db: AsyncSession, workspace_id: uuid.UUID, user_ids: list[uuid.UUID]) -> list[User]:
+    if not user_ids:
+        return []
+    result = await db.execute(select(User).where(User.id.in_(user_ids), User.workspace_id == workspace_id))
+    return list(result.scalars().all())
 
 
-@router.get("", response_model=list[TaskResponse])
+async def _workspace_tags(db: AsyncSession, workspace_id: uuid.UUID, tag_ids: list[uuid.UUID]) -> list[Tag]:
+    if not tag_ids:
+        return []
+    result = await db.execute(
+        select(Tag)
+        .join(Project, Project.id == Tag.project_id)
+        .where(Tag.id.in_(tag_ids), Project.workspace_id == workspace_id)
+    )
+    return list(result.scalars().all())
+
+@router.get("", response_model=list[TaskResponse] | list[TaskSummary] | TaskListNormalised)
 async def list_tasks(
+    request: Request,
+    response: Response,
     workspace_id: uuid.UUID,
     project_id: uuid.UUID | None = None,
     status: str | None = None,
@@ -65,44 +184,68 @@ async def list_tasks(
     filter: str | None = Query(None, description="backlog|timeline"),
     limit: int = Query(500, ge=1, le=2000, description="Max results"),
     offset: int = Query(0, ge=0, description="Offset for pagination"),
+    view: str = Query("full", pattern="^(full|summary)$", description="full|summary"),
+    format: str = Query("list", pattern="^(list|normalised)$", description="list|normalised"),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
-    query = _task_query(workspace_id)
+    if view == "summary" and format == "normalised":
+        raise HTTPException(status_code=400, detail="format=normalised requires view=full")
 
+    criteria = []
     if project_id:
-        query = query.where(Task.project_id == project_id)
+        criteria.append(Task.project_id == project_id)
     if status:
-        query = query.where(Task.status == status)
+        criteria.append(Task.status == status)
     if segment_id:
-        query = query.where(Task.segment_id == segment_id)
+        criteria.append(Task.segment_id == segment_id)
     if since:
-        query = query.where(Task.date_to >= since)
+        criteria.append(Task.date_to >= since)
     if until:
-        query = query.where(Task.date_from <= until)
+        criteria.append(Task.date_from <= until)
     if assignee:
-        query = query.where(Task.assignees.any(User.id == assignee))
+        criteria.append(Task.assignees.any(User.id == assignee))
     if tag_id:
-        query = query.where(Task.tags.any(Tag.id == tag_id))
+        criteria.append(Task.tags.any(Tag.id == tag_id))
     if search:
-        query = query.where(Task.name.ilike(f"%{search}%"))
+        criteria.append(task_search_filter(search))
     if filter == "backlog":
-        query = query.where(Task.date_from.is_(None))
+        criteria.append(Task.date_from.is_(None))
     elif filter == "timeline":
-        query = query.where(Task.date_from.isnot(None))
-
-    query = query.order_by(Task.sort_order, Task.created_at).limit(limit).offset(offset)
+        criteria.append(Task.date_from.isnot(None))
+
+    etag = await scope_etag(db, request, *task_list_scopes(workspace_id, *criteria))
+    if is_fresh(request, etag):
+        return not_modified(etag)
+    response.headers["ETag"] = etag
+
+    query = task_summary_query(workspace_id) if view == "summary" else task_response_query(workspace_id)
+    query = query.where(*criteria)
+    query = query.order_by(Task.rank.asc().nulls_last(), Task.sort_order, Task.created_at)
+    query = query.limit(limit).offset(offset)
+    if view == "summary":
+        return await fetch_task_summaries(db, query)
     result = await db.execute(query)
-    return result.scalars().unique().all()
+    tasks = result.scalars().unique().all()
+    if format == "normalised":
+        return normalise_tasks(tasks)
+    return task_responses(tasks)
 
 
 @router.post("", response_model=TaskResponse, status_code=201)
 async def create_task(
     workspace_id: uuid.UUID,
     data: TaskCreate,
+    background_tasks: BackgroundTasks,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
+    # Build relationships up front so the response needs no re-fetch
+    assignees = await _workspace_users(db, workspace_id, data.assignee_ids)
+    tags = await _workspace_tags(db, workspace_id, data.tag_ids)
+    project = await _workspace_project(db, workspace_id, data.project_id)
+    await _check_workspace_links(db, workspace_id, data.segment_id, data.parent_id)
+
     task = Task(
         name=data.name,
         description=data.description,
@@ -121,61 +264,226 @@ async def create_task(
         segment_id=data.segment_id,
         parent_id=data.parent_id,
         workspace_id=workspace_id,
+        rank=await next_rank(db, workspace_id, data.project_id),
+        project=project,
+        assignees=assignees,
+        tags=tags,
+        checklists=[],
+        subtasks=[],
     )
     db.add(task)
     await db.flush()
 
-    # Assignees — insert directly into join table to avoid lazy-load on new object
-    if data.assignee_ids:
-        for uid in data.assignee_ids:
-            await db.execute(task_assignees.insert().values(task_id=task.id, user_id=uid))
+    await record_activity(
+        db, workspace_id=workspace_id, actor_id=current_user.id,
+        action="created", entity_type="task",
+        entity_id=task.id, entity_name=task.name,
+    )
+    if data.parent_id is not None:
+        await touch_tasks(db, Task.id == data.parent_id)
+    snapshot = _task_snapshot(task)
+    _publish_task_event(
+        db, "task.created", workspace_id, current_user, {"task": snapshot},
+        new_assignee_ids=tuple(a.id for a in task.assignees),
+    )
+    await db.commit()
+    _rebalance_if_long(background_tasks, workspace_id, task.project_id, task.rank)
+    return encoded_response(snapshot, status_code=201)
+
 
-    # Tags
-    if data.tag_ids:
-        for tid in data.tag_ids:
-            await db.execute(task_tags.insert().values(task_id=task.id, tag_id=tid))
+# --- Bulk create ---
 
-    await db.commit()
+class BulkTaskCreate(BaseModel):
+    tasks: list[TaskCreate] = Field(min_length=1, max_length=500)
 
-    # Re-fetch with relationships
-    result = await db.execute(_task_query(workspace_id).where(Task.id == task.id))
-    created_task = result.scalar_one()
 
-    # Record activity
-    await record_activity(
+async def _missing_references(
+    db: AsyncSession,
+    workspace_id: uuid.UUID,
+    items: list[TaskCreate],
+) -> list[dict]:
+    """Check every referenced id against the workspace in one round-trip.
+
+    Errors use FastAPI's validation shape so clients can handle them with the
+    same code path as schema errors.
+    """
+    wanted = {
+        "project_id": {i.project_id for i in items} - {None},
+        "segment_id": {i.segment_id for i in items} - {None},
+        "parent_id": {i.parent_id for i in items} - {None},
+        "assignee_ids": {uid for i in items for uid in i.assignee_ids},
+        "tag_ids": {tid for i in items for tid in i.tag_ids},
+    }
+    lookups = {
+        "project_id": select(Project.id).where(Project.workspace_id == workspace_id),
+        "segment_id": select(Segment.id).join(Project, Project.id == Segment.project_id)
+        .where(Project.workspace_id == workspace_id),
+        "parent_id": select(Task.id).where(Task.workspace_id == workspace_id),
+        "assignee_ids": select(User.id).where(User.workspace_id == workspace_id),
+        "tag_ids": select(Tag.id).join(Project, Project.id == Tag.project_id)
+        .where(Project.workspace_id == workspace_id),
+    }
+    selects = [
+        lookups[field].add_columns(literal(field).label("field")).where(lookups[field].selected_columns[0].in_(ids))
+        for field, ids in wanted.items() if ids
+    ]
+    found: dict[str, set[uuid.UUID]] = {field: set() for field in wanted}
+    if selects:
+        result = await db.execute(union_all(*selects))
+        for found_id, field in result.all():
+            found[field].add(found_id)
+
+    errors = []
+    for index, item in enumerate(items):
+        for field in ("project_id", "segment_id", "parent_id"):
+            value = getattr(item, field)
+            if value is not None and value not in found[field]:
+                errors.append({
+                    "loc": ["body", "tasks", index, field],
+                    "msg": f"{field.removesuffix('_id').capitalize()} not found",
+                    "type": "not_found",
+                })
+        for field in ("assignee_ids", "tag_ids"):
+            for position, value in enumerate(getattr(item, field)):
+                if value not in found[field]:
+                    errors.append({
+                        "loc": ["body", "tasks", index, field, position],
+                        "msg": "User not found" if field == "assignee_ids" else "Tag not found",
+                        "type": "not_found",
+                    })
+    return errors
+
+
+@router.post("/bulk", response_model=list[TaskResponse], status_code=201)
+async def bulk_create_tasks(
+    workspace_id: uuid.UUID,
+    data: BulkTaskCreate,
+    background_tasks: BackgroundTasks,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """Create many tasks in one transaction with batched INSERTs.
+
+    Either every task is created or none is; invalid references are reported
+    per item with a 422.
+    """
+    errors = await _missing_references(db, workspace_id, data.tasks)
+    if errors:
+        raise HTTPException(status_code=422, detail=errors)
+
+    # Append each new task to the end of its project, in request order
+    ranks = await last_ranks(db, workspace_id, {item.project_id for item in data.tasks})
+    # Ids are generated here so the INSERT batches without RETURNING
+    task_ids = [uuid.uuid4() for _ in data.tasks]
+    rows = []
+    for task_id, item in zip(task_ids, data.tasks):
+        ranks[item.project_id] = key_between(ranks[item.project_id], None)
+        rows.append({
+            **item.model_dump(exclude={"assignee_ids", "tag_ids"}),
+            "id": task_id,
+            "workspace_id": workspace_id,
+            "rank": ranks[item.project_id],
+        })
+    await db.execute(insert(Task), rows)
+
+    assignee_links = [
+        {"task_id": tid, "user_id": uid}
+        for tid, item in zip(task_ids, data.tasks) for uid in dict.fromkeys(item.assignee_ids)
+    ]
+    if assignee_links:
+        await db.execute(task_assignees.insert(), assignee_links)
+    tag_links = [
+        {"task_id": tid, "tag_id": tag_id}
+        for tid, item in zip(task_ids, data.tasks) for tag_id in dict.fromkeys(item.tag_ids)
+    ]
+    if tag_links:
+        await db.execute(task_tags.insert(), tag_links)
+    parent_ids = {item.parent_id for item in data.tasks} - {None}
+    if parent_ids:
+        await touch_tasks(db, Task.id.in_(parent_ids))
+
+    await record_activities(
         db, workspace_id=workspace_id, actor_id=current_user.id,
         action="created", entity_type="task",
-        entity_id=created_task.id, entity_name=created_task.name,
+        entities=[(tid, item.name) for tid, item in zip(task_ids, data.tasks)],
     )
+
+    result = await db.execute(task_response_query(workspace_id).where(Task.id.in_(task_ids)))
+    by_id = {task.id: task for task in result.scalars().unique().all()}
+    created_tasks = [by_id[tid] for tid in task_ids]
+
+    # One event for the whole batch
+    snapshots = [_task_snapshot(task) for task in created_tasks]
+    _publish_task_event(db, "tasks.bulk_created", workspace_id, current_user, {"tasks": snapshots})
     await db.commit()
+    for project_id, rank in ranks.items():
+        _rebalance_if_long(background_tasks, workspace_id, project_id, rank)
+    return encoded_response(snapshots, status_code=201)
 
-    # Broadcast task.created event
-    await emit_event(str(workspace_id), "task.created", {
-        "task": _task_to_dict(created_task),
-        "actor_id": str(current_user.id),
-    })
-
-    # Deliver webhooks
-    await deliver_webhooks(db, workspace_id, "task.created", _task_to_dict(created_task))
-
-    # Notify assignees
-    for uid in (data.assignee_ids or []):
-        if uid != current_user.id:
-            await notify_task_assigned(
-                db, workspace_id=workspace_id, task_id=created_task.id,
-                task_name=created_task.name, assignee_id=uid,
-                actor_id=current_user.id, actor_name=current_user.name,
-            )
 
-    # Email assignees
-    for assignee in created_task.assignees:
-        if assignee.id != current_user.id and assignee.email:
-            await asyncio.to_thread(
-                send_task_assigned_email,
-                assignee.email, created_task.name, current_user.name,
-            )
+# --- Search (must be before /{task_id} routes) ---
 
-    return created_task
+@router.get("/search", response_model=list[TaskSearchResult])
+async def search_workspace_tasks(
+    workspace_id: uuid.UUID,
+    q: str = Query(..., min_length=1, description="Search text; each word is prefix-matched"),
+    include_comments: bool = Query(True, description="Also match comment bodies"),
+    limit: int = Query(20, ge=1, le=100),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    return await search_tasks(db, workspace_id, q, limit=limit, include_comments=include_comments)
+
+
+# --- Delta sync (must be before /{task_id} routes) ---
+
+@router.get("/changes", response_model=TaskChanges)
+async def list_task_changes(
+    workspace_id: uuid.UUID,
+    since: str | None = Query(None, description="Cursor from a previous response; omit for a full sync"),
+    view: str = Query("full", pattern="^(full|summary)$", description="full|summary"),
+    limit: int = Query(500, ge=1, le=2000, description="Max changes per page"),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    after = None
+    if since:
+        try:
+            after = decode_cursor(since)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid sync cursor")
+    now = await db.scalar(select(func.now()))
+    if after and cursor_expired(after, now):
+        raise HTTPException(status_code=410, detail="Sync cursor expired, do a full sync")
+
+    query = task_summary_query(workspace_id) if view == "summary" else task_response_query(workspace_id)
+    if after:
+        query = query.where(tuple_(Task.updated_at, Task.id) > tuple_(*after))
+    query = query.order_by(Task.updated_at, Task.id).limit(limit + 1)
+
+    if view == "summary":
+        rows = await fetch_task_summaries(db, query)
+        changed = [(row["updated_at"], row["id"], False, row) for row in rows]
+    else:
+        result = await db.execute(query)
+        changed = [(t.updated_at, t.id, False, t) for t in result.scalars().unique().all()]
+    tombstones = await fetch_tombstones(db, workspace_id, after, limit + 1)
+    changed += [(t.deleted_at, t.task_id, True, t) for t in tombstones]
+
+    # Merge edits and deletions in cursor order, then cut one page
+    changed.sort(key=lambda change: change[:2])
+    page = changed[:limit]
+    has_more = len(changed) > limit
+    position = page[-1][:2] if page else after
+    if position and not has_more:
+        # Hold the last cursor back so late commits are picked up next time
+        position = min(position, sync_horizon(now))
+    return TaskChanges(
+        tasks=[item for _, _, deleted, item in page if not deleted],
+        deleted=[item for _, _, deleted, item in page if deleted],
+        cursor=encode_cursor(*position) if position else None,
+        has_more=has_more,
+    )
 
 
 # --- Reorder (must be before /{task_id} routes) ---
@@ -189,31 +497,152 @@ class ReorderRequest(BaseModel):
     items: list[ReorderItem]
 
 
-@router.put("/reorder", response_model=list[TaskResponse])
+class ReorderedTask(ReorderItem):
+    rank: str
+
+
+@router.put("/reorder", response_model=list[ReorderedTask])
 async def reorder_tasks(
     workspace_id: uuid.UUID,
     data: ReorderRequest,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
-    task_ids = [item.id for item in data.items]
-    order_map = {item.id: item.sort_order for item in data.items}
+    if not data.items:
+        return []
 
     result = await db.execute(
-        _task_query(workspace_id).where(Task.id.in_(task_ids))
+        select(Task.id, Task.project_id, Task.rank)
+        .where(Task.workspace_id == workspace_id, Task.id.in_([item.id for item in data.items]))
+    )
+    by_project: dict[uuid.UUID | None, dict[uuid.UUID, str | None]] = {}
+    for row in result.all():
+        by_project.setdefault(row.project_id, {})[row.id] = row.rank
+
+    # The tasks trade the keys they already hold, so a partial list reorders
+    # among its own positions and leaves every other task where it was.
+    # Unranked or tied keys have no slot to trade; spread the project first.
+    ordered = sorted({item.id: item for item in data.items}.values(), key=lambda item: item.sort_order)
+    new_ranks: dict[uuid.UUID, str] = {}
+    for project_id, ranks in by_project.items():
+        if None in ranks.values() or len(set(ranks.values())) < len(ranks):
+            spread = await rebalance_ranks(db, workspace_id, project_id)
+            ranks = {task_id: spread[task_id] for task_id in ranks}
+        slots = sorted(ranks.values())
+        new_ranks.update(zip((item.id for item in ordered if item.id in ranks), slots))
+    if not new_ranks:
+        return []
+
+    # Apply the whole (id, sort_order, rank) list in one UPDATE ... FROM (VALUES ...)
+    new_order = values(
+        column("id", PG_UUID(as_uuid=True)),
+        column("sort_order", Integer),
+        column("rank", String),
+        name="new_order",
+    ).data([(item.id, item.sort_order, new_ranks[item.id]) for item in ordered if item.id in new_ranks])
+    result = await db.execute(
+        update(Task)
+        .where(Task.id == new_order.c.id, Task.workspace_id == workspace_id)
+        .values(sort_order=new_order.c.sort_order, rank=new_order.c.rank)
+        .returning(Task.id, Task.sort_order, Task.rank)
+        .execution_options(synchronize_session=False)
     )
-    tasks = list(result.scalars().unique().all())
+    items = sorted(
+        (ReorderedTask(id=row.id, sort_order=row.sort_order, rank=row.rank) for row in result.all()),
+        key=lambda item: item.rank,
+    )
+    # Parents embed their subtasks' sort_order, so they count as changed too
+    moved = bindparam("moved_ids", [item.id for item in items], type_=ARRAY(PG_UUID(as_uuid=True)))
+    parents = select(Task.parent_id).where(Task.id == any_(moved), Task.parent_id.isnot(None))
+    await db.execute(update(Task).where(Task.id.in_(parents)).values(updated_at=func.now()))
+    _publish_task_event(
+        db, "tasks.reordered", workspace_id, current_user,
+        {"items": [item.model_dump(mode="json") for item in items]},
+    )
+    await db.commit()
+    return items
 
-    for task in tasks:
-        if task.id in order_map:
-            task.sort_order = order_map[task.id]
 
-    await db.commit()
+# --- Move ---
+
+class TaskMove(BaseModel):
+    after_id: uuid.UUID | None = None  # task directly above the new position
+    before_id: uuid.UUID | None = None  # task directly below the new position
+    status: TaskStatus | None = None
+
+
+class TaskMoveResult(BaseModel):
+    id: uuid.UUID
+    rank: str
+    status: str
+    updated_at: datetime
+
 
+@router.post("/{task_id}/move", response_model=TaskMoveResult)
+async def move_task(
+    workspace_id: uuid.UUID,
+    task_id: uuid.UUID,
+    data: TaskMove,
+    background_tasks: BackgroundTasks,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """Place a task between two neighbours, writing only the moved row."""
+    wanted = {task_id, data.after_id, data.before_id} - {None}
+    result = await db.execute(
+        select(Task.id, Task.project_id, Task.parent_id, Task.rank)
+        .where(Task.workspace_id == workspace_id, Task.id.in_(wanted))
+    )
+    rows = {row.id: row for row in result.all()}
+    task = rows.get(task_id)
+    if not task:
+        raise HTTPException(status_code=404, detail="Task not found")
+    if wanted - rows.keys():
+        raise HTTPException(status_code=400, detail="Neighbour task not found")
+    if task_id in (data.after_id, data.before_id):
+        raise HTTPException(status_code=400, detail="A task cannot be its own neighbour")
+    # Keys are only ordered within a project
+    if any(row.project_id != task.project_id for row in rows.values()):
+        raise HTTPException(status_code=400, detail="Neighbour task is in another project")
+
+    ranks = {row_id: row.rank for row_id, row in rows.items()}
+    after = ranks.get(data.after_id)
+    before = ranks.get(data.before_id)
+    if not data.after_id and not data.before_id:
+        rank = await next_rank(db, workspace_id, task.project_id)
+    else:
+        # Unranked neighbours or keys out of order need a fresh spread first
+        if (
+            (data.after_id and after is None)
+            or (data.before_id and before is None)
+            or (after is not None and before is not None and after >= before)
+        ):
+            ranks = await rebalance_ranks(db, workspace_id, task.project_id)
+            after = ranks.get(data.after_id)
+            before = ranks.get(data.before_id)
+        try:
+            rank = key_between(after, before)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="after_id must be above before_id")
+
+    changes = {"rank": rank}
+    if data.status is not None:
+        changes["status"] = data.status
     result = await db.execute(
-        _task_query(workspace_id).where(Task.id.in_(task_ids)).order_by(Task.sort_order)
+        update(Task)
+        .where(Task.id == task_id)
+        .values(**changes)
+        .returning(Task.id, Task.rank, Task.status, Task.updated_at)
+        .execution_options(synchronize_session=False)
     )
-    return list(result.scalars().unique().all())
+    moved = TaskMoveResult.model_validate(result.one(), from_attributes=True)
+    if task.parent_id is not None:
+        await touch_tasks(db, Task.id == task.parent_id)
+    _publish_task_event(db, "task.moved", workspace_id, current_user, moved.model_dump(mode="json"))
+    await db.commit()
+
+    _rebalance_if_long(background_tasks, workspace_id, task.project_id, rank)
+    return moved
 
 
 @router.get("/{task_id}", response_model=TaskResponse)
@@ -224,7 +653,7 @@ async def get_task(
     db: AsyncSession = Depends(get_db),
 ):
     result = await db.execute(
-        _task_query(workspace_id).where(Task.id == task_id)
+        task_response_query(workspace_id).where(Task.id == task_id)
     )
     task = result.scalar_one_or_none()
     if not task:
@@ -237,11 +666,12 @@ async def update_task(
     workspace_id: uuid.UUID,
     task_id: uuid.UUID,
     data: TaskUpdate,
+    background_tasks: BackgroundTasks,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     result = await db.execute(
-        _task_query(workspace_id).where(Task.id == task_id)
+        task_response_query(workspace_id).where(Task.id == task_id)
     )
     task = result.scalar_one_or_none()
     if not task:
@@ -249,31 +679,37 @@ async def update_task(
 
     update_data = data.model_dump(exclude_unset=True)
 
+    # Track previous values for the notification diff and parent touch
+    prev_assignee_ids = {a.id for a in task.assignees}
+    prev_parent_id = task.parent_id
+
     # Handle assignees separately
     assignee_ids = update_data.pop("assignee_ids", None)
     if assignee_ids is not None:
-        users = await db.execute(select(User).where(User.id.in_(assignee_ids)))
-        task.assignees = list(users.scalars().all())
+        task.assignees = await _workspace_users(db, workspace_id, assignee_ids)
 
     # Handle tags separately
     tag_ids = update_data.pop("tag_ids", None)
     if tag_ids is not None:
-        tags = await db.execute(select(Tag).where(Tag.id.in_(tag_ids)))
-        task.tags = list(tags.scalars().all())
+        task.tags = await _workspace_tags(db, workspace_id, tag_ids)
 
-    # Track previous assignee IDs for notification diff
-    prev_assignee_ids = {a.id for a in task.assignees}
+    if "project_id" in update_data and update_data["project_id"] != task.project_id:
+        # Keep the embedded project brief in step with the new id, and move
+        # the task to the end of the new project's key space
+        task.project = await _workspace_project(db, workspace_id, update_data["project_id"])
+        task.rank = await next_rank(db, workspace_id, update_data["project_id"])
+    await _check_workspace_links(db, workspace_id, update_data.get("segment_id"), update_data.get("parent_id"))
 
     for field, value in update_data.items():
         setattr(task, field, value)
 
-    await db.commit()
-
-    # Re-fetch
-    result = await db.execute(_task_query(workspace_id).where(Task.id == task_id))
-    updated_task = result.scalar_one()
+    if assignee_ids is not None or tag_ids is not None:
+        task.updated_at = func.now()
+    if update_data.keys() & {"name", "status", "sort_order", "parent_id"}:
+        parent_ids = {prev_parent_id, task.parent_id} - {None}
+        if parent_ids:
+            await touch_tasks(db, Task.id.in_(parent_ids))
 
-    # Record activity
     changes = list(update_data.keys())
     if assignee_ids is not None:
         changes.append("assignees")
@@ -283,56 +719,43 @@ async def update_task(
         await record_activity(
             db, workspace_id=workspace_id, actor_id=current_user.id,
             action="updated", entity_type="task",
-            entity_id=updated_task.id, entity_name=updated_task.name,
+            entity_id=task.id, entity_name=task.name,
             details={"fields": changes},
         )
-        await db.commit()
-
-    # Broadcast task.updated event
-    await emit_event(str(workspace_id), "task.updated", {
-        "task": _task_to_dict(updated_task),
-        "actor_id": str(current_user.id),
-    })
-
-    # Deliver webhooks
-    await deliver_webhooks(db, workspace_id, "task.updated", _task_to_dict(updated_task))
-
-    # Notify newly assigned users
-    if assignee_ids is not None:
-        new_ids = set(assignee_ids) - prev_assignee_ids
-        for uid in new_ids:
-            if uid != current_user.id:
-                await notify_task_assigned(
-                    db, workspace_id=workspace_id, task_id=updated_task.id,
-                    task_name=updated_task.name, assignee_id=uid,
-                    actor_id=current_user.id, actor_name=current_user.name,
-                )
-        # Email newly assigned
-        for assignee in updated_task.assignees:
-            if assignee.id in new_ids and assignee.id != current_user.id and assignee.email:
-                await asyncio.to_thread(
-                    send_task_assigned_email,
-                    assignee.email, updated_task.name, current_user.name,
-                )
 
     # Recurring task: create next occurrence when marked done
-    if (
-        update_data.get("status") == "done"
-        and updated_task.is_recurring
-        and updated_task.recurrence_rule
-    ):
-        await _create_next_recurrence(db, updated_task, workspace_id, current_user)
+    next_task = None
+    if update_data.get("status") == "done" and task.is_recurring and task.recurrence_rule:
+        next_task = await _add_next_recurrence(db, task, workspace_id)
 
-    return updated_task
+    # One commit for the change, its activity, any next occurrence and the
+    # queued events. Flushing first refreshes updated_at via RETURNING, so
+    # the snapshot taken here is also the response.
+    await db.flush()
+    snapshot = _task_snapshot(task)
+    _publish_task_event(
+        db, "task.updated", workspace_id, current_user, {"task": snapshot},
+        new_assignee_ids=tuple({a.id for a in task.assignees} - prev_assignee_ids)
+        if assignee_ids is not None else (),
+    )
+    if next_task is not None:
+        _publish_task_event(db, "task.created", workspace_id, current_user, {"task": _task_snapshot(next_task)})
+    await db.commit()
+    _rebalance_if_long(background_tasks, workspace_id, task.project_id, task.rank)
+    if next_task is not None:
+        _rebalance_if_long(background_tasks, workspace_id, next_task.project_id, next_task.rank)
+    return encoded_response(snapshot)
 
 
-async def _create_next_recurrence(
+async def _add_next_recurrence(
     db: AsyncSession,
     task: Task,
     workspace_id: uuid.UUID,
-    actor: User,
-):
-    """Create the next occurrence of a recurring task."""
+) -> Task | None:
+    """Add the next occurrence of a recurring task to the session.
+
+    The caller commits it together with the triggering update.
+    """
     task_start = task.date_from or date.today()
     duration_days = 0
     if task.date_from and task.date_to:
@@ -351,7 +774,7 @@ async def _create_next_recurrence(
     ))
 
     if not next_dates:
-        return
+        return None
 
     next_from, next_to = next_dates[0]
 
@@ -371,31 +794,15 @@ async def _create_next_recurrence(
         project_id=task.project_id,
         segment_id=task.segment_id,
         workspace_id=workspace_id,
+        rank=await next_rank(db, workspace_id, task.project_id),
+        project=task.project,
+        assignees=list(task.assignees),
+        tags=list(task.tags),
+        checklists=[],
+        subtasks=[],
     )
     db.add(new_task)
-    await db.flush()
-
-    # Copy assignees
-    for assignee in task.assignees:
-        await db.execute(task_assignees.insert().values(task_id=new_task.id, user_id=assignee.id))
-
-    # Copy tags
-    for tag in task.tags:
-        await db.execute(task_tags.insert().values(task_id=new_task.id, tag_id=tag.id))
-
-    await db.commit()
-
-    # Re-fetch with relationships
-    result = await db.execute(_task_query(workspace_id).where(Task.id == new_task.id))
-    created_task = result.scalar_one()
-
-    await emit_event(str(workspace_id), "task.created", {
-        "task": _task_to_dict(created_task),
-        "actor_id": str(actor.id),
-    })
-
-    # Deliver webhooks
-    await deliver_webhooks(db, workspace_id, "task.created", _task_to_dict(created_task))
+    return new_task
 
 
 @router.delete("/{task_id}", status_code=204)
@@ -418,20 +825,16 @@ async def delete_task(
         action="deleted", entity_type="task",
         entity_id=task_id, entity_name=task_name,
     )
+    await record_task_deletion(db, workspace_id, task_id)
+    if task.parent_id is not None:
+        await touch_tasks(db, Task.id == task.parent_id)
     await db.delete(task)
+    _publish_task_event(
+        db, "task.deleted", workspace_id, current_user,
+        {"task_id": str(task_id), "task_name": task_name},
+    )
     await db.commit()
 
-    # Broadcast task.deleted event
-    await emit_event(str(workspace_id), "task.deleted", {
-        "task_id": str(task_id),
-        "actor_id": str(current_user.id),
-    })
-
-    # Deliver webhooks
-    await deliver_webhooks(db, workspace_id, "task.deleted", {
-        "task_id": str(task_id), "task_name": task_name,
-    })
-
 
 # --- Duplicate ---
 
@@ -439,11 +842,12 @@ async def delete_task(
 async def duplicate_task(
     workspace_id: uuid.UUID,
     task_id: uuid.UUID,
+    background_tasks: BackgroundTasks,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     result = await db.execute(
-        _task_query(workspace_id).where(Task.id == task_id)
+        task_response_query(workspace_id).where(Task.id == task_id)
     )
     original = result.scalar_one_or_none()
     if not original:
@@ -464,102 +868,137 @@ async def duplicate_task(
         project_id=original.project_id,
         segment_id=original.segment_id,
         workspace_id=workspace_id,
+        rank=await next_rank(db, workspace_id, original.project_id),
+        project=original.project,
+        assignees=list(original.assignees),
+        tags=list(original.tags),
+        checklists=[
+            Checklist(title=item.title, sort_order=item.sort_order)
+            for item in original.checklists
+        ],
+        subtasks=[],
     )
     db.add(clone)
     await db.flush()
-
-    # Copy assignees
-    for assignee in original.assignees:
-        await db.execute(task_assignees.insert().values(task_id=clone.id, user_id=assignee.id))
-
-    # Copy tags
-    for tag in original.tags:
-        await db.execute(task_tags.insert().values(task_id=clone.id, tag_id=tag.id))
-
-    # Copy checklists
-    for item in original.checklists:
-        new_item = Checklist(title=item.title, task_id=clone.id, sort_order=item.sort_order)
-        db.add(new_item)
-
+    snapshot = _task_snapshot(clone)
+    _publish_task_event(db, "task.created", workspace_id, current_user, {"task": snapshot})
     await db.commit()
+    _rebalance_if_long(background_tasks, workspace_id, clone.project_id, clone.rank)
+    return encoded_response(snapshot, status_code=201)
 
-    # Re-fetch with relationships
-    result = await db.execute(_task_query(workspace_id).where(Task.id == clone.id))
-    created_task = result.scalar_one()
 
-    await emit_event(str(workspace_id), "task.created", {
-        "task": _task_to_dict(created_task),
-        "actor_id": str(current_user.id),
-    })
-
-    # Deliver webhooks
-    await deliver_webhooks(db, workspace_id, "task.created", _task_to_dict(created_task))
+# --- Bulk update ---
 
-    return created_task
+class BulkTaskUpdate(TaskUpdate):
+    task_ids: list[uuid.UUID]
 
 
-# --- Bulk update ---
+class BulkTaskUpdateResult(BaseModel):
+    """What changed, once — the same values apply to every task in ``task_ids``."""
 
-class BulkTaskUpdate(TaskUpdate):
     task_ids: list[uuid.UUID]
+    changes: dict[str, Any] = {}
+    assignees: list[UserResponse] | None = None
+    tags: list[TagBrief] | None = None
+    updated_at: datetime | None = None
 
 
-@router.put("", response_model=list[TaskResponse])
+@router.put("", response_model=BulkTaskUpdateResult)
 async def bulk_update_tasks(
     workspace_id: uuid.UUID,
     data: BulkTaskUpdate,
+    background_tasks: BackgroundTasks,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
-    result = await db.execute(
-        _task_query(workspace_id).where(Task.id.in_(data.task_ids))
-    )
-    tasks = list(result.scalars().unique().all())
-
     update_data = data.model_dump(exclude_unset=True, exclude={"task_ids"})
-
     assignee_ids = update_data.pop("assignee_ids", None)
     tag_ids = update_data.pop("tag_ids", None)
+    ids = bindparam("task_ids", data.task_ids, type_=ARRAY(PG_UUID(as_uuid=True)))
+    await _workspace_project(db, workspace_id, update_data.get("project_id"))
+    await _check_workspace_links(db, workspace_id, update_data.get("segment_id"), update_data.get("parent_id"))
+
+    # Tasks changing project join the end of the new one, in their old order
+    new_ranks = {}
+    if "project_id" in update_data:
+        project_id = update_data["project_id"]
+        result = await db.execute(
+            select(Task.id)
+            .where(
+                Task.workspace_id == workspace_id,
+                Task.id == any_(ids),
+                Task.project_id.is_distinct_from(project_id),
+            )
+            .order_by(Task.rank.asc().nulls_last(), Task.sort_order, Task.created_at)
+        )
+        new_ranks = await append_ranks(db, workspace_id, project_id, list(result.scalars().all()))
 
-    users_list = None
-    if assignee_ids is not None:
-        users = await db.execute(select(User).where(User.id.in_(assignee_ids)))
-        users_list = list(users.scalars().all())
+    # One UPDATE for the scalar fields; it also bumps updated_at when only
+    # relationships change and filters out ids from other workspaces.
+    result = await db.execute(
+        update(Task)
+        .where(Task.workspace_id == workspace_id, Task.id == any_(ids))
+        .values(**update_data, updated_at=func.now())
+        .returning(Task.id, Task.updated_at)
+        .execution_options(synchronize_session=False)
+    )
+    rows = result.all()
+    if not rows:
+        return BulkTaskUpdateResult(task_ids=[])
+    task_ids = [row.id for row in rows]
+    matched = bindparam("matched_ids", task_ids, type_=ARRAY(PG_UUID(as_uuid=True)))
 
-    tags_list = None
-    if tag_ids is not None:
-        tags = await db.execute(select(Tag).where(Tag.id.in_(tag_ids)))
-        tags_list = list(tags.scalars().all())
+    if update_data.keys() & {"name", "status", "sort_order", "parent_id"}:
+        parents = select(Task.parent_id).where(Task.id == any_(matched), Task.parent_id.isnot(None))
+        await db.execute(update(Task).where(Task.id.in_(parents)).values(updated_at=func.now()))
 
-    for task in tasks:
-        if users_list is not None:
-            task.assignees = users_list
-        if tags_list is not None:
-            task.tags = tags_list
-        for field, value in update_data.items():
-            setattr(task, field, value)
+    assignees = None
+    if assignee_ids is not None:
+        await db.execute(delete(task_assignees).where(task_assignees.c.task_id == any_(matched)))
+        assignees = await _workspace_users(db, workspace_id, assignee_ids)
+        if assignees:
+            await db.execute(
+                task_assignees.insert(),
+                [{"task_id": tid, "user_id": u.id} for tid in task_ids for u in assignees],
+            )
 
-    await db.commit()
+    tags = None
+    if tag_ids is not None:
+        await db.execute(delete(task_tags).where(task_tags.c.task_id == any_(matched)))
+        tags = await _workspace_tags(db, workspace_id, tag_ids)
+        if tags:
+            await db.execute(
+                task_tags.insert(),
+                [{"task_id": tid, "tag_id": t.id} for tid in task_ids for t in tags],
+            )
 
-    result = await db.execute(
-        _task_query(workspace_id).where(Task.id.in_(data.task_ids))
+    response = BulkTaskUpdateResult(
+        task_ids=task_ids,
+        changes=update_data,
+        assignees=assignees,
+        tags=tags,
+        updated_at=rows[0].updated_at,
     )
-    updated_tasks = list(result.scalars().unique().all())
-
-    # Broadcast each updated task
-    for t in updated_tasks:
-        await emit_event(str(workspace_id), "task.updated", {
-            "task": _task_to_dict(t),
-            "actor_id": str(current_user.id),
-        })
-        await deliver_webhooks(db, workspace_id, "task.updated", _task_to_dict(t))
-
-    return updated_tasks
+    # One event for the whole batch instead of one per task
+    _publish_task_event(db, "tasks.bulk_updated", workspace_id, current_user, response.model_dump(mode="json"))
+    if new_ranks:
+        _publish_task_event(
+            db, "tasks.reordered", workspace_id, current_user,
+            {"items": [{"id": str(task_id), "rank": rank} for task_id, rank in new_ranks.items()]},
+        )
+    await db.commit()
+    if new_ranks:
+        _rebalance_if_long(background_tasks, workspace_id, update_data["project_id"], max(new_ranks.values(), key=len))
+    return response
 
 
 # --- Checklists ---
 
-@router.get("/{task_id}/checklists", response_model=list[ChecklistResponse])
+@router.get(
+    "/{task_id}/checklists",
+    response_model=list[ChecklistResponse],
+    dependencies=[Depends(get_workspace_task)],
+)
 async def list_checklists(
     workspace_id: uuid.UUID,
     task_id: uuid.UUID,
@@ -572,7 +1011,12 @@ async def list_checklists(
     return result.scalars().all()
 
 
-@router.post("/{task_id}/checklists", response_model=ChecklistResponse, status_code=201)
+@router.post(
+    "/{task_id}/checklists",
+    response_model=ChecklistResponse,
+    status_code=201,
+    dependencies=[Depends(get_workspace_task)],
+)
 async def create_checklist(
     workspace_id: uuid.UUID,
     task_id: uuid.UUID,
@@ -589,12 +1033,17 @@ async def create_checklist(
 
     item = Checklist(title=data.title, task_id=task_id, sort_order=sort_order)
     db.add(item)
+    await touch_tasks(db, Task.id == task_id)
     await db.commit()
     await db.refresh(item)
     return item
 
 
-@router.put("/{task_id}/checklists/{checklist_id}", response_model=ChecklistResponse)
+@router.put(
+    "/{task_id}/checklists/{checklist_id}",
+    response_model=ChecklistResponse,
+    dependencies=[Depends(get_workspace_task)],
+)
 async def update_checklist(
     workspace_id: uuid.UUID,
     task_id: uuid.UUID,
@@ -613,12 +1062,17 @@ async def update_checklist(
     for field, value in data.model_dump(exclude_unset=True).items():
         setattr(item, field, value)
 
+    await touch_tasks(db, Task.id == task_id)
     await db.commit()
     await db.refresh(item)
     return item
 
 
-@router.delete("/{task_id}/checklists/{checklist_id}", status_code=204)
+@router.delete(
+    "/{task_id}/checklists/{checklist_id}",
+    status_code=204,
+    dependencies=[Depends(get_workspace_task)],
+)
 async def delete_checklist(
     workspace_id: uuid.UUID,
     task_id: uuid.UUID,
@@ -634,4 +1088,5 @@ async def delete_checklist(
         raise HTTPException(status_code=404, detail="Checklist item not found")
 
     await db.delete(item)
+    await touch_tasks(db, Task.id == task_id)
     await db.commit()
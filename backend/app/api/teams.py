@@ -9,12 +9,14 @@ from app.models.team import Team, team_members
 from app.models.user import User
 from app.schemas.team import TeamCreate, TeamMemberAdd, TeamResponse, TeamUpdate
 from app.schemas.user import UserResponse
+from app.services.response_cache import cached_response, invalidate_tags
 from app.utils.auth import get_current_user
 
 router = APIRouter(prefix="/workspaces/{workspace_id}/teams", tags=["teams"])
 
 
 @router.get("", response_model=list[TeamResponse])
+@cached_response(list[TeamResponse], "workspace:{workspace_id}:teams", "workspace:{workspace_id}:members")
 async def list_teams(
     workspace_id: uuid.UUID,
     current_user: User = Depends(get_current_user),
@@ -36,6 +38,7 @@ async def create_team(
     team = Team(name=data.name, workspace_id=workspace_id)
     db.add(team)
     await db.commit()
+    await invalidate_tags(f"workspace:{workspace_id}:teams")
     await db.refresh(team)
     return team
 
@@ -75,6 +78,7 @@ async def update_team(
         setattr(team, field, value)
 
     await db.commit()
+    await invalidate_tags(f"workspace:{workspace_id}:teams")
     await db.refresh(team)
     return team
 
@@ -95,6 +99,7 @@ async def delete_team(
 
     await db.delete(team)
     await db.commit()
+    await invalidate_tags(f"workspace:{workspace_id}:teams")
 
 
 @router.post("/{team_id}/members", response_model=TeamResponse)
@@ -112,7 +117,7 @@ async def add_member(
     if not team:
         raise HTTPException(status_code=404, detail="Team not found")
 
-    user_result = await db.execute(select(User).where(User.id == data.user_id))
+    user_result = await db.execute(select(User).where(User.id == data.user_id, User.workspace_id == workspace_id))
     user = user_result.scalar_one_or_none()
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
@@ -120,6 +125,7 @@ async def add_member(
     if user not in team.members:
         team.members.append(user)
         await db.commit()
+        await invalidate_tags(f"workspace:{workspace_id}:teams")
         await db.refresh(team)
 
     return team
@@ -140,8 +146,9 @@ async def remove_member(
     if not team:
         raise HTTPException(status_code=404, detail="Team not found")
 
-    user_result = await db.execute(select(User).where(User.id == user_id))
+    user_result = await db.execute(select(User).where(User.id == user_id, User.workspace_id == workspace_id))
     user = user_result.scalar_one_or_none()
     if user and user in team.members:
         team.members.remove(user)
         await db.commit()
+        await invalidate_tags(f"workspace:{workspace_id}:teams")
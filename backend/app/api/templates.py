@@ -12,6 +12,7 @@ from app.schemas.task_template import (
     TaskTemplateResponse,
     TaskTemplateUpdate,
 )
+from app.services.response_cache import cached_response, invalidate_tags
 from app.utils.auth import get_current_user
 
 router = APIRouter(
@@ -21,6 +22,7 @@ router = APIRouter(
 
 
 @router.get("", response_model=list[TaskTemplateResponse])
+@cached_response(list[TaskTemplateResponse], "workspace:{workspace_id}:templates")
 async def list_templates(
     workspace_id: uuid.UUID,
     current_user: User = Depends(get_current_user),
@@ -53,6 +55,7 @@ async def create_template(
     )
     db.add(template)
     await db.commit()
+    await invalidate_tags(f"workspace:{workspace_id}:templates")
     await db.refresh(template)
     return template
 
@@ -77,6 +80,7 @@ async def update_template(
     for k, v in data.model_dump(exclude_unset=True).items():
         setattr(template, k, v)
     await db.commit()
+    await invalidate_tags(f"workspace:{workspace_id}:templates")
     await db.refresh(template)
     return template
 
@@ -99,3 +103,4 @@ async def delete_template(
         raise HTTPException(status_code=404, detail="Template not found")
     await db.delete(template)
     await db.commit()
+    await invalidate_tags(f"workspace:{workspace_id}:templates")
@@ -1,56 +1,74 @@
 import uuid
 from datetime import date
 
-from fastapi import APIRouter, Depends, Query
-from sqlalchemy import select
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
 from app.database import get_db
 from app.models.task import Task
 from app.models.user import User
-from app.schemas.task import TaskResponse
+from app.schemas.task import TaskListNormalised, TaskResponse, TaskSummary
+from app.services.task_query_service import (
+    fetch_task_summaries,
+    normalise_tasks,
+    task_list_scopes,
+    task_response_query,
+    task_responses,
+    task_summary_query,
+)
 from app.utils.auth import get_current_user
+from app.utils.etag import is_fresh, not_modified, scope_etag
 
 router = APIRouter(prefix="/workspaces/{workspace_id}/timeline", tags=["timeline"])
 
 
-@router.get("", response_model=list[TaskResponse])
+@router.get("", response_model=list[TaskResponse] | list[TaskSummary] | TaskListNormalised)
 async def get_timeline(
+    request: Request,
+    response: Response,
     workspace_id: uuid.UUID,
     since: date = Query(..., description="Tasks ending after this date"),
     until: date = Query(..., description="Tasks starting before this date"),
     users: str | None = Query(None, description="Comma-separated user UUIDs"),
     project: uuid.UUID | None = None,
+    view: str = Query("full", pattern="^(full|summary)$", description="full|summary"),
+    format: str = Query("list", pattern="^(list|normalised)$", description="list|normalised"),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
-    query = (
-        select(Task)
-        .where(
-            Task.workspace_id == workspace_id,
-            Task.date_from.isnot(None),
-            Task.date_to.isnot(None),
-            Task.date_to >= since,
-            Task.date_from <= until,
-        )
-        .options(
-            selectinload(Task.assignees),
-            selectinload(Task.project),
-            selectinload(Task.tags),
-            selectinload(Task.checklists),
-            selectinload(Task.subtasks),
-        )
-    )
+    if view == "summary" and format == "normalised":
+        raise HTTPException(status_code=400, detail="format=normalised requires view=full")
+
+    criteria = [
+        Task.date_from.isnot(None),
+        Task.date_to.isnot(None),
+        Task.date_to >= since,
+        Task.date_from <= until,
+    ]
 
     if users:
         user_ids = [uuid.UUID(u.strip()) for u in users.split(",") if u.strip()]
         if user_ids:
-            query = query.where(Task.assignees.any(User.id.in_(user_ids)))
+            criteria.append(Task.assignees.any(User.id.in_(user_ids)))
 
     if project:
-        query = query.where(Task.project_id == project)
+        criteria.append(Task.project_id == project)
+
+    etag = await scope_etag(db, request, *task_list_scopes(workspace_id, *criteria))
+    if is_fresh(request, etag):
+        return not_modified(etag)
+    response.headers["ETag"] = etag
 
+    if view == "summary":
+        query = task_summary_query(workspace_id)
+    else:
+        query = task_response_query(workspace_id)
+    query = query.where(*criteria)
     query = query.order_by(Task.date_from)
+    if view == "summary":
+        return await fetch_task_summaries(db, query)
     result = await db.execute(query)
-    return result.scalars().unique().all()
+    tasks = result.scalars().unique().all()
+    if format == "normalised":
+        return normalise_tasks(tasks)
+    return task_responses(tasks)
@@ -7,8 +7,12 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
+from app.models.task import Task, task_assignees
 from app.models.user import User
 from app.schemas.user import UserResponse, UserUpdate
+from app.services.principal_cache import invalidate_principals
+from app.services.response_cache import cached_response, invalidate_tags
+from app.services.task_sync_service import touch_tasks
 from app.utils.auth import get_current_user, hash_password
 
 router = APIRouter(prefix="/workspaces/{workspace_id}/members", tags=["members"])
@@ -26,6 +30,7 @@ class InviteResponse(BaseModel):
 
 
 @router.get("", response_model=list[UserResponse])
+@cached_response(list[UserResponse], "workspace:{workspace_id}:members")
 async def list_members(
     workspace_id: uuid.UUID,
     current_user: User = Depends(get_current_user),
@@ -87,6 +92,8 @@ async def update_member(
         setattr(user, field, value)
 
     await db.commit()
+    await invalidate_principals(user.id)
+    await invalidate_tags(f"workspace:{workspace_id}:members")
     await db.refresh(user)
     return user
 
@@ -113,13 +120,14 @@ async def invite_member(
     user = User(
         name=data.name,
         email=data.email,
-        password_hash=hash_password(temp_password),
+        password_hash=await hash_password(temp_password),
         initials=initials,
         role=data.role,
         workspace_id=workspace_id,
     )
     db.add(user)
     await db.commit()
+    await invalidate_tags(f"workspace:{workspace_id}:members")
     await db.refresh(user)
 
     return InviteResponse(user=UserResponse.model_validate(user), temp_password=temp_password)
@@ -145,5 +153,10 @@ async def remove_member(
     if not user:
         raise HTTPException(status_code=404, detail="Member not found")
 
+    # Their assignments cascade away without touching the tasks
+    assigned = select(task_assignees.c.task_id).where(task_assignees.c.user_id == user_id)
+    await touch_tasks(db, Task.id.in_(assigned))
     await db.delete(user)
     await db.commit()
+    await invalidate_principals(user_id)
+    await invalidate_tags(f"workspace:{workspace_id}:members")
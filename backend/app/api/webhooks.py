@@ -110,7 +110,8 @@ async def list_webhook_logs(
 ):
     result = await db.execute(
         select(WebhookLog)
-        .where(WebhookLog.webhook_id == webhook_id)
+        .join(Webhook, Webhook.id == WebhookLog.webhook_id)
+        .where(WebhookLog.webhook_id == webhook_id, Webhook.workspace_id == workspace_id)
         .order_by(WebhookLog.created_at.desc())
         .limit(limit)
     )
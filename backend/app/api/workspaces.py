@@ -1,14 +1,30 @@
 import uuid
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
+from app.models.client import Client
+from app.models.custom_field import CustomField
+from app.models.milestone import Milestone
+from app.models.project import Project
+from app.models.tag import Tag
+from app.models.task_template import TaskTemplate
+from app.models.team import Team
 from app.models.user import User
 from app.models.workspace import Workspace
-from app.schemas.workspace import WorkspaceCreate, WorkspaceResponse, WorkspaceUpdate
-from app.utils.auth import get_current_user
+from app.schemas.workspace import (
+    WorkspaceBootstrap,
+    WorkspaceCreate,
+    WorkspaceReferenceData,
+    WorkspaceResponse,
+    WorkspaceUpdate,
+)
+from app.services.notification_service import unread_count
+from app.services.principal_cache import invalidate_principals
+from app.services.response_cache import cached_body, invalidate_tags, json_response
+from app.utils.auth import get_current_user, get_workspace_member
 
 router = APIRouter(prefix="/workspaces", tags=["workspaces"])
 
@@ -37,7 +53,7 @@ async def create_workspace(
     return workspace
 
 
-@router.get("/{workspace_id}", response_model=WorkspaceResponse)
+@router.get("/{workspace_id}", response_model=WorkspaceResponse, dependencies=[Depends(get_workspace_member)])
 async def get_workspace(
     workspace_id: str,
     current_user: User = Depends(get_current_user),
@@ -50,7 +66,7 @@ async def get_workspace(
     return workspace
 
 
-@router.put("/{workspace_id}", response_model=WorkspaceResponse)
+@router.put("/{workspace_id}", response_model=WorkspaceResponse, dependencies=[Depends(get_workspace_member)])
 async def update_workspace(
     workspace_id: str,
     data: WorkspaceUpdate,
@@ -66,11 +82,12 @@ async def update_workspace(
         setattr(workspace, field, value)
 
     await db.commit()
+    await invalidate_tags(f"workspace:{workspace_id}")
     await db.refresh(workspace)
     return workspace
 
 
-@router.delete("/{workspace_id}", status_code=204)
+@router.delete("/{workspace_id}", status_code=204, dependencies=[Depends(get_workspace_member)])
 async def delete_workspace(
     workspace_id: uuid.UUID,
     current_user: User = Depends(get_current_user),
@@ -84,5 +101,84 @@ async def delete_workspace(
     if not workspace:
         raise HTTPException(status_code=404, detail="Workspace not found")
 
+    # Members are deleted with the workspace
+    member_ids = (await db.execute(
+        select(User.id).where(User.workspace_id == workspace_id)
+    )).scalars().all()
+
     await db.delete(workspace)
     await db.commit()
+    await invalidate_principals(*member_ids)
+
+
+# --- Bootstrap ---
+
+# Everything in WorkspaceReferenceData, as tagged by the endpoints that edit it
+REFERENCE_TAGS = (
+    "workspace:{workspace_id}",
+    "workspace:{workspace_id}:members",
+    "workspace:{workspace_id}:teams",
+    "workspace:{workspace_id}:projects",
+    "workspace:{workspace_id}:tags",
+    "workspace:{workspace_id}:custom_fields",
+    "workspace:{workspace_id}:templates",
+    "workspace:{workspace_id}:milestones",
+    "workspace:{workspace_id}:clients",
+)
+
+
+async def _render_reference_data(db: AsyncSession, workspace_id: uuid.UUID) -> bytes:
+    # One statement at a time: asyncpg can't overlap queries on a connection,
+    # but this still replaces nine requests, each with its own auth and session
+    async def rows(query):
+        return (await db.execute(query)).scalars().all()
+
+    data = WorkspaceReferenceData(
+        workspace=await db.get(Workspace, workspace_id),
+        members=await rows(select(User).where(User.workspace_id == workspace_id)),
+        teams=await rows(select(Team).where(Team.workspace_id == workspace_id)),
+        projects=await rows(select(Project).where(Project.workspace_id == workspace_id).order_by(Project.name)),
+        tags=await rows(
+            select(Tag)
+            .join(Project, Project.id == Tag.project_id)
+            .where(Project.workspace_id == workspace_id)
+            .order_by(Tag.name)
+        ),
+        custom_fields=await rows(
+            select(CustomField).where(CustomField.workspace_id == workspace_id).order_by(CustomField.sort_order)
+        ),
+        templates=await rows(
+            select(TaskTemplate).where(TaskTemplate.workspace_id == workspace_id).order_by(TaskTemplate.name)
+        ),
+        milestones=await rows(select(Milestone).where(Milestone.workspace_id == workspace_id).order_by(Milestone.date)),
+        clients=await rows(select(Client).where(Client.workspace_id == workspace_id).order_by(Client.name)),
+    )
+    return data.model_dump_json().encode()
+
+
+@router.get(
+    "/{workspace_id}/bootstrap",
+    response_model=WorkspaceBootstrap,
+    dependencies=[Depends(get_workspace_member)],
+)
+async def bootstrap_workspace(
+    request: Request,
+    workspace_id: uuid.UUID,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """Reference data for the app shell in one request.
+
+    The shared part is cached until any of it is edited; only the caller's
+    unread notification count is queried every time.
+    """
+    reference = await cached_body(
+        "workspaces.bootstrap_workspace",
+        f"bootstrap?workspace_id={workspace_id}",
+        [tag.format(workspace_id=workspace_id) for tag in REFERENCE_TAGS],
+        lambda: _render_reference_data(db, workspace_id),
+    )
+    unread = await unread_count(db, current_user.id, workspace_id)
+    # Splice the per-user field into the cached JSON object
+    body = reference[:-1] + b',"unread_notifications":%d}' % unread
+    return json_response(request, body)
@@ -8,16 +8,36 @@ class Settings(BaseSettings):
     # Redis
     redis_url: str = "redis://planview-redis:6379/0"
 
+    # Rate limit buckets: memory (per process) | redis (shared by all workers)
+    rate_limit_backend: str = "memory"
+
     # Auth
     jwt_secret_key: str = "change-me-to-a-random-secret"
     jwt_algorithm: str = "HS256"
     jwt_access_token_expire_minutes: int = 30
     jwt_refresh_token_expire_days: int = 7
 
+    # Authenticated user cache: memory (per process) | redis (shared by all workers)
+    principal_cache_backend: str = "memory"
+    principal_cache_ttl: int = 30  # seconds
+
+    # Cached list endpoints (projects, members, teams, ...): memory | redis
+    response_cache_backend: str = "memory"
+    response_cache_ttl: int = 300  # seconds
+
+    # bcrypt runs off the event loop in this many threads; past the queue limit
+    # logins and password changes get 503 instead of piling up
+    password_hash_workers: int = 4
+    password_hash_queue: int = 64
+
     # Server
     backend_host: str = "0.0.0.0"
     backend_port: int = 8000
     cors_origins: str = "http://localhost:3000,http://localhost:5173"
+    # Proxies whose X-Forwarded-For is believed (comma-separated IPs/networks,
+    # or * when only the proxy can reach the backend). Rate limits key on the
+    # resulting client address.
+    forwarded_allow_ips: str = "127.0.0.1"
 
     # File storage
     upload_dir: str = "/app/uploads"
@@ -37,6 +57,16 @@ class Settings(BaseSettings):
     app_name: str = "Planview"
     app_version: str = "1.0.0"
 
+    # Delta sync: changes younger than the lag are sent again on the next sync,
+    # in case a transaction that started earlier commits after the cursor was
+    # handed out. Deletions are kept for the retention period; older cursors
+    # must do a full sync.
+    sync_cursor_lag_seconds: int = 30
+    task_tombstone_retention_days: int = 30
+
+    # Query budgets: off | warn | raise (raise is for tests and local dev)
+    query_budgets: str = "off"
+
     model_config = {"env_file": ".env", "extra": "ignore"}
 
 
@@ -3,14 +3,20 @@ from collections.abc import AsyncGenerator
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 from app.config import settings
+from app.utils.serialization import dumps_column
+
+POOL_SIZE = 20
+MAX_OVERFLOW = 10
 
 engine = create_async_engine(
     settings.database_url,
     echo=False,
-    pool_size=20,
-    max_overflow=10,
+    pool_size=POOL_SIZE,
+    max_overflow=MAX_OVERFLOW,
     pool_pre_ping=True,
     pool_recycle=3600,
+    # JSON columns may hold payloads embedding already-encoded snapshots
+    json_serializer=dumps_column,
 )
 async_session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
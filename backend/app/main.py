@@ -1,16 +1,24 @@
 import asyncio
 import logging
-import time
-import uuid as _uuid
+from contextlib import asynccontextmanager
 
-from fastapi import FastAPI, Request, WebSocket, WebSocketDisconnect
+from fastapi import FastAPI, HTTPException, Request, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
+from fastapi.responses import JSONResponse, Response
+from uvicorn.middleware.proxy_headers import ProxyHeadersMiddleware
 
 from app.api.router import api_router
 from app.config import settings
+from app.database import MAX_OVERFLOW, POOL_SIZE, async_session, engine
+from app.metrics import instrument_pool, mark_process_dead, render_metrics
+from app.middleware.query_counter import install_query_counter
 from app.middleware.rate_limit import RateLimitMiddleware
+from app.middleware.request_id import RequestIDMiddleware
+from app.services import task_event_handlers  # noqa: F401 — registers domain event handlers
+from app.services.api_token_service import flush_last_used, flush_last_used_periodically
+from app.services.domain_events import dispatcher
+from app.services.task_sync_service import prune_tombstones_periodically
+from app.utils.auth import authenticate_token
 from app.websocket.manager import manager
 
 # Structured logging setup
@@ -21,26 +29,27 @@ logging.basicConfig(
 )
 logger = logging.getLogger("planview")
 
-app = FastAPI(title=settings.app_name, version=settings.app_version)
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    token_usage_flusher = asyncio.create_task(flush_last_used_periodically())
+    tombstone_pruner = asyncio.create_task(prune_tombstones_periodically())
+    yield
+    token_usage_flusher.cancel()
+    tombstone_pruner.cancel()
+    await flush_last_used()
+    # Let after-commit handlers (webhooks, notifications) finish on shutdown
+    await dispatcher.drain()
+    mark_process_dead()
 
-# Request ID + access logging middleware
-class RequestIDMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
-        request_id = request.headers.get("X-Request-ID", str(_uuid.uuid4()))
-        start = time.time()
-        response = await call_next(request)
-        elapsed = round((time.time() - start) * 1000, 1)
-        response.headers["X-Request-ID"] = request_id
-        logger.info(
-            "%s %s %s %sms [%s]",
-            request.method, request.url.path, response.status_code, elapsed, request_id,
-        )
-        return response
+
+app = FastAPI(title=settings.app_name, version=settings.app_version, lifespan=lifespan)
+install_query_counter(engine)
+instrument_pool(engine, POOL_SIZE + MAX_OVERFLOW)
 
 
 # Middleware order: outermost evaluated first
-app.add_middleware(RateLimitMiddleware, requests_per_minute=120)
+app.add_middleware(RateLimitMiddleware)
 app.add_middleware(RequestIDMiddleware)
 
 # CORS
@@ -53,6 +62,9 @@ app.add_middleware(
     allow_headers=["Authorization", "Content-Type", "X-Request-ID"],
 )
 
+# Outermost, so the rate limiter sees the client behind the proxy
+app.add_middleware(ProxyHeadersMiddleware, trusted_hosts=settings.forwarded_allow_ips)
+
 app.include_router(api_router)
 
 
@@ -71,8 +83,26 @@ async def health():
     return {"status": "ok", "version": settings.app_version}
 
 
+# Not proxied by nginx — scraped from inside the compose network
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    body, content_type = render_metrics()
+    return Response(body, media_type=content_type)
+
+
 @app.websocket("/ws/{workspace_id}")
-async def websocket_endpoint(websocket: WebSocket, workspace_id: str):
+async def websocket_endpoint(websocket: WebSocket, workspace_id: str, token: str = ""):
+    # Browsers can't set headers on WebSockets, so the access token comes as ?token=
+    try:
+        async with async_session() as db:
+            user = await authenticate_token(db, token)
+    except HTTPException:
+        await websocket.close(code=4401)
+        return
+    if str(user.workspace_id) != workspace_id:
+        await websocket.close(code=4403)
+        return
+
     await manager.connect(websocket, workspace_id)
     try:
         while True:
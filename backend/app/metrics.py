@@ -0,0 +1,138 @@
+"""
+Prometheus metrics, served in the text exposition format at ``/metrics``.
+
+With several uvicorn workers, set ``PROMETHEUS_MULTIPROC_DIR`` to an empty
+directory shared by the workers (and wipe it on each deploy): every worker
+then writes its samples there and whichever one answers the scrape reports the
+totals across all of them. Without it, metrics are per-process.
+"""
+import os
+
+from fastapi import Request
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.middleware.query_counter import route_template
+
+REQUEST_LATENCY = Histogram(
+    "planview_http_request_duration_seconds",
+    "HTTP request latency by route template",
+    ["method", "route"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+)
+REQUESTS = Counter(
+    "planview_http_requests_total",
+    "HTTP requests by route template and status code",
+    ["method", "route", "status"],
+)
+RATE_LIMITED = Counter(
+    "planview_rate_limit_rejections_total",
+    "Requests rejected with 429 by the rate limiter",
+    ["policy"],
+)
+RESPONSE_CACHE_LOOKUPS = Counter(
+    "planview_response_cache_lookups_total",
+    "Cached endpoint lookups by endpoint and result (hit, miss)",
+    ["endpoint", "result"],
+)
+
+DB_POOL_CAPACITY = Gauge(
+    "planview_db_pool_capacity",
+    "Connections the pool may open (pool_size + max_overflow)",
+    multiprocess_mode="livesum",
+)
+DB_POOL_CHECKED_OUT = Gauge(
+    "planview_db_pool_checked_out",
+    "Pool connections currently checked out",
+    multiprocess_mode="livesum",
+)
+
+WS_CONNECTIONS = Gauge(
+    "planview_websocket_connections",
+    "Open WebSocket connections",
+    multiprocess_mode="livesum",
+)
+WS_WORKSPACES = Gauge(
+    "planview_websocket_workspaces",
+    "Workspaces with at least one open WebSocket connection",
+    multiprocess_mode="livesum",
+)
+
+EVENT_QUEUE_DEPTH = Gauge(
+    "planview_domain_event_queue_depth",
+    "After-commit handlers (webhooks, notifications, broadcasts) waiting to run",
+    multiprocess_mode="livesum",
+)
+EVENT_HANDLER_FAILURES = Counter(
+    "planview_domain_event_handler_failures_total",
+    "Domain event handlers that raised",
+    ["handler"],
+)
+WEBHOOK_DELIVERIES = Counter(
+    "planview_webhook_deliveries_total",
+    "Webhook deliveries by outcome (success, http_error, error)",
+    ["outcome"],
+)
+WEBHOOK_LATENCY = Histogram(
+    "planview_webhook_delivery_duration_seconds",
+    "Time spent posting a webhook",
+)
+EMAILS = Counter(
+    "planview_emails_total",
+    "Emails by outcome (sent, failed, skipped when SMTP is not configured)",
+    ["outcome"],
+)
+
+PASSWORD_HASH_IN_FLIGHT = Gauge(
+    "planview_password_hash_in_flight",
+    "bcrypt hashes and verifications running or queued for the worker pool",
+    multiprocess_mode="livesum",
+)
+PASSWORD_HASH_LATENCY = Histogram(
+    "planview_password_hash_duration_seconds",
+    "Time spent in bcrypt by operation (hash, verify), excluding queueing",
+    ["op"],
+    buckets=(0.05, 0.1, 0.2, 0.3, 0.5, 1.0, 2.5),
+)
+PASSWORD_HASH_REJECTIONS = Counter(
+    "planview_password_hash_rejections_total",
+    "Password operations refused with 503 because the pool queue was full",
+)
+
+
+def observe_request(request: Request, status_code: int, elapsed: float) -> None:
+    # Unmatched paths share one label so scanners can't blow up cardinality
+    route = route_template(request) or "unmatched"
+    REQUEST_LATENCY.labels(request.method, route).observe(elapsed)
+    REQUESTS.labels(request.method, route, str(status_code)).inc()
+
+
+def instrument_pool(engine: AsyncEngine, capacity: int) -> None:
+    DB_POOL_CAPACITY.set(capacity)
+    event.listen(engine.sync_engine, "checkout", lambda *args: DB_POOL_CHECKED_OUT.inc())
+    event.listen(engine.sync_engine, "checkin", lambda *args: DB_POOL_CHECKED_OUT.dec())
+
+
+def render_metrics() -> tuple[bytes, str]:
+    if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return generate_latest(registry), CONTENT_TYPE_LATEST
+
+
+def mark_process_dead() -> None:
+    """Drop this worker's live gauges from the shared multiprocess directory."""
+    if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+        multiprocess.mark_process_dead(os.getpid())
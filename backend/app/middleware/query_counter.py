@@ -0,0 +1,139 @@
+"""
+Per-request SQL statement counting.
+Engine events add each statement's count and duration to the request that
+issued it; RequestIDMiddleware reports the totals in the access log and a
+Server-Timing header. With ``query_budgets`` set to "warn" or "raise", repeated
+identical statements (likely N+1s) are logged and per-endpoint budgets are
+enforced — "raise" is meant for tests and local development.
+"""
+import logging
+import time
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
+from fastapi import Request
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Same statement text this many times in one request is reported as an N+1
+REPEAT_THRESHOLD = 5
+
+# Max statements per endpoint, keyed by (method, route template)
+QUERY_BUDGETS: dict[tuple[str, str], int] = {
+    ("GET", "/api/v1/auth/me"): 2,
+    ("GET", "/api/v1/workspaces/{workspace_id}/tasks"): 9,
+    ("POST", "/api/v1/workspaces/{workspace_id}/tasks"): 10,
+    ("POST", "/api/v1/workspaces/{workspace_id}/tasks/bulk"): 14,
+    ("PUT", "/api/v1/workspaces/{workspace_id}/tasks"): 10,
+    ("GET", "/api/v1/workspaces/{workspace_id}/tasks/changes"): 10,
+    ("GET", "/api/v1/workspaces/{workspace_id}/tasks/search"): 3,
+    ("PUT", "/api/v1/workspaces/{workspace_id}/tasks/reorder"): 6,
+    ("GET", "/api/v1/workspaces/{workspace_id}/tasks/{task_id}"): 9,
+    ("PUT", "/api/v1/workspaces/{workspace_id}/tasks/{task_id}"): 14,
+    ("POST", "/api/v1/workspaces/{workspace_id}/tasks/{task_id}/move"): 5,
+    ("POST", "/api/v1/workspaces/{workspace_id}/tasks/{task_id}/duplicate"): 12,
+    ("GET", "/api/v1/workspaces/{workspace_id}/timeline"): 10,
+    ("GET", "/api/v1/workspaces/{workspace_id}/search"): 3,
+}
+
+
+class QueryBudgetExceeded(AssertionError):
+    pass
+
+
+@dataclass
+class QueryStats:
+    count: int = 0
+    duration: float = 0.0  # seconds
+    statements: Counter[str] = field(default_factory=Counter)
+
+    def repeated(self) -> list[tuple[str, int]]:
+        return [(sql, n) for sql, n in self.statements.most_common() if n >= REPEAT_THRESHOLD]
+
+
+_current: ContextVar[QueryStats | None] = ContextVar("query_stats", default=None)
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """Collect statements issued in this context (and tasks it starts)."""
+    stats = QueryStats()
+    token = _current.set(stats)
+    try:
+        yield stats
+    finally:
+        _current.reset(token)
+
+
+def install_query_counter(engine: AsyncEngine) -> None:
+    event.listen(engine.sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine.sync_engine, "after_cursor_execute", _after_cursor_execute)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    # On the per-statement context rather than the connection, so a statement
+    # that raises (and never reaches the after hook) leaves nothing behind
+    context._query_start = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = context._query_start
+    stats = _current.get()
+    if stats is None:
+        return
+    stats.count += 1
+    stats.duration += time.perf_counter() - started
+    if not executemany:
+        stats.statements[statement] += 1
+
+
+def server_timing(stats: QueryStats) -> str:
+    return f'db;dur={stats.duration * 1000:.1f};desc="{stats.count} queries"'
+
+
+def route_template(request: Request) -> str | None:
+    """Path template of the route the request matched, or None if none did.
+
+    Newer FastAPI matches included routers lazily and leaves their prefix off
+    ``route.path``, so the part of the path the route's own pattern doesn't
+    cover (``/api/v1``) is put back in front.
+    """
+    route = request.scope.get("route")
+    template = getattr(route, "path", None)
+    if template is None:
+        return None
+    path = request.scope["path"]
+    for start, char in enumerate(path):
+        if char == "/" and route.path_regex.match(path[start:]):
+            return path[:start] + template
+    return template
+
+
+def check_query_budget(request: Request, stats: QueryStats) -> None:
+    """Report likely N+1s and enforce the endpoint's budget, per settings.
+
+    Called as the response starts, so in "raise" mode the request fails
+    rather than being answered.
+    """
+    mode = settings.query_budgets
+    if mode == "off":
+        return
+    template = route_template(request) or request.url.path
+    endpoint = f"{request.method} {template}"
+
+    for sql, times in stats.repeated():
+        logger.warning("Possible N+1 on %s: %d× %s", endpoint, times, " ".join(sql.split())[:200])
+
+    budget = QUERY_BUDGETS.get((request.method, template))
+    if budget is not None and stats.count > budget:
+        message = f"{endpoint} ran {stats.count} queries (budget {budget})"
+        if mode == "raise":
+            raise QueryBudgetExceeded(message)
+        logger.warning(message)
@@ -1,45 +1,217 @@
 """
-Simple in-memory rate limiter middleware.
-Limits requests per IP to prevent abuse.
+Rate limiting with GCRA (a token bucket that stores one timestamp per key).
+
+Each request is matched to the first ``RateLimitPolicy`` whose method and path
+pattern fit, and counted against that policy's bucket for the caller — the
+JWT subject or API token for authenticated requests, otherwise the client IP
+(as reported by a trusted proxy; see ``forwarded_allow_ips``). Buckets live
+in a bounded in-process LRU by default; set ``rate_limit_backend=redis`` to
+share them across workers through a single atomic Redis script.
 """
+import logging
+import math
+import re
 import time
-from collections import defaultdict
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Protocol
 
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from jose import JWTError, jwt
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+from starlette.datastructures import Headers, MutableHeaders
 from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.config import settings
+from app.metrics import RATE_LIMITED
+from app.services.api_token_service import API_TOKEN_PREFIX, hash_api_token
+
+logger = logging.getLogger(__name__)
+
+# Health checks and metrics scrapes are never limited; WebSockets aren't HTTP scopes
+EXEMPT_PATHS = ("/health", "/metrics")
+
+# Scope key set on a batch's sub-requests, which the batch itself paid for
+BATCHED = "planview.batched"
+
+
+@dataclass(frozen=True)
+class RateLimitPolicy:
+    name: str
+    limit: int  # requests allowed per period, all of which may arrive at once
+    period: float  # seconds
+    per: str = "user"  # "user" (falls back to IP when anonymous) or "ip"
+    path: str | None = None  # regex matched against the start of the path
+    methods: tuple[str, ...] | None = None
+
+    def matches(self, method: str, path: str) -> bool:
+        if self.methods is not None and method not in self.methods:
+            return False
+        return self.path is None or re.match(self.path, path) is not None
+
 
+DEFAULT_POLICIES = (
+    # Credential endpoints are limited by IP so rotating accounts doesn't help.
+    # Token refresh isn't guessable and every open tab does it, so it falls
+    # through to the default policy.
+    RateLimitPolicy(
+        "auth", limit=20, period=60, per="ip", methods=("POST",),
+        path=r"/api/v1/auth/(login|register|2fa/)",
+    ),
+    RateLimitPolicy(
+        "import_export", limit=10, period=60,
+        path=r"/api/v1/workspaces/[^/]+/(import|export)/",
+    ),
+    RateLimitPolicy("default", limit=120, period=60),
+)
 
-class RateLimitMiddleware(BaseHTTPMiddleware):
-    def __init__(self, app, requests_per_minute: int = 120):
-        super().__init__(app)
-        self.rpm = requests_per_minute
-        self.window = 60  # seconds
-        self._hits: dict[str, list[float]] = defaultdict(list)
 
-    async def dispatch(self, request: Request, call_next):
-        # Skip rate limiting for WebSocket and health checks
-        if request.url.path in ("/health", "/ws") or request.url.path.startswith("/ws/"):
-            return await call_next(request)
+@dataclass(frozen=True)
+class RateLimitResult:
+    allowed: bool
+    remaining: int
+    retry_after: float  # seconds until the next request would be allowed
 
-        client_ip = request.client.host if request.client else "unknown"
-        now = time.time()
-        cutoff = now - self.window
 
-        # Prune old entries
-        hits = self._hits[client_ip]
-        self._hits[client_ip] = [t for t in hits if t > cutoff]
-        hits = self._hits[client_ip]
+class RateLimitBackend(Protocol):
+    async def hit(self, key: str, limit: int, period: float) -> RateLimitResult: ...
 
-        if len(hits) >= self.rpm:
-            return JSONResponse(
+
+def _gcra(tat: float | None, now: float, limit: int, period: float) -> tuple[RateLimitResult, float]:
+    """Apply one request to a bucket whose theoretical arrival time is ``tat``."""
+    interval = period / limit
+    new_tat = (now if tat is None else max(tat, now)) + interval
+    if new_tat - now > period:
+        return RateLimitResult(False, 0, new_tat - now - period), tat
+    remaining = math.floor((period - (new_tat - now)) / interval + 1e-9)
+    return RateLimitResult(True, remaining, 0.0), new_tat
+
+
+class MemoryBackend:
+    """Per-process buckets, evicting the least recently used past ``max_keys``."""
+
+    def __init__(self, max_keys: int = 10_000):
+        self.max_keys = max_keys
+        self._tats: OrderedDict[str, float] = OrderedDict()
+
+    async def hit(self, key: str, limit: int, period: float) -> RateLimitResult:
+        result, tat = _gcra(self._tats.get(key), time.monotonic(), limit, period)
+        if result.allowed:
+            self._tats[key] = tat
+            self._tats.move_to_end(key)
+            if len(self._tats) > self.max_keys:
+                self._tats.popitem(last=False)
+        return result
+
+
+# Times are integer microseconds from the Redis clock, so every worker agrees
+_GCRA_SCRIPT = """
+local interval = tonumber(ARGV[1])
+local period = tonumber(ARGV[2])
+local clock = redis.call('TIME')
+local now = clock[1] * 1000000 + clock[2]
+local tat = tonumber(redis.call('GET', KEYS[1]) or now)
+if tat < now then tat = now end
+local new_tat = tat + interval
+if new_tat - now > period then
+    return {0, 0, new_tat - now - period}
+end
+redis.call('SET', KEYS[1], string.format('%.0f', new_tat), 'PX', math.ceil((new_tat - now) / 1000))
+return {1, math.floor((period - (new_tat - now)) / interval), 0}
+"""
+
+
+class RedisBackend:
+    """Buckets shared by all workers. Falls back to in-process buckets while
+    Redis is unreachable rather than failing requests."""
+
+    def __init__(self, client: Redis, prefix: str = "ratelimit:"):
+        self.prefix = prefix
+        self._script = client.register_script(_GCRA_SCRIPT)
+        self._fallback = MemoryBackend()
+        self._degraded = False
+
+    async def hit(self, key: str, limit: int, period: float) -> RateLimitResult:
+        period_us = round(period * 1_000_000)
+        try:
+            allowed, remaining, retry_after_us = await self._script(
+                keys=[self.prefix + key], args=[period_us // limit, period_us],
+            )
+        except RedisError as exc:
+            if not self._degraded:
+                logger.warning("Rate limiting falling back to in-process buckets: %s", exc)
+                self._degraded = True
+            return await self._fallback.hit(key, limit, period)
+        self._degraded = False
+        return RateLimitResult(bool(allowed), int(remaining), retry_after_us / 1_000_000)
+
+
+def backend_from_settings() -> RateLimitBackend:
+    if settings.rate_limit_backend == "redis":
+        return RedisBackend(Redis.from_url(settings.redis_url))
+    return MemoryBackend()
+
+
+def _caller(scope: Scope, policy: RateLimitPolicy) -> str:
+    if policy.per == "user":
+        authorization = Headers(scope=scope).get("authorization", "")
+        scheme, _, token = authorization.partition(" ")
+        if scheme.lower() == "bearer" and token.startswith(API_TOKEN_PREFIX):
+            return f"token:{hash_api_token(token)[:16]}"
+        if scheme.lower() == "bearer" and token:
+            try:
+                payload = jwt.decode(token, settings.jwt_secret_key, algorithms=[settings.jwt_algorithm])
+            except JWTError:
+                payload = {}
+            if payload.get("sub"):
+                return f"user:{payload['sub']}"
+    return f"ip:{scope['client'][0] if scope.get('client') else 'unknown'}"
+
+
+class RateLimitMiddleware:
+    def __init__(
+        self,
+        app: ASGIApp,
+        policies: tuple[RateLimitPolicy, ...] = DEFAULT_POLICIES,
+        backend: RateLimitBackend | None = None,
+    ):
+        self.app = app
+        self.policies = policies
+        self.backend = backend or backend_from_settings()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] in EXEMPT_PATHS or scope.get(BATCHED):
+            await self.app(scope, receive, send)
+            return
+
+        policy = next((p for p in self.policies if p.matches(scope["method"], scope["path"])), None)
+        if policy is None:
+            await self.app(scope, receive, send)
+            return
+
+        key = f"{policy.name}:{_caller(scope, policy)}"
+        result = await self.backend.hit(key, policy.limit, policy.period)
+
+        if not result.allowed:
+            RATE_LIMITED.labels(policy.name).inc()
+            response = JSONResponse(
                 status_code=429,
                 content={"detail": "Too many requests. Please slow down."},
-                headers={"Retry-After": str(self.window)},
+                headers={
+                    "Retry-After": str(math.ceil(result.retry_after)),
+                    "X-RateLimit-Limit": str(policy.limit),
+                    "X-RateLimit-Remaining": "0",
+                },
             )
+            await response(scope, receive, send)
+            return
+
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                headers["X-RateLimit-Limit"] = str(policy.limit)
+                headers["X-RateLimit-Remaining"] = str(result.remaining)
+            await send(message)
 
-        hits.append(now)
-        response = await call_next(request)
-        response.headers["X-RateLimit-Limit"] = str(self.rpm)
-        response.headers["X-RateLimit-Remaining"] = str(max(0, self.rpm - len(hits)))
-        return response
+        await self.app(scope, receive, send_with_headers)
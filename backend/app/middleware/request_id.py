@@ -0,0 +1,66 @@
+"""
+Request ID, access logging and per-request metrics as raw ASGI middleware.
+Headers are added to the ``http.response.start`` message, so streaming
+responses and background tasks pass through untouched; WebSocket and lifespan
+scopes are forwarded as-is.
+"""
+import logging
+import time
+import uuid
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.requests import Request
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.metrics import observe_request
+from app.middleware.query_counter import (
+    check_query_budget,
+    server_timing,
+    track_queries,
+)
+
+logger = logging.getLogger("planview")
+
+
+class RequestIDMiddleware:
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = Headers(scope=scope).get("x-request-id") or str(uuid.uuid4())
+        status_code = 500  # if the app raises before starting a response
+        budget_checked = False
+        start = time.perf_counter()
+
+        with track_queries() as queries:
+
+            async def send_with_headers(message: Message) -> None:
+                nonlocal status_code, budget_checked
+                if message["type"] == "http.response.start":
+                    if not budget_checked:
+                        # Before anything is sent, so "raise" mode can still fail
+                        # the request (once; its error response passes through)
+                        budget_checked = True
+                        check_query_budget(Request(scope), queries)
+                    status_code = message["status"]
+                    headers = MutableHeaders(scope=message)
+                    headers["X-Request-ID"] = request_id
+                    headers["Server-Timing"] = server_timing(queries)
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_with_headers)
+            finally:
+                duration = time.perf_counter() - start
+                # The router has filled in route and path_params by now
+                request = Request(scope)
+                observe_request(request, status_code, duration)
+                logger.info(
+                    "%s %s %s %sms %dq/%.1fms [%s]",
+                    scope["method"], scope["path"], status_code, round(duration * 1000, 1),
+                    queries.count, queries.duration * 1000, request_id,
+                )
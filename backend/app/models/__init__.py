@@ -7,6 +7,7 @@ from app.models.project import Project
 from app.models.segment import Segment
 from app.models.tag import Tag
 from app.models.task import Task, task_assignees, task_tags
+from app.models.task_tombstone import TaskTombstone
 from app.models.checklist import Checklist
 from app.models.comment import Comment
 from app.models.attachment import Attachment
@@ -20,6 +21,7 @@ from app.models.custom_field import CustomField, CustomFieldValue
 from app.models.task_template import TaskTemplate
 from app.models.webhook import Webhook, WebhookLog
 from app.models.rota import Rota, RotaEntry
+from app.models.api_token import ApiToken
 
 __all__ = [
     "Base",
@@ -34,6 +36,7 @@ __all__ = [
     "Task",
     "task_assignees",
     "task_tags",
+    "TaskTombstone",
     "Checklist",
     "Comment",
     "Attachment",
@@ -50,4 +53,5 @@ __all__ = [
     "WebhookLog",
     "Rota",
     "RotaEntry",
+    "ApiToken",
 ]
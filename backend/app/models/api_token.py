@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import uuid
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+from sqlalchemy import DateTime, ForeignKey, Index, String
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from app.models.base import Base, TimestampMixin, UUIDPrimaryKey
+
+if TYPE_CHECKING:
+    from app.models.user import User
+
+
+class ApiToken(Base, UUIDPrimaryKey, TimestampMixin):
+    __tablename__ = "api_tokens"
+
+    name: Mapped[str] = mapped_column(String(255), nullable=False)
+    token_hash: Mapped[str] = mapped_column(String(64), nullable=False)  # SHA-256 hex of the token
+    token_prefix: Mapped[str] = mapped_column(String(12), nullable=False)  # shown in lists to tell tokens apart
+    scopes: Mapped[list] = mapped_column(JSONB, nullable=False)  # ["read"] or ["read", "write"]
+    expires_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    last_used_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+
+    user_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+    )
+    workspace_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("workspaces.id", ondelete="CASCADE"), nullable=False
+    )
+
+    user: Mapped[User] = relationship()
+
+    __table_args__ = (
+        Index("ix_api_token_hash", "token_hash", unique=True),
+        Index("ix_api_token_workspace_user", "workspace_id", "user_id"),
+    )
@@ -3,8 +3,8 @@ from __future__ import annotations
 import uuid
 from typing import TYPE_CHECKING
 
-from sqlalchemy import ForeignKey, Text
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Computed, ForeignKey, Index, Text
+from sqlalchemy.dialects.postgresql import TSVECTOR, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.base import Base, TimestampMixin, UUIDPrimaryKey
@@ -18,6 +18,11 @@ class Comment(Base, UUIDPrimaryKey, TimestampMixin):
     __tablename__ = "comments"
 
     body: Mapped[str] = mapped_column(Text, nullable=False)
+    search_vector: Mapped[str | None] = mapped_column(
+        TSVECTOR,
+        Computed("to_tsvector('simple', coalesce(body, ''))", persisted=True),
+        deferred=True,
+    )
 
     task_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("tasks.id", ondelete="CASCADE"), nullable=False
@@ -28,3 +33,7 @@ class Comment(Base, UUIDPrimaryKey, TimestampMixin):
 
     task: Mapped[Task] = relationship(back_populates="comments")
     user: Mapped[User] = relationship()
+
+    __table_args__ = (
+        Index("ix_comment_search_vector", "search_vector", postgresql_using="gin"),
+    )
@@ -2,12 +2,13 @@ from __future__ import annotations
 
 import uuid
 from datetime import date, time
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, ClassVar
 
 from sqlalchemy import (
     Boolean,
     CheckConstraint,
     Column,
+    Computed,
     Date,
     ForeignKey,
     Index,
@@ -18,7 +19,7 @@ from sqlalchemy import (
     Time,
     text,
 )
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.dialects.postgresql import TSVECTOR, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.base import Base, TimestampMixin, UUIDPrimaryKey
@@ -66,7 +67,9 @@ class Task(Base, UUIDPrimaryKey, TimestampMixin):
     is_recurring: Mapped[bool] = mapped_column(Boolean, server_default="false", nullable=False)
     recurrence_rule: Mapped[str | None] = mapped_column(String(500), nullable=True)
     sort_order: Mapped[int] = mapped_column(Integer, server_default="0", nullable=False)
-
+    # Base-62 fractional key (see rank_service); byte-wise collation so the
+    # database sorts it the same way Python and the browser compare strings.
+    rank: Mapped[str | None] = mapped_column(String(255, collation="C"), nullable=True)
     project_id: Mapped[uuid.UUID | None] = mapped_column(
         UUID(as_uuid=True), ForeignKey("projects.id", ondelete="SET NULL"), nullable=True
     )
@@ -92,9 +95,27 @@ class Task(Base, UUIDPrimaryKey, TimestampMixin):
     parent: Mapped[Task | None] = relationship(back_populates="subtasks", remote_side="Task.id")
 
     __table_args__ = (
+        # In the table but not mapped (see __mapper_args__); search queries
+        # reach it as Task.__table__.c.search_vector
+        Column(
+            "search_vector",
+            TSVECTOR,
+            Computed(
+                "setweight(to_tsvector('simple', coalesce(name, '')), 'A') || "
+                "setweight(to_tsvector('simple', coalesce(description, '')), 'B')",
+                persisted=True,
+            ),
+        ),
         CheckConstraint(
             "time_estimate_mode IN ('total', 'per_day')", name="ck_task_time_estimate_mode"
         ),
         Index("ix_task_workspace_dates", "workspace_id", "date_from", "date_to"),
         Index("ix_task_project_status", "project_id", "status"),
+        Index("ix_task_project_rank", "workspace_id", "project_id", "rank"),
+        Index("ix_task_workspace_updated", "workspace_id", "updated_at", "id"),
+        Index("ix_task_search_vector", "search_vector", postgresql_using="gin"),
     )
+    # Fetch server-set columns (timestamps) via RETURNING so a written task
+    # can be serialised without re-selecting it. The generated search vector
+    # is left unmapped so it isn't returned by every INSERT and UPDATE too.
+    __mapper_args__: ClassVar[dict] = {"eager_defaults": True, "exclude_properties": ["search_vector"]}
@@ -0,0 +1,27 @@
+import uuid
+from datetime import datetime
+from typing import Literal
+
+from pydantic import BaseModel, Field
+
+
+class ApiTokenCreate(BaseModel):
+    name: str = Field(min_length=1, max_length=255)
+    scopes: list[Literal["read", "write"]] = Field(default=["read"], min_length=1)
+    expires_in_days: int | None = Field(default=None, ge=1, le=3650)
+
+
+class ApiTokenResponse(BaseModel):
+    id: uuid.UUID
+    name: str
+    token_prefix: str
+    scopes: list[str]
+    expires_at: datetime | None
+    last_used_at: datetime | None
+    created_at: datetime
+
+    model_config = {"from_attributes": True}
+
+
+class ApiTokenCreated(ApiTokenResponse):
+    token: str  # only ever returned here; the server keeps just its hash
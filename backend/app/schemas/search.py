@@ -0,0 +1,19 @@
+import uuid
+
+from pydantic import BaseModel
+
+
+class QuickSearchHit(BaseModel):
+    id: uuid.UUID
+    name: str
+    colour: str | None = None
+    project_id: uuid.UUID | None = None
+    score: float
+
+
+class QuickSearchResponse(BaseModel):
+    tasks: list[QuickSearchHit] = []
+    projects: list[QuickSearchHit] = []
+    teams: list[QuickSearchHit] = []
+    users: list[QuickSearchHit] = []
+    clients: list[QuickSearchHit] = []
@@ -1,10 +1,14 @@
 import uuid
 from datetime import date, datetime, time
+from typing import Literal
 
 from pydantic import BaseModel
 
 from app.schemas.user import UserResponse
 
+# The board's columns; a move between them sets one of these
+TaskStatus = Literal["todo", "in_progress", "blocked", "done"]
+
 
 class TaskCreate(BaseModel):
     name: str
@@ -114,6 +118,7 @@ class TaskResponse(BaseModel):
     is_recurring: bool
     recurrence_rule: str | None
     sort_order: int
+    rank: str | None = None
     project_id: uuid.UUID | None
     segment_id: uuid.UUID | None
     parent_id: uuid.UUID | None = None
@@ -127,3 +132,109 @@ class TaskResponse(BaseModel):
     updated_at: datetime
 
     model_config = {"from_attributes": True}
+
+
+class TaskSummary(BaseModel):
+    """Compact task shape for boards and timelines (``view=summary``)."""
+
+    id: uuid.UUID
+    name: str
+    colour: str | None
+    status: str
+    status_emoji: str | None
+    date_from: date | None
+    date_to: date | None
+    start_time: time | None
+    end_time: time | None
+    sort_order: int
+    rank: str | None = None
+    project_id: uuid.UUID | None
+    segment_id: uuid.UUID | None
+    parent_id: uuid.UUID | None = None
+    assignee_ids: list[uuid.UUID] = []
+    tag_ids: list[uuid.UUID] = []
+    checklist_total: int = 0
+    checklist_done: int = 0
+    subtask_count: int = 0
+    updated_at: datetime
+
+    model_config = {"from_attributes": True}
+
+
+class TaskNormalised(BaseModel):
+    """Task with assignees, tags and project referenced by id (``format=normalised``)."""
+
+    id: uuid.UUID
+    name: str
+    description: str | None
+    colour: str | None
+    status: str
+    status_emoji: str | None
+    date_from: date | None
+    date_to: date | None
+    start_time: time | None
+    end_time: time | None
+    time_estimate_minutes: int | None
+    time_estimate_mode: str
+    time_logged_minutes: int
+    is_recurring: bool
+    recurrence_rule: str | None
+    sort_order: int
+    rank: str | None = None
+    project_id: uuid.UUID | None
+    segment_id: uuid.UUID | None
+    parent_id: uuid.UUID | None = None
+    workspace_id: uuid.UUID
+    assignee_ids: list[uuid.UUID] = []
+    tag_ids: list[uuid.UUID] = []
+    checklists: list[ChecklistResponse] = []
+    subtasks: list[SubtaskBrief] = []
+    created_at: datetime
+    updated_at: datetime
+
+    model_config = {"from_attributes": True}
+
+
+class TaskListNormalised(BaseModel):
+    """Task list envelope with users, projects and tags side-loaded once each."""
+
+    tasks: list[TaskNormalised]
+    users: dict[uuid.UUID, UserResponse] = {}
+    projects: dict[uuid.UUID, ProjectBrief] = {}
+    tags: dict[uuid.UUID, TagBrief] = {}
+
+
+class TaskTombstoneResponse(BaseModel):
+    task_id: uuid.UUID
+    deleted_at: datetime
+
+    model_config = {"from_attributes": True}
+
+
+class TaskChanges(BaseModel):
+    """Page of task changes since a sync cursor.
+
+    ``cursor`` is opaque; pass it back as ``since`` to fetch the next page.
+    It is ``None`` only when the workspace has no tasks and no deletions yet.
+    Changes from the last few seconds may come again on the next sync, so
+    apply them as upserts. A cursor older than the tombstone retention
+    period gets a 410 and the client must sync from scratch.
+    """
+
+    tasks: list[TaskResponse] | list[TaskSummary] = []
+    deleted: list[TaskTombstoneResponse] = []
+    cursor: str | None = None
+    has_more: bool = False
+
+
+class TaskSearchResult(BaseModel):
+    id: uuid.UUID
+    name: str
+    status: str
+    colour: str | None
+    project_id: uuid.UUID | None
+    date_from: date | None
+    date_to: date | None
+    rank: float
+    name_highlight: str
+    description_highlight: str | None = None
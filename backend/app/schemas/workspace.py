@@ -3,6 +3,15 @@ from datetime import datetime
 
 from pydantic import BaseModel
 
+from app.schemas.client import ClientResponse
+from app.schemas.custom_field import CustomFieldResponse
+from app.schemas.milestone import MilestoneResponse
+from app.schemas.project import ProjectResponse
+from app.schemas.tag import TagResponse
+from app.schemas.task_template import TaskTemplateResponse
+from app.schemas.team import TeamResponse
+from app.schemas.user import UserResponse
+
 
 class WorkspaceCreate(BaseModel):
     name: str
@@ -19,3 +28,21 @@ class WorkspaceResponse(BaseModel):
     updated_at: datetime
 
     model_config = {"from_attributes": True}
+
+
+class WorkspaceReferenceData(BaseModel):
+    """Everything the app loads once per workspace, shared by all members."""
+
+    workspace: WorkspaceResponse
+    members: list[UserResponse]
+    teams: list[TeamResponse]
+    projects: list[ProjectResponse]
+    tags: list[TagResponse]
+    custom_fields: list[CustomFieldResponse]
+    templates: list[TaskTemplateResponse]
+    milestones: list[MilestoneResponse]
+    clients: list[ClientResponse]
+
+
+class WorkspaceBootstrap(WorkspaceReferenceData):
+    unread_notifications: int
@@ -1,5 +1,6 @@
 import uuid
 
+from sqlalchemy import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.activity import Activity
@@ -27,3 +28,28 @@ async def record_activity(
     )
     db.add(activity)
     # Don't commit here — let the caller's transaction handle it
+
+
+async def record_activities(
+    db: AsyncSession,
+    *,
+    workspace_id: uuid.UUID,
+    actor_id: uuid.UUID,
+    action: str,
+    entity_type: str,
+    entities: list[tuple[uuid.UUID, str]],
+):
+    """Record the same action on many entities with one batched INSERT."""
+    if not entities:
+        return
+    await db.execute(insert(Activity), [
+        {
+            "workspace_id": workspace_id,
+            "actor_id": actor_id,
+            "action": action,
+            "entity_type": entity_type,
+            "entity_id": entity_id,
+            "entity_name": entity_name,
+        }
+        for entity_id, entity_name in entities
+    ])
@@ -0,0 +1,106 @@
+"""Personal API tokens for integrations.
+
+Tokens are ``pv_`` plus 32 random bytes; only their SHA-256 is stored, under a
+unique index, so a lookup is one indexed SELECT — and usually none, as
+resolved tokens are cached alongside principals. ``last_used_at`` is kept in
+memory and written for all used tokens in one UPDATE every minute rather than
+once per request.
+"""
+import asyncio
+import hashlib
+import logging
+import secrets
+import uuid
+from datetime import datetime, timezone
+
+from pydantic import BaseModel
+from sqlalchemy import DateTime, column, select, update, values
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import async_session
+from app.models.api_token import ApiToken
+from app.services.principal_cache import store_from_settings
+
+logger = logging.getLogger(__name__)
+
+API_TOKEN_PREFIX = "pv_"
+LAST_USED_FLUSH_INTERVAL = 60  # seconds
+
+
+class CachedApiToken(BaseModel):
+    id: uuid.UUID
+    user_id: uuid.UUID
+    workspace_id: uuid.UUID
+    scopes: list[str]
+    expires_at: datetime | None
+
+    model_config = {"from_attributes": True}
+
+    @property
+    def expired(self) -> bool:
+        return self.expires_at is not None and self.expires_at <= datetime.now(timezone.utc)
+
+
+api_token_store = store_from_settings(CachedApiToken, "api_token:")
+_last_used: dict[uuid.UUID, datetime] = {}
+
+
+def generate_api_token() -> str:
+    return API_TOKEN_PREFIX + secrets.token_urlsafe(32)
+
+
+def hash_api_token(token: str) -> str:
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+async def resolve_api_token(db: AsyncSession, token: str) -> CachedApiToken | None:
+    token_hash = hash_api_token(token)
+    cached = await api_token_store.get(token_hash)
+    if cached is not None:
+        return cached
+    result = await db.execute(select(ApiToken).where(ApiToken.token_hash == token_hash))
+    api_token = result.scalar_one_or_none()
+    if api_token is None:
+        return None
+    cached = CachedApiToken.model_validate(api_token)
+    await api_token_store.set(token_hash, cached)
+    return cached
+
+
+async def invalidate_api_tokens(*token_hashes: str) -> None:
+    await api_token_store.delete(*token_hashes)
+
+
+def mark_used(token_id: uuid.UUID) -> None:
+    _last_used[token_id] = datetime.now(timezone.utc)
+
+
+async def flush_last_used() -> None:
+    if not _last_used:
+        return
+    pending = list(_last_used.items())
+    _last_used.clear()
+    used = values(
+        column("id", UUID(as_uuid=True)),
+        column("used_at", DateTime(timezone=True)),
+        name="used",
+    ).data(pending)
+    async with async_session() as db:
+        await db.execute(
+            update(ApiToken)
+            .where(ApiToken.id == used.c.id)
+            # Usage isn't an edit, so leave updated_at alone
+            .values(last_used_at=used.c.used_at, updated_at=ApiToken.updated_at)
+            .execution_options(synchronize_session=False)
+        )
+        await db.commit()
+
+
+async def flush_last_used_periodically() -> None:
+    while True:
+        await asyncio.sleep(LAST_USED_FLUSH_INTERVAL)
+        try:
+            await flush_last_used()
+        except Exception:
+            logger.exception("Failed to record API token usage")
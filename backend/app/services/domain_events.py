@@ -0,0 +1,121 @@
+"""After-commit domain events.
+
+Write endpoints describe what happened with ``publish(db, DomainEvent(...))``
+before committing. Events wait on the session and are only handed to the
+dispatcher once that transaction commits (a rollback discards them), so the
+HTTP response never waits on broadcasts, webhooks, notifications or email.
+
+Handlers register with ``@dispatcher.on("task.updated", ...)``. Each run gets
+its own database session, a small worker pool bounds how many run at once,
+and a failing handler is logged without affecting the others.
+"""
+import asyncio
+import contextvars
+import logging
+import uuid
+from collections import defaultdict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.database import async_session
+from app.metrics import EVENT_HANDLER_FAILURES, EVENT_QUEUE_DEPTH
+
+logger = logging.getLogger(__name__)
+
+_PENDING_KEY = "domain_events"
+
+
+@dataclass(frozen=True)
+class DomainEvent:
+    name: str
+    workspace_id: uuid.UUID
+    payload: dict  # encodable by utils.serialization.dumps; broadcast and delivered to webhooks as-is
+    actor_id: uuid.UUID | None = None
+    actor_name: str | None = None
+    new_assignee_ids: tuple[uuid.UUID, ...] = ()
+
+
+Handler = Callable[[AsyncSession, DomainEvent], Awaitable[None]]
+
+
+class DomainEventDispatcher:
+    def __init__(self, workers: int = 8):
+        self._handlers: dict[str, list[Handler]] = defaultdict(list)
+        self._worker_count = workers
+        self._queue: asyncio.Queue[tuple[Handler, DomainEvent]] | None = None
+        self._workers: list[asyncio.Task] = []
+
+    def on(self, *names: str) -> Callable[[Handler], Handler]:
+        def register(handler: Handler) -> Handler:
+            for name in names:
+                self._handlers[name].append(handler)
+            return handler
+        return register
+
+    def submit(self, domain_event: DomainEvent) -> None:
+        """Queue every handler for an already-committed event."""
+        handlers = self._handlers.get(domain_event.name)
+        if not handlers:
+            return
+        queue = self._ensure_workers()
+        for handler in handlers:
+            queue.put_nowait((handler, domain_event))
+        EVENT_QUEUE_DEPTH.set(queue.qsize())
+
+    def _ensure_workers(self) -> asyncio.Queue:
+        # Started lazily so they bind to the running event loop, each in a
+        # fresh context so they don't inherit the request that started them
+        if self._queue is None:
+            self._queue = asyncio.Queue()
+            self._workers = [
+                asyncio.create_task(self._work(), context=contextvars.Context())
+                for _ in range(self._worker_count)
+            ]
+        return self._queue
+
+    async def _work(self) -> None:
+        queue = self._queue
+        while True:
+            handler, domain_event = await queue.get()
+            try:
+                async with async_session() as db:
+                    await handler(db, domain_event)
+            except Exception:
+                EVENT_HANDLER_FAILURES.labels(handler.__name__).inc()
+                logger.exception("Domain event handler %s failed for %s", handler.__name__, domain_event.name)
+            finally:
+                queue.task_done()
+                EVENT_QUEUE_DEPTH.set(queue.qsize())
+
+    async def drain(self) -> None:
+        """Wait for queued handlers to finish, then stop the workers."""
+        if self._queue is None:
+            return
+        await self._queue.join()
+        for worker in self._workers:
+            worker.cancel()
+        self._queue = None
+        self._workers = []
+
+
+dispatcher = DomainEventDispatcher()
+
+
+def publish(db: AsyncSession, domain_event: DomainEvent) -> None:
+    """Dispatch ``domain_event`` once the session's transaction commits."""
+    db.info.setdefault(_PENDING_KEY, []).append(domain_event)
+
+
+@event.listens_for(Session, "after_commit")
+def _dispatch_pending(session: Session) -> None:
+    for domain_event in session.info.pop(_PENDING_KEY, ()):
+        dispatcher.submit(domain_event)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
@@ -10,6 +10,8 @@ import smtplib
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 
+from app.metrics import EMAILS
+
 logger = logging.getLogger(__name__)
 
 SMTP_HOST = os.getenv("SMTP_HOST", "")
@@ -26,6 +28,7 @@ def _smtp_configured() -> bool:
 def send_email(to: str, subject: str, html_body: str) -> bool:
     if not _smtp_configured():
         logger.info("SMTP not configured — would send to=%s subject=%s", to, subject)
+        EMAILS.labels("skipped").inc()
         return False
 
     try:
@@ -41,9 +44,11 @@ def send_email(to: str, subject: str, html_body: str) -> bool:
             server.sendmail(SMTP_FROM, [to], msg.as_string())
 
         logger.info("Email sent to %s: %s", to, subject)
+        EMAILS.labels("sent").inc()
         return True
     except Exception as exc:
         logger.error("Failed to send email to %s: %s", to, exc)
+        EMAILS.labels("failed").inc()
         return False
 
 
@@ -1,6 +1,5 @@
 import csv
 import io
-import json
 from datetime import datetime
 
 from sqlalchemy import select
@@ -8,6 +7,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from app.models.task import Task
+from app.utils.serialization import dumps
 
 
 async def export_tasks_csv(db: AsyncSession, workspace_id, params: dict) -> str:
@@ -52,7 +52,7 @@ async def export_tasks_json(db: AsyncSession, workspace_id, params: dict) -> str
             "tags": [{"id": str(tag.id), "name": tag.name} for tag in t.tags],
             "created_at": t.created_at.isoformat(),
         })
-    return json.dumps(data, indent=2, default=str)
+    return dumps(data, indent=True).decode()
 
 
 async def export_tasks_ics(db: AsyncSession, workspace_id, params: dict) -> str:
@@ -0,0 +1,128 @@
+"""Short-lived cache of authenticated users for ``get_current_user``.
+
+A hit rebuilds the ``User`` from cached columns and attaches it to the
+request's session without a SELECT, so endpoints can still modify and commit
+it. Password hashes and TOTP secrets are never cached; the few endpoints that
+need them load them with ``db.refresh``.
+
+Anything that changes a user row must call ``invalidate_principals`` after
+committing. With the in-process store that only clears the current worker —
+other workers catch up within ``principal_cache_ttl`` — so multi-worker
+deployments should use ``principal_cache_backend=redis``.
+"""
+import logging
+import time
+import uuid
+from collections import OrderedDict
+from typing import Protocol
+
+from pydantic import BaseModel
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient_to_detached
+
+from app.config import settings
+from app.models.user import User
+from app.schemas.user import UserResponse
+
+logger = logging.getLogger(__name__)
+
+
+class CachedPrincipal(UserResponse):
+    totp_enabled: bool
+
+
+class ModelStore[M: BaseModel](Protocol):
+    async def get(self, key: str) -> M | None: ...
+    async def set(self, key: str, value: M) -> None: ...
+    async def delete(self, *keys: str) -> None: ...
+
+
+class MemoryModelStore[M: BaseModel]:
+    """Per-process entries expiring after ``ttl`` seconds, LRU-bounded."""
+
+    def __init__(self, ttl: float, max_entries: int = 10_000):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[float, M]] = OrderedDict()
+
+    async def get(self, key: str) -> M | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires, value = entry
+        if expires < time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: M) -> None:
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def delete(self, *keys: str) -> None:
+        for key in keys:
+            self._entries.pop(key, None)
+
+
+class RedisModelStore[M: BaseModel]:
+    """Entries shared by all workers, stored as JSON. Redis errors count as misses."""
+
+    def __init__(self, client: Redis, model: type[M], ttl: float, prefix: str):
+        self.client = client
+        self.model = model
+        self.ttl = ttl
+        self.prefix = prefix
+
+    async def get(self, key: str) -> M | None:
+        try:
+            raw = await self.client.get(self.prefix + key)
+        except RedisError as exc:
+            logger.warning("Cache read failed for %s: %s", self.prefix, exc)
+            return None
+        return self.model.model_validate_json(raw) if raw else None
+
+    async def set(self, key: str, value: M) -> None:
+        try:
+            await self.client.set(self.prefix + key, value.model_dump_json(), ex=round(self.ttl))
+        except RedisError as exc:
+            logger.warning("Cache write failed for %s: %s", self.prefix, exc)
+
+    async def delete(self, *keys: str) -> None:
+        if not keys:
+            return
+        # Not swallowed: a failed invalidation would leave stale roles or revoked tokens cached
+        await self.client.delete(*(self.prefix + key for key in keys))
+
+
+def store_from_settings[M: BaseModel](model: type[M], prefix: str) -> ModelStore[M]:
+    if settings.principal_cache_backend == "redis":
+        return RedisModelStore(Redis.from_url(settings.redis_url), model, settings.principal_cache_ttl, prefix)
+    return MemoryModelStore(settings.principal_cache_ttl)
+
+
+principal_store = store_from_settings(CachedPrincipal, "principal:")
+
+
+async def load_principal(db: AsyncSession, user_id: uuid.UUID) -> User | None:
+    """The user for ``user_id``, from the cache when possible."""
+    principal = await principal_store.get(str(user_id))
+    if principal is None:
+        result = await db.execute(select(User).where(User.id == user_id))
+        user = result.scalar_one_or_none()
+        if user is not None:
+            await principal_store.set(str(user_id), CachedPrincipal.model_validate(user))
+        return user
+
+    user = User(**principal.model_dump())
+    make_transient_to_detached(user)
+    return await db.merge(user, load=False)
+
+
+async def invalidate_principals(*user_ids: uuid.UUID) -> None:
+    await principal_store.delete(*(str(user_id) for user_id in user_ids))
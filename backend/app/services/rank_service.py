@@ -0,0 +1,198 @@
+"""Lexicographic rank keys for ordering tasks without renumbering.
+
+Keys are base-62 fractions (``0.<key>``) compared byte-wise, so the column
+uses the "C" collation. A key never ends in the zero digit, which guarantees
+there is always room to insert before or after it. Moving a card writes only
+that card's key; when keys grow past ``REBALANCE_LENGTH`` the scope is
+re-spread evenly in the background.
+"""
+import logging
+import uuid
+
+from sqlalchemy import String, column, func, or_, select, update, values
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import async_session
+from app.models.task import Task
+from app.services.domain_events import DomainEvent, publish
+
+logger = logging.getLogger(__name__)
+
+DIGITS = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"
+_BASE = len(DIGITS)
+REBALANCE_LENGTH = 24
+
+
+def _midpoint(a: str, b: str | None) -> str:
+    """Key strictly between fractions 0.a and 0.b, where b=None means 1."""
+    if b is not None:
+        n = 0
+        while n < len(b) and (a[n] if n < len(a) else "0") == b[n]:
+            n += 1
+        if n:
+            return b[:n] + _midpoint(a[n:], b[n:])
+    lo = DIGITS.index(a[0]) if a else 0
+    hi = DIGITS.index(b[0]) if b else _BASE
+    if hi - lo > 1:
+        return DIGITS[(lo + hi) // 2]
+    if b and len(b) > 1:
+        return b[0]
+    return DIGITS[lo] + _midpoint(a[1:], None)
+
+
+def key_between(a: str | None, b: str | None) -> str:
+    """Return a key that sorts after ``a`` and before ``b``.
+
+    ``None`` means "no neighbour" on that side. Raises ValueError if
+    ``a >= b``.
+    """
+    if a is not None and b is not None and a >= b:
+        raise ValueError(f"rank {a!r} is not before {b!r}")
+    if a and b is None:
+        return _after(a)
+    return _midpoint(a or "", b)
+
+
+def _after(a: str) -> str:
+    """Short key after ``a``, for appending.
+
+    Keys are read as ``k`` leading "z"s followed by a ``k + 1`` digit counter;
+    appending increments the counter, and once its first digit would reach
+    "z" the next, one digit wider counter begins. Each width holds ~62× more
+    keys than the last, so n appends need keys of about ``2·log62(n)``
+    characters rather than a character per ~30 appends.
+    """
+    k = len(a) - len(a.lstrip(DIGITS[-1]))
+    width = k + 1
+    counter = [DIGITS.index(ch) for ch in a[k:k + width].ljust(width, DIGITS[0])]
+    i = width - 1
+    while i >= 0 and counter[i] == _BASE - 1:
+        counter[i] = 0
+        i -= 1
+    if i <= 0 and (i < 0 or counter[0] + 1 == _BASE - 1):
+        # This width is used up; "z" * (k + 1) sorts after all of it
+        return DIGITS[-1] * width
+    counter[i] += 1
+    return (DIGITS[-1] * k + "".join(DIGITS[d] for d in counter)).rstrip(DIGITS[0])
+
+
+def even_keys(count: int) -> list[str]:
+    """``count`` ascending keys spread evenly with room between each pair."""
+    width = 1
+    while _BASE**width <= count * 2:
+        width += 1
+    span = _BASE**width
+    keys = []
+    for i in range(1, count + 1):
+        value = i * span // (count + 1)
+        digits = []
+        for _ in range(width):
+            value, remainder = divmod(value, _BASE)
+            digits.append(DIGITS[remainder])
+        keys.append("".join(reversed(digits)).rstrip("0"))
+    return keys
+
+
+def _scope(workspace_id: uuid.UUID, project_id: uuid.UUID | None):
+    project_clause = Task.project_id.is_(None) if project_id is None else Task.project_id == project_id
+    return (Task.workspace_id == workspace_id, project_clause)
+
+
+async def next_rank(db: AsyncSession, workspace_id: uuid.UUID, project_id: uuid.UUID | None) -> str:
+    """Key that places a new task at the end of its project."""
+    result = await db.execute(select(Task.rank).where(*_scope(workspace_id, project_id)).order_by(
+        Task.rank.desc().nulls_last()
+    ).limit(1))
+    return key_between(result.scalar_one_or_none(), None)
+
+
+async def last_ranks(
+    db: AsyncSession,
+    workspace_id: uuid.UUID,
+    project_ids: set[uuid.UUID | None],
+) -> dict[uuid.UUID | None, str | None]:
+    """Highest key in each of several projects, in one grouped query."""
+    clauses = [Task.project_id.in_([pid for pid in project_ids if pid is not None])]
+    if None in project_ids:
+        clauses.append(Task.project_id.is_(None))
+    result = await db.execute(
+        select(Task.project_id, func.max(Task.rank))
+        .where(Task.workspace_id == workspace_id, or_(*clauses))
+        .group_by(Task.project_id)
+    )
+    ranks = dict.fromkeys(project_ids)
+    ranks.update({project_id: rank for project_id, rank in result.all()})
+    return ranks
+
+
+async def rebalance_ranks(
+    db: AsyncSession,
+    workspace_id: uuid.UUID,
+    project_id: uuid.UUID | None,
+) -> dict[uuid.UUID, str]:
+    """Re-spread every key in a project, keeping the current order.
+
+    Unranked tasks keep their ``sort_order`` position after the ranked ones.
+    """
+    result = await db.execute(
+        select(Task.id)
+        .where(*_scope(workspace_id, project_id))
+        .order_by(Task.rank.asc().nulls_last(), Task.sort_order, Task.created_at)
+    )
+    task_ids = list(result.scalars().all())
+    if not task_ids:
+        return {}
+    ranks = dict(zip(task_ids, even_keys(len(task_ids))))
+    await _write_ranks(db, ranks)
+    return ranks
+
+
+async def append_ranks(
+    db: AsyncSession,
+    workspace_id: uuid.UUID,
+    project_id: uuid.UUID | None,
+    task_ids: list[uuid.UUID],
+) -> dict[uuid.UUID, str]:
+    """Key tasks joining a project so they follow its last task, in the given order.
+
+    Call it before the tasks move, so their old keys don't count as the end.
+    """
+    rank = (await last_ranks(db, workspace_id, {project_id}))[project_id]
+    ranks = {}
+    for task_id in task_ids:
+        rank = key_between(rank, None)
+        ranks[task_id] = rank
+    await _write_ranks(db, ranks)
+    return ranks
+
+
+async def _write_ranks(db: AsyncSession, ranks: dict[uuid.UUID, str]) -> None:
+    if not ranks:
+        return
+    new_rank = values(
+        column("id", UUID(as_uuid=True)),
+        column("rank", String),
+        name="new_rank",
+    ).data(list(ranks.items()))
+    await db.execute(
+        update(Task)
+        .where(Task.id == new_rank.c.id)
+        .values(rank=new_rank.c.rank)
+        .execution_options(synchronize_session=False)
+    )
+
+
+async def rebalance_in_background(workspace_id: uuid.UUID, project_id: uuid.UUID | None) -> None:
+    """Rebalance a project in its own session, then broadcast the new keys."""
+    try:
+        async with async_session() as db:
+            ranks = await rebalance_ranks(db, workspace_id, project_id)
+            publish(db, DomainEvent(
+                name="tasks.reordered",
+                workspace_id=workspace_id,
+                payload={"items": [{"id": str(task_id), "rank": rank} for task_id, rank in ranks.items()]},
+            ))
+            await db.commit()
+    except Exception:
+        logger.exception("Rank rebalance failed for project %s", project_id)
@@ -0,0 +1,199 @@
+"""
+Cache for read endpoints whose data rarely changes (projects, members, teams,
+custom fields, templates, tags, rotas).
+
+``@cached_response`` keeps the serialised JSON body of an endpoint, keyed by
+the endpoint and its scalar arguments and stamped with the current version of
+each of its tags, e.g. ``workspace:{workspace_id}:projects``. Write endpoints
+call ``invalidate_tags`` after committing, which bumps those versions so every
+entry stamped with an older one becomes a miss — nothing needs to know which
+keys were cached. Entries also expire after ``response_cache_ttl``. Every
+response carries an ETag of its body, so clients holding the current version
+get a 304 without the body being sent again.
+
+Bodies are shared by everyone who passes the route's dependencies, so only
+cache endpoints whose output doesn't depend on the caller. With the
+in-process backend an invalidation only reaches the current worker; use
+``response_cache_backend=redis`` when running several.
+"""
+import functools
+import inspect
+import logging
+import time
+import uuid
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Sequence
+from typing import Any, Protocol
+from urllib.parse import urlencode
+
+from fastapi import Request, Response
+from pydantic import TypeAdapter
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from app.config import settings
+from app.metrics import RESPONSE_CACHE_LOOKUPS
+from app.utils.etag import is_fresh, make_etag, not_modified
+
+logger = logging.getLogger(__name__)
+
+# Endpoint arguments of these types vary the cache key; sessions and users don't
+_KEY_TYPES = (str, int, float, uuid.UUID)
+
+
+class ResponseCacheBackend(Protocol):
+    async def get(self, key: str, tags: Sequence[str]) -> tuple[bytes | None, tuple[int, ...]]:
+        """The body for ``key`` if it is still current, and the tags' versions."""
+        ...
+
+    async def set(self, key: str, body: bytes, versions: tuple[int, ...]) -> None: ...
+    async def invalidate(self, *tags: str) -> None: ...
+
+
+class MemoryResponseCache:
+    """Per-process entries, LRU-bounded."""
+
+    def __init__(self, ttl: float, max_entries: int = 10_000):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[float, tuple[int, ...], bytes]] = OrderedDict()
+        self._versions: dict[str, int] = {}
+
+    async def get(self, key: str, tags: Sequence[str]) -> tuple[bytes | None, tuple[int, ...]]:
+        versions = tuple(self._versions.get(tag, 0) for tag in tags)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None, versions
+        expires, stamp, body = entry
+        if expires < time.monotonic() or stamp != versions:
+            del self._entries[key]
+            return None, versions
+        self._entries.move_to_end(key)
+        return body, versions
+
+    async def set(self, key: str, body: bytes, versions: tuple[int, ...]) -> None:
+        self._entries[key] = (time.monotonic() + self.ttl, versions, body)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def invalidate(self, *tags: str) -> None:
+        for tag in tags:
+            self._versions[tag] = self._versions.get(tag, 0) + 1
+
+
+class RedisResponseCache:
+    """Entries shared by all workers. A lookup is one MGET of the entry and its
+    tag versions; read and write errors count as misses."""
+
+    def __init__(self, client: Redis, ttl: float, prefix: str = "response:"):
+        self.client = client
+        self.ttl = ttl
+        self.prefix = prefix
+
+    async def get(self, key: str, tags: Sequence[str]) -> tuple[bytes | None, tuple[int, ...]]:
+        try:
+            raw, *raw_versions = await self.client.mget(
+                self.prefix + key, *(f"{self.prefix}tag:{tag}" for tag in tags)
+            )
+        except RedisError as exc:
+            logger.warning("Response cache read failed: %s", exc)
+            return None, ()
+        versions = tuple(int(v or 0) for v in raw_versions)
+        if raw is None:
+            return None, versions
+        stamp, _, body = raw.partition(b"\n")
+        if stamp != _stamp(versions):
+            return None, versions
+        return body, versions
+
+    async def set(self, key: str, body: bytes, versions: tuple[int, ...]) -> None:
+        try:
+            await self.client.set(self.prefix + key, _stamp(versions) + b"\n" + body, ex=round(self.ttl))
+        except RedisError as exc:
+            logger.warning("Response cache write failed: %s", exc)
+
+    async def invalidate(self, *tags: str) -> None:
+        if not tags:
+            return
+        # Not swallowed: a lost invalidation would serve stale data until the TTL
+        async with self.client.pipeline(transaction=False) as pipe:
+            for tag in tags:
+                pipe.incr(f"{self.prefix}tag:{tag}")
+            await pipe.execute()
+
+
+def _stamp(versions: tuple[int, ...]) -> bytes:
+    return ",".join(map(str, versions)).encode()
+
+
+def backend_from_settings() -> ResponseCacheBackend:
+    if settings.response_cache_backend == "redis":
+        return RedisResponseCache(Redis.from_url(settings.redis_url), settings.response_cache_ttl)
+    return MemoryResponseCache(settings.response_cache_ttl)
+
+
+response_cache = backend_from_settings()
+
+
+async def cached_body(
+    name: str, key: str, tags: Sequence[str], render: Callable[[], Awaitable[bytes]]
+) -> bytes:
+    """The body cached under ``key``, or else ``render()``'s, which is cached
+    until one of ``tags`` is invalidated. ``name`` labels the hit/miss metric."""
+    body, versions = await response_cache.get(key, tags)
+    if body is not None:
+        RESPONSE_CACHE_LOOKUPS.labels(name, "hit").inc()
+        return body
+
+    RESPONSE_CACHE_LOOKUPS.labels(name, "miss").inc()
+    body = await render()
+    # Stamped with the versions read before rendering, so a write that lands
+    # meanwhile leaves this entry already stale
+    if len(versions) == len(tags):
+        await response_cache.set(key, body, versions)
+    return body
+
+
+def json_response(request: Request, body: bytes) -> Response:
+    """``body`` with an ETag, or a 304 when the client already has it."""
+    etag = make_etag(body)
+    if is_fresh(request, etag):
+        return not_modified(etag)
+    return Response(body, media_type="application/json", headers={"ETag": etag})
+
+
+def cached_response(response_model: Any, *tags: str):
+    """Serve the endpoint's JSON body from the cache until one of ``tags`` is
+    invalidated. Tags are formatted with the endpoint's arguments."""
+    adapter = TypeAdapter(response_model)
+
+    def decorator(endpoint: Callable[..., Awaitable[Any]]):
+        name = f"{endpoint.__module__.rsplit('.', 1)[-1]}.{endpoint.__name__}"
+
+        @functools.wraps(endpoint)
+        async def wrapper(request: Request, **kwargs):
+            args = sorted((k, str(v)) for k, v in kwargs.items() if isinstance(v, _KEY_TYPES))
+
+            async def render() -> bytes:
+                result = await endpoint(**kwargs)
+                return adapter.dump_json(adapter.validate_python(result, from_attributes=True), by_alias=True)
+
+            body = await cached_body(
+                name, f"{name}?{urlencode(args)}", [tag.format(**kwargs) for tag in tags], render
+            )
+            return json_response(request, body)
+
+        # FastAPI reads the endpoint's own parameters, plus the request we need
+        signature = inspect.signature(endpoint)
+        request_param = inspect.Parameter("request", inspect.Parameter.KEYWORD_ONLY, annotation=Request)
+        wrapper.__signature__ = signature.replace(
+            parameters=[*signature.parameters.values(), request_param]
+        )
+        return wrapper
+
+    return decorator
+
+
+async def invalidate_tags(*tags: str) -> None:
+    await response_cache.invalidate(*tags)
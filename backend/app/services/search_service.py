@@ -0,0 +1,151 @@
+"""Task full-text search and the global quick search.
+
+Task search uses the generated ``search_vector`` columns with the 'simple'
+configuration (no stemming) so prefix queries behave predictably while the
+user is still typing. Quick search matches entity names through ``pg_trgm``
+GIN indexes, which serve ``ILIKE '%...%'`` without a sequential scan.
+"""
+import re
+import uuid
+
+from sqlalchemy import String, func, literal, null, select, union, union_all
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.client import Client
+from app.models.comment import Comment
+from app.models.project import Project
+from app.models.task import Task
+from app.models.team import Team
+from app.models.user import User
+
+# Not mapped on Task (see the model), so queried through the table
+_TASK_VECTOR = Task.__table__.c.search_vector
+
+_WORD_RE = re.compile(r"[^\W_]+")
+_MAX_TERMS = 8
+_HEADLINE_OPTIONS = "StartSel=<mark>, StopSel=</mark>, MaxFragments=2, MaxWords=20, MinWords=5"
+
+
+def prefix_tsquery(text: str):
+    """Turn free text into an AND-ed prefix tsquery, or None if it has no words."""
+    terms = _WORD_RE.findall(text.lower())[:_MAX_TERMS]
+    if not terms:
+        return None
+    return func.to_tsquery("simple", " & ".join(f"{term}:*" for term in terms))
+
+
+def task_search_filter(text: str):
+    """WHERE clause for the ``search`` parameter on task list endpoints."""
+    ts_query = prefix_tsquery(text)
+    if ts_query is None:
+        # Punctuation-only input has no lexemes; fall back to a substring match
+        return Task.name.ilike(f"%{text}%")
+    return _TASK_VECTOR.op("@@")(ts_query)
+
+
+async def search_tasks(
+    db: AsyncSession,
+    workspace_id: uuid.UUID,
+    text: str,
+    *,
+    limit: int = 20,
+    include_comments: bool = True,
+) -> list[dict]:
+    ts_query = prefix_tsquery(text)
+    if ts_query is None:
+        return []
+
+    hits = select(Task.id).where(Task.workspace_id == workspace_id, _TASK_VECTOR.op("@@")(ts_query))
+    if include_comments:
+        comment_hits = (
+            select(Comment.task_id)
+            .join(Task, Task.id == Comment.task_id)
+            .where(Task.workspace_id == workspace_id, Comment.search_vector.op("@@")(ts_query))
+        )
+        hits = union(hits, comment_hits)
+    hit_ids = hits.subquery()
+
+    # Rank and limit first so ts_headline only runs on the returned page
+    rank = func.ts_rank_cd(_TASK_VECTOR, ts_query)
+    ranked = (
+        select(Task.id, rank.label("rank"))
+        .where(Task.id.in_(select(hit_ids.c[0])))
+        .order_by(rank.desc(), Task.updated_at.desc())
+        .limit(limit)
+        .subquery()
+    )
+    query = (
+        select(
+            Task.id,
+            Task.name,
+            Task.status,
+            Task.colour,
+            Task.project_id,
+            Task.date_from,
+            Task.date_to,
+            ranked.c.rank,
+            func.ts_headline(
+                "simple", Task.name, ts_query, "HighlightAll=true, StartSel=<mark>, StopSel=</mark>"
+            ).label("name_highlight"),
+            func.ts_headline(
+                "simple", func.coalesce(Task.description, ""), ts_query, _HEADLINE_OPTIONS
+            ).label("description_highlight"),
+        )
+        .join(ranked, ranked.c.id == Task.id)
+        .order_by(ranked.c.rank.desc(), Task.updated_at.desc())
+    )
+    result = await db.execute(query)
+    return [dict(row) for row in result.mappings().all()]
+
+
+def _escape_like(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+async def quick_search(
+    db: AsyncSession,
+    workspace_id: uuid.UUID,
+    text: str,
+    *,
+    limit: int = 5,
+) -> dict[str, list[dict]]:
+    """Top ``limit`` name matches per entity type, fetched in one UNION ALL.
+
+    Blank text matches nothing rather than everything.
+    """
+    sources = [
+        ("tasks", Task, Task.colour, Task.project_id),
+        ("projects", Project, Project.colour, None),
+        ("teams", Team, None, None),
+        ("users", User, User.colour, None),
+        ("clients", Client, None, None),
+    ]
+    grouped: dict[str, list[dict]] = {entity_type: [] for entity_type, *_ in sources}
+    text = text.strip()
+    if not text:
+        return grouped
+
+    pattern = f"%{_escape_like(text)}%"
+    selects = []
+    for entity_type, model, colour, project_id in sources:
+        score = func.similarity(model.name, text)
+        selects.append(
+            select(
+                literal(entity_type).label("entity_type"),
+                model.id,
+                model.name,
+                (colour if colour is not None else null().cast(String)).label("colour"),
+                (project_id if project_id is not None else null().cast(UUID(as_uuid=True))).label("project_id"),
+                score.label("score"),
+            )
+            .where(model.workspace_id == workspace_id, model.name.ilike(pattern, escape="\\"))
+            .order_by(score.desc(), model.name)
+            .limit(limit)
+        )
+
+    result = await db.execute(union_all(*selects))
+    for row in result.mappings().all():
+        hit = dict(row)
+        grouped[hit.pop("entity_type")].append(hit)
+    return grouped
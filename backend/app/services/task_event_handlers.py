@@ -0,0 +1,106 @@
+"""Side effects of task writes, run by the domain event dispatcher after commit."""
+import asyncio
+import uuid
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.task import Task
+from app.schemas.task import TaskResponse
+from app.services.domain_events import DomainEvent, dispatcher
+from app.services.email_service import send_task_assigned_email
+from app.services.notification_service import create_notification, notify_task_assigned
+from app.services.task_query_service import task_response_query
+from app.services.webhook_service import deliver_webhooks, subscribed_webhooks
+from app.utils.serialization import Encoded
+from app.websocket.events import emit_event
+
+WEBHOOK_EVENTS = (
+    "task.created",
+    "task.updated",
+    "task.deleted",
+    "task.moved",
+    "tasks.bulk_created",
+    "tasks.bulk_updated",
+)
+BROADCAST_EVENTS = (*WEBHOOK_EVENTS, "tasks.reordered")
+
+
+@dispatcher.on(*BROADCAST_EVENTS)
+async def broadcast_task_event(db: AsyncSession, event: DomainEvent) -> None:
+    await emit_event(str(event.workspace_id), event.name, {
+        **event.payload,
+        "actor_id": str(event.actor_id) if event.actor_id else None,
+    })
+
+
+@dispatcher.on(*WEBHOOK_EVENTS)
+async def deliver_task_webhooks(db: AsyncSession, event: DomainEvent) -> None:
+    # Webhooks for a single task carry the task itself, as they always have,
+    # rather than the {"task": ...} envelope WebSocket clients get
+    payload = event.payload.get("task", event.payload)
+    await deliver_webhooks(db, event.workspace_id, event.name, payload)
+
+
+@dispatcher.on("tasks.bulk_updated")
+async def deliver_bulk_update_task_webhooks(db: AsyncSession, event: DomainEvent) -> None:
+    # Bulk edits used to send task.updated for every task; existing
+    # subscribers to it still get those alongside tasks.bulk_updated
+    webhooks = await subscribed_webhooks(db, event.workspace_id, "task.updated")
+    if not webhooks or not event.payload["task_ids"]:
+        return
+    task_ids = [uuid.UUID(task_id) for task_id in event.payload["task_ids"]]
+    result = await db.execute(task_response_query(event.workspace_id).where(Task.id.in_(task_ids)))
+    for task in result.scalars().unique().all():
+        payload = Encoded(TaskResponse.model_validate(task))
+        await deliver_webhooks(db, event.workspace_id, "task.updated", payload, webhooks)
+
+
+@dispatcher.on("task.created", "task.updated")
+async def notify_new_assignees(db: AsyncSession, event: DomainEvent) -> None:
+    task: TaskResponse = event.payload["task"].model
+    new_ids = {uid for uid in event.new_assignee_ids if uid != event.actor_id}
+    if not new_ids:
+        return
+
+    for uid in new_ids:
+        await notify_task_assigned(
+            db, workspace_id=event.workspace_id, task_id=task.id,
+            task_name=task.name, assignee_id=uid,
+            actor_id=event.actor_id, actor_name=event.actor_name,
+        )
+    await db.commit()
+
+    for assignee in task.assignees:
+        if assignee.id in new_ids and assignee.email:
+            await asyncio.to_thread(
+                send_task_assigned_email,
+                assignee.email, task.name, event.actor_name,
+            )
+
+
+@dispatcher.on("tasks.bulk_created")
+async def notify_bulk_assignees(db: AsyncSession, event: DomainEvent) -> None:
+    # One notification per assignee rather than one per task
+    assigned: dict[uuid.UUID, list[TaskResponse]] = {}
+    for snapshot in event.payload["tasks"]:
+        for assignee in snapshot.model.assignees:
+            if assignee.id != event.actor_id:
+                assigned.setdefault(assignee.id, []).append(snapshot.model)
+    if not assigned:
+        return
+
+    for uid, tasks in assigned.items():
+        if len(tasks) == 1:
+            await notify_task_assigned(
+                db, workspace_id=event.workspace_id, task_id=tasks[0].id,
+                task_name=tasks[0].name, assignee_id=uid,
+                actor_id=event.actor_id, actor_name=event.actor_name,
+            )
+        else:
+            await create_notification(
+                db, user_id=uid, workspace_id=event.workspace_id,
+                event_type="task.assigned",
+                title=f"{event.actor_name} assigned you to {len(tasks)} tasks",
+                actor_id=event.actor_id,
+            )
+    await db.commit()
@@ -0,0 +1,163 @@
+"""Column-level task projections for list-style endpoints.
+
+The full ``TaskResponse`` needs five relationship loads per query. Boards and
+timelines only draw a handful of columns, so the summary projection selects
+those directly and aggregates assignee/tag ids and checklist counts in SQL —
+one round-trip, no ORM identity map. The normalised envelope keeps the full
+task shape but side-loads users, projects and tags once per response.
+
+List endpoints declare a union of these shapes as their response model, which
+FastAPI validates ORM rows against member by member. Full-view lists are
+converted with ``task_responses`` first: instances of the union's first member
+match it outright. Summary rows stay dicts, which validate faster than models
+of a later member would.
+"""
+import uuid
+
+from pydantic import TypeAdapter
+from sqlalchemy import Select, func, select
+from sqlalchemy.dialects.postgresql import ARRAY, UUID
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from app.models.checklist import Checklist
+from app.models.project import Project
+from app.models.tag import Tag
+from app.models.task import Task, task_assignees, task_tags
+from app.models.user import User
+from app.schemas.task import (
+    ProjectBrief,
+    TagBrief,
+    TaskListNormalised,
+    TaskNormalised,
+    TaskResponse,
+)
+from app.schemas.user import UserResponse
+from app.utils.etag import row_count_and_newest
+
+_UUID_ARRAY = ARRAY(UUID(as_uuid=True))
+
+_TASK_RESPONSES = TypeAdapter(list[TaskResponse])
+
+
+def _id_array(column, task_column):
+    return func.array(
+        select(column).where(task_column == Task.id).correlate(Task).scalar_subquery(),
+        type_=_UUID_ARRAY,
+    )
+
+
+def task_response_query(workspace_id: uuid.UUID) -> Select:
+    """Select the workspace's tasks with everything ``TaskResponse`` embeds."""
+    return (
+        select(Task)
+        .where(Task.workspace_id == workspace_id)
+        .options(
+            selectinload(Task.assignees),
+            selectinload(Task.tags),
+            selectinload(Task.checklists),
+            selectinload(Task.project),
+            selectinload(Task.subtasks),
+        )
+    )
+
+
+def task_summary_query(workspace_id: uuid.UUID) -> Select:
+    """Select the columns of ``TaskSummary`` for every task in a workspace.
+
+    Filters and ordering written against ``Task`` columns apply unchanged, so
+    callers can swap this in for the relationship-loading query.
+    """
+    checklist_total = (
+        select(func.count(Checklist.id))
+        .where(Checklist.task_id == Task.id)
+        .correlate(Task)
+        .scalar_subquery()
+    )
+    checklist_done = (
+        select(func.count(Checklist.id))
+        .where(Checklist.task_id == Task.id, Checklist.is_completed.is_(True))
+        .correlate(Task)
+        .scalar_subquery()
+    )
+    subtask = Task.__table__.alias("subtask")
+    subtask_count = (
+        select(func.count(subtask.c.id))
+        .where(subtask.c.parent_id == Task.id)
+        .correlate(Task)
+        .scalar_subquery()
+    )
+    return select(
+        Task.id,
+        Task.name,
+        Task.colour,
+        Task.status,
+        Task.status_emoji,
+        Task.date_from,
+        Task.date_to,
+        Task.start_time,
+        Task.end_time,
+        Task.sort_order,
+        Task.rank,
+        Task.project_id,
+        Task.segment_id,
+        Task.parent_id,
+        Task.updated_at,
+        _id_array(task_assignees.c.user_id, task_assignees.c.task_id).label("assignee_ids"),
+        _id_array(task_tags.c.tag_id, task_tags.c.task_id).label("tag_ids"),
+        checklist_total.label("checklist_total"),
+        checklist_done.label("checklist_done"),
+        subtask_count.label("subtask_count"),
+    ).where(Task.workspace_id == workspace_id)
+
+
+def task_list_scopes(workspace_id: uuid.UUID, *criteria) -> list[Select]:
+    """ETag scopes for a list of the workspace's tasks matching ``criteria``.
+
+    Tasks are touched whenever their assignees, tags, checklists or subtasks
+    change, but the users, projects and tags embedded in each task can be
+    edited on their own, so those count too.
+    """
+    workspace_projects = select(Project.id).where(Project.workspace_id == workspace_id)
+    return [
+        row_count_and_newest(Task, Task.workspace_id == workspace_id, *criteria),
+        row_count_and_newest(User, User.workspace_id == workspace_id),
+        row_count_and_newest(Project, Project.workspace_id == workspace_id),
+        row_count_and_newest(Tag, Tag.project_id.in_(workspace_projects)),
+    ]
+
+
+async def fetch_task_summaries(db: AsyncSession, query: Select) -> list[dict]:
+    result = await db.execute(query)
+    return [dict(row) for row in result.mappings().all()]
+
+
+def task_responses(tasks) -> list[TaskResponse]:
+    """Relationship-loaded tasks as ``TaskResponse`` models."""
+    return _TASK_RESPONSES.validate_python(tasks, from_attributes=True)
+
+
+def normalise_tasks(tasks) -> TaskListNormalised:
+    """Build a ``TaskListNormalised`` envelope from relationship-loaded tasks.
+
+    Each user, project and tag is validated once no matter how many tasks
+    reference it.
+    """
+    users: dict[uuid.UUID, UserResponse] = {}
+    projects: dict[uuid.UUID, ProjectBrief] = {}
+    tags: dict[uuid.UUID, TagBrief] = {}
+    items = []
+    for task in tasks:
+        item = TaskNormalised.model_validate(task)
+        item.assignee_ids = [a.id for a in task.assignees]
+        item.tag_ids = [t.id for t in task.tags]
+        for assignee in task.assignees:
+            if assignee.id not in users:
+                users[assignee.id] = UserResponse.model_validate(assignee)
+        for tag in task.tags:
+            if tag.id not in tags:
+                tags[tag.id] = TagBrief.model_validate(tag)
+        if task.project is not None and task.project.id not in projects:
+            projects[task.project.id] = ProjectBrief.model_validate(task.project)
+        items.append(item)
+    return TaskListNormalised(tasks=items, users=users, projects=projects, tags=tags)
@@ -0,0 +1,130 @@
+"""Delta sync support — opaque change cursors and deletion tombstones.
+
+A cursor encodes the ``(updated_at, id)`` position of the last change a client
+has seen. Tasks and tombstones are both ordered by that pair, so one cursor
+covers edits and deletions.
+
+``updated_at`` is the writing transaction's start time, not its commit time,
+so a slow transaction can commit rows behind a cursor already handed out. The
+last page's cursor therefore never passes ``sync_horizon``: recent changes are
+sent again next time rather than risk skipping one. Tombstones are pruned after
+``task_tombstone_retention_days``; cursors older than that can no longer see
+every deletion and have to start over.
+"""
+import asyncio
+import base64
+import logging
+import uuid
+from datetime import datetime, timedelta
+
+from sqlalchemy import delete, func, literal, select, tuple_, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.database import async_session
+from app.models.task import Task
+from app.models.task_tombstone import TaskTombstone
+
+logger = logging.getLogger(__name__)
+
+SYNC_LAG = timedelta(seconds=settings.sync_cursor_lag_seconds)
+TOMBSTONE_RETENTION = timedelta(days=settings.task_tombstone_retention_days)
+TOMBSTONE_PRUNE_INTERVAL = 3600  # seconds
+
+
+def encode_cursor(changed_at: datetime, entity_id: uuid.UUID) -> str:
+    raw = f"{changed_at.isoformat()}|{entity_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, uuid.UUID]:
+    """Parse a cursor from ``encode_cursor``. Raises ValueError if malformed."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        changed_at, entity_id = base64.urlsafe_b64decode(padded).decode().split("|", 1)
+        return datetime.fromisoformat(changed_at), uuid.UUID(entity_id)
+    except (UnicodeDecodeError, ValueError) as exc:
+        raise ValueError("Invalid sync cursor") from exc
+
+
+async def record_task_deletion(
+    db: AsyncSession,
+    workspace_id: uuid.UUID,
+    task_id: uuid.UUID,
+) -> None:
+    """Write tombstones for a task and every subtask beneath it.
+
+    Must run before the delete, while the subtask rows still exist.
+    """
+    tree = (
+        select(Task.id)
+        .where(Task.id == task_id, Task.workspace_id == workspace_id)
+        .cte("task_tree", recursive=True)
+    )
+    tree = tree.union_all(select(Task.id).where(Task.parent_id == tree.c.id))
+    await db.execute(
+        insert(TaskTombstone)
+        .from_select(["task_id", "workspace_id"], select(tree.c.id, literal(workspace_id)))
+        .on_conflict_do_nothing()
+    )
+
+
+async def fetch_tombstones(
+    db: AsyncSession,
+    workspace_id: uuid.UUID,
+    after: tuple[datetime, uuid.UUID] | None,
+    limit: int,
+) -> list[TaskTombstone]:
+    query = select(TaskTombstone).where(TaskTombstone.workspace_id == workspace_id)
+    if after:
+        query = query.where(tuple_(TaskTombstone.deleted_at, TaskTombstone.task_id) > tuple_(*after))
+    query = query.order_by(TaskTombstone.deleted_at, TaskTombstone.task_id).limit(limit)
+    result = await db.execute(query)
+    return list(result.scalars().all())
+
+
+def sync_horizon(now: datetime) -> tuple[datetime, uuid.UUID]:
+    """The furthest a final cursor may go: every transaction that could still
+    commit changes before it is assumed to have done so."""
+    return now - SYNC_LAG, uuid.UUID(int=0)
+
+
+def cursor_expired(after: tuple[datetime, uuid.UUID], now: datetime) -> bool:
+    """Whether tombstones a client at ``after`` still needs may have been pruned."""
+    return after[0] < now - TOMBSTONE_RETENTION
+
+
+async def touch_tasks(db: AsyncSession, *criteria) -> None:
+    """Bump updated_at on the tasks matching ``criteria``.
+
+    For changes that don't write the task row itself — its checklists or
+    subtasks changing, or the database acting on its behalf (a ``SET NULL``,
+    an association row cascading away) — which would otherwise stay
+    invisible to delta sync. Run it before any delete that causes them.
+    """
+    await db.execute(
+        update(Task)
+        .where(*criteria)
+        .values(updated_at=func.now())
+        .execution_options(synchronize_session=False)
+    )
+
+
+async def prune_tombstones() -> None:
+    async with async_session() as db:
+        result = await db.execute(
+            delete(TaskTombstone).where(TaskTombstone.deleted_at < func.now() - TOMBSTONE_RETENTION)
+        )
+        await db.commit()
+    if result.rowcount:
+        logger.info("Pruned %d task tombstones", result.rowcount)
+
+
+async def prune_tombstones_periodically() -> None:
+    while True:
+        try:
+            await prune_tombstones()
+        except Exception:
+            logger.exception("Failed to prune task tombstones")
+        await asyncio.sleep(TOMBSTONE_PRUNE_INTERVAL)
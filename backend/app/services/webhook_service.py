@@ -1,42 +1,50 @@
 """Webhook delivery service — fires HTTP POST to registered webhook URLs."""
 import hashlib
 import hmac
-import json
 import logging
+import time
 import uuid
 
 import httpx
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.metrics import WEBHOOK_DELIVERIES, WEBHOOK_LATENCY
 from app.models.webhook import Webhook, WebhookLog
+from app.utils.serialization import Encoded, dumps
 
 logger = logging.getLogger(__name__)
 
 
-async def deliver_webhooks(
-    db: AsyncSession,
-    workspace_id: uuid.UUID,
-    event: str,
-    payload: dict,
-) -> None:
+async def subscribed_webhooks(db: AsyncSession, workspace_id: uuid.UUID, event: str) -> list[Webhook]:
+    """Active webhooks of the workspace that want ``event``."""
     result = await db.execute(
         select(Webhook).where(
             Webhook.workspace_id == workspace_id,
             Webhook.is_active == True,  # noqa: E712
         )
     )
-    webhooks = result.scalars().all()
+    return [wh for wh in result.scalars().all() if not wh.events or event in wh.events]
 
-    for wh in webhooks:
-        if wh.events and event not in wh.events:
-            continue
 
-        body = json.dumps({"event": event, "payload": payload}, default=str)
+async def deliver_webhooks(
+    db: AsyncSession,
+    workspace_id: uuid.UUID,
+    event: str,
+    payload: dict | Encoded,
+    webhooks: list[Webhook] | None = None,
+) -> None:
+    if webhooks is None:
+        webhooks = await subscribed_webhooks(db, workspace_id, event)
+    if not webhooks:
+        return
+    body = dumps({"event": event, "payload": payload})
+
+    for wh in webhooks:
         headers = {"Content-Type": "application/json"}
 
         if wh.secret:
-            sig = hmac.new(wh.secret.encode(), body.encode(), hashlib.sha256).hexdigest()
+            sig = hmac.new(wh.secret.encode(), body, hashlib.sha256).hexdigest()
             headers["X-Webhook-Signature"] = sig
 
         log = WebhookLog(
@@ -45,17 +53,21 @@ async def deliver_webhooks(
             payload=payload,
         )
 
+        start = time.perf_counter()
         try:
             async with httpx.AsyncClient(timeout=10.0) as client:
                 resp = await client.post(wh.url, content=body, headers=headers)
                 log.response_status = resp.status_code
                 log.response_body = resp.text[:2000] if resp.text else None
                 log.success = 200 <= resp.status_code < 300
+            WEBHOOK_DELIVERIES.labels("success" if log.success else "http_error").inc()
         except Exception as exc:
             logger.warning("Webhook delivery failed for %s: %s", wh.url, exc)
             log.response_status = 0
             log.response_body = str(exc)[:2000]
             log.success = False
+            WEBHOOK_DELIVERIES.labels("error").inc()
+        WEBHOOK_LATENCY.observe(time.perf_counter() - start)
 
         db.add(log)
 
@@ -1,7 +1,11 @@
+import asyncio
+import time
 import uuid
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError, jwt
 from passlib.context import CryptContext
@@ -10,18 +14,63 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import settings
 from app.database import get_db
+from app.metrics import (
+    PASSWORD_HASH_IN_FLIGHT,
+    PASSWORD_HASH_LATENCY,
+    PASSWORD_HASH_REJECTIONS,
+)
+from app.models.project import Project
+from app.models.task import Task
 from app.models.user import User
+from app.services.api_token_service import (
+    API_TOKEN_PREFIX,
+    mark_used,
+    resolve_api_token,
+)
+from app.services.principal_cache import load_principal
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login")
 
 
-def hash_password(password: str) -> str:
-    return pwd_context.hash(password)
+# bcrypt releases the GIL, so a few threads hash in parallel without blocking
+# the event loop (and every request and WebSocket on this worker with it)
+_hash_pool = ThreadPoolExecutor(settings.password_hash_workers, thread_name_prefix="bcrypt")
+_hash_in_flight = 0
 
 
-def verify_password(plain: str, hashed: str) -> bool:
-    return pwd_context.verify(plain, hashed)
+def _timed(op: str, fn: Callable, *args):
+    start = time.perf_counter()
+    try:
+        return fn(*args)
+    finally:
+        PASSWORD_HASH_LATENCY.labels(op).observe(time.perf_counter() - start)
+
+
+async def _run_in_hash_pool(op: str, fn: Callable, *args):
+    global _hash_in_flight
+    if _hash_in_flight >= settings.password_hash_workers + settings.password_hash_queue:
+        PASSWORD_HASH_REJECTIONS.inc()
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Server busy, please try again",
+            headers={"Retry-After": "1"},
+        )
+    _hash_in_flight += 1
+    PASSWORD_HASH_IN_FLIGHT.inc()
+    try:
+        return await asyncio.get_running_loop().run_in_executor(_hash_pool, _timed, op, fn, *args)
+    finally:
+        _hash_in_flight -= 1
+        PASSWORD_HASH_IN_FLIGHT.dec()
+
+
+async def hash_password(password: str) -> str:
+    return await _run_in_hash_pool("hash", pwd_context.hash, password)
+
+
+async def verify_password(plain: str, hashed: str) -> bool:
+    return await _run_in_hash_pool("verify", pwd_context.verify, plain, hashed)
 
 
 def create_access_token(user_id: uuid.UUID) -> str:
@@ -47,10 +96,8 @@ def decode_token(token: str) -> dict:
         )
 
 
-async def get_current_user(
-    token: str = Depends(oauth2_scheme),
-    db: AsyncSession = Depends(get_db),
-) -> User:
+async def authenticate_token(db: AsyncSession, token: str) -> User:
+    """The user an access token belongs to; raises 401 if there isn't one."""
     payload = decode_token(token)
     if payload.get("type") != "access":
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token type")
@@ -58,8 +105,98 @@ async def get_current_user(
     if user_id is None:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token")
 
-    result = await db.execute(select(User).where(User.id == uuid.UUID(user_id)))
-    user = result.scalar_one_or_none()
+    user = await load_principal(db, uuid.UUID(user_id))
     if user is None:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found")
     return user
+
+
+async def authenticate_api_token(db: AsyncSession, token: str, method: str) -> User:
+    """The owner of a personal API token, if its scopes allow ``method``."""
+    api_token = await resolve_api_token(db, token)
+    if api_token is None or api_token.expired:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid or expired token",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    if method not in ("GET", "HEAD", "OPTIONS") and "write" not in api_token.scopes:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="This API token is read-only")
+
+    user = await load_principal(db, api_token.user_id)
+    if user is None or user.workspace_id != api_token.workspace_id:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found")
+    mark_used(api_token.id)
+    return user
+
+
+async def get_current_user(
+    request: Request,
+    token: str = Depends(oauth2_scheme),
+    db: AsyncSession = Depends(get_db),
+) -> User:
+    if token.startswith(API_TOKEN_PREFIX):
+        return await authenticate_api_token(db, token, request.method)
+    return await authenticate_token(db, token)
+
+
+async def get_session_user(
+    token: str = Depends(oauth2_scheme),
+    current_user: User = Depends(get_current_user),
+) -> User:
+    """The current user, provided they signed in rather than sent an API token.
+
+    For managing tokens and account security, so a leaked token can't mint
+    itself a permanent successor or lock its owner out.
+    """
+    if token.startswith(API_TOKEN_PREFIX):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="API tokens can't be used for this; sign in instead",
+        )
+    return current_user
+
+
+async def get_workspace_member(
+    workspace_id: uuid.UUID,
+    current_user: User = Depends(get_current_user),
+) -> User:
+    """The current user, provided they belong to the workspace in the path.
+
+    Membership and role come from the cached principal, so the check adds no
+    queries. Other workspaces get a 404 so their ids can't be probed.
+    """
+    if current_user.workspace_id != workspace_id:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Workspace not found")
+    return current_user
+
+
+async def get_workspace_task(
+    workspace_id: uuid.UUID,
+    task_id: uuid.UUID,
+    db: AsyncSession = Depends(get_db),
+) -> Task:
+    """The task in the path, provided it belongs to the workspace in the path.
+
+    Routes nested under a task (comments, attachments, checklists, field
+    values) look their rows up by task id alone, so this is what keeps them
+    inside the caller's workspace.
+    """
+    task = await db.scalar(select(Task).where(Task.id == task_id, Task.workspace_id == workspace_id))
+    if task is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Task not found")
+    return task
+
+
+async def get_workspace_project(
+    workspace_id: uuid.UUID,
+    project_id: uuid.UUID,
+    db: AsyncSession = Depends(get_db),
+) -> Project:
+    """The project in the path, provided it belongs to the workspace in the path."""
+    project = await db.scalar(
+        select(Project).where(Project.id == project_id, Project.workspace_id == workspace_id)
+    )
+    if project is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Project not found")
+    return project
@@ -0,0 +1,62 @@
+"""
+Conditional GET (ETag / If-None-Match) for list endpoints.
+
+An endpoint describes what its response depends on as a few cheap aggregate
+queries — usually ``row_count_and_newest`` over the same filters as the real
+query — and asks ``scope_etag`` for a validator before running the expensive
+one. When the client already holds that version, ``is_fresh`` says so and the
+endpoint returns ``not_modified`` instead of loading anything.
+"""
+import hashlib
+
+from fastapi import Request, Response
+from sqlalchemy import Select, func, select, true
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+
+
+def make_etag(*parts: object) -> str:
+    # Weak: equal tags mean the same data, not byte-identical bodies
+    digest = hashlib.blake2b(repr((settings.app_version, *parts)).encode(), digest_size=12).hexdigest()
+    return f'W/"{digest}"'
+
+
+def row_count_and_newest(model, *criteria) -> Select:
+    """Rows matching ``criteria``, their latest ``updated_at`` and the sum of
+    all of them.
+
+    ``updated_at`` is when the writing transaction started, so one that
+    commits late can change a row without moving the maximum; the sum still
+    changes. Deletions drop the count, so any change to the set shows up.
+    """
+    return select(
+        func.count(),
+        func.max(model.updated_at),
+        func.sum(func.extract("epoch", model.updated_at)),
+    ).select_from(model).where(*criteria)
+
+
+async def scope_etag(db: AsyncSession, request: Request, *scopes: Select) -> str:
+    """ETag for the request's URL over the current state of ``scopes``, read
+    in a single round trip. Each scope must return exactly one row."""
+    first, *rest = [scope.subquery() for scope in scopes]
+    query = select(first, *rest).select_from(first)
+    for subquery in rest:
+        query = query.join(subquery, true())  # one-row aggregates, so a cross join
+    row = (await db.execute(query)).one()
+    return make_etag(request.url.path, request.url.query, tuple(row))
+
+
+def is_fresh(request: Request, etag: str) -> bool:
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    # If-None-Match uses weak comparison, so W/ prefixes don't matter
+    return etag.removeprefix("W/") in {tag.strip().removeprefix("W/") for tag in header.split(",")}
+
+
+def not_modified(etag: str) -> Response:
+    return Response(status_code=304, headers={"ETag": etag})
@@ -0,0 +1,62 @@
+"""
+JSON encoding for payloads built outside FastAPI's response handling —
+WebSocket events, webhook bodies, batch envelopes, exports and JSON columns.
+
+Responses with a ``response_model`` are already written straight to bytes by
+Pydantic, so they don't come through here. orjson covers the rest: it encodes
+UUIDs, dates and datetimes natively, turns non-string keys into strings like
+``json.dumps`` and, for payloads, falls back to ``str`` for anything else
+(asyncpg's UUID subclass, Decimals), as ``json.dumps(default=str)`` did. JSON
+columns get no such fallback: an unknown type there is still an error.
+
+A write that sends the same model to several places wraps it in ``Encoded``
+once; both encoders embed those bytes verbatim wherever the wrapper appears.
+"""
+import uuid
+
+import orjson
+from fastapi import Response
+from pydantic import BaseModel
+
+
+class Encoded:
+    """A model together with its JSON, encoded once."""
+
+    __slots__ = ("json", "model")
+
+    def __init__(self, model: BaseModel):
+        self.model = model
+        self.json = model.model_dump_json().encode()
+
+
+def _default(value):
+    if isinstance(value, Encoded):
+        return orjson.Fragment(value.json)
+    return str(value)
+
+
+def _column_default(value):
+    if isinstance(value, Encoded):
+        return orjson.Fragment(value.json)
+    if isinstance(value, uuid.UUID):  # asyncpg's subclass; orjson only takes the exact type
+        return str(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(value, *, indent: bool = False) -> bytes:
+    option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+    return orjson.dumps(value, default=_default, option=option)
+
+
+def dumps_column(value) -> str:
+    """Encoder for JSON and JSONB columns, set on the engine."""
+    return orjson.dumps(value, default=_column_default, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+def encoded_response(value, status_code: int = 200) -> Response:
+    """``value`` as a JSON response, reusing the bytes of any ``Encoded`` in it.
+
+    Skips the route's ``response_model``, so the snapshot must already be of
+    that shape.
+    """
+    return Response(dumps(value), status_code=status_code, media_type="application/json")
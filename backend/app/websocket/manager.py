@@ -1,8 +1,10 @@
-import json
 from collections import defaultdict
 
 from fastapi import WebSocket
 
+from app.metrics import WS_CONNECTIONS, WS_WORKSPACES
+from app.utils.serialization import dumps
+
 
 class ConnectionManager:
     def __init__(self):
@@ -11,16 +13,27 @@ class ConnectionManager:
     async def connect(self, websocket: WebSocket, workspace_id: str):
         await websocket.accept()
         self.active_connections[workspace_id].append(websocket)
+        self._update_gauges()
 
     def disconnect(self, websocket: WebSocket, workspace_id: str):
-        self.active_connections[workspace_id] = [
-            ws for ws in self.active_connections[workspace_id] if ws is not websocket
+        remaining = [
+            ws for ws in self.active_connections.get(workspace_id, []) if ws is not websocket
         ]
+        if remaining:
+            self.active_connections[workspace_id] = remaining
+        else:
+            self.active_connections.pop(workspace_id, None)
+        self._update_gauges()
+
+    def _update_gauges(self):
+        WS_CONNECTIONS.set(sum(len(conns) for conns in self.active_connections.values()))
+        WS_WORKSPACES.set(len(self.active_connections))
 
     async def broadcast(self, workspace_id: str, event: dict, exclude: WebSocket | None = None):
-        message = json.dumps(event)
+        # Encoded once, however many sockets receive it
+        message = dumps(event).decode()
         dead = []
-        for ws in self.active_connections[workspace_id]:
+        for ws in self.active_connections.get(workspace_id, []):
             if ws is exclude:
                 continue
             try:
@@ -0,0 +1,91 @@
+"""
+Benchmark for concurrent logins.
+
+Fires a burst of logins at the app in-process while probing ``/health`` in the
+background, once with bcrypt running inline on the event loop (as it used to)
+and once through the password hashing pool. Prints logins/sec and the probe
+latency, which shows how long every other request on the worker was stalled.
+Registers a throwaway user, so point it at a development database.
+
+Usage:
+    cd backend
+    python -m bench_login [--logins 100] [--concurrency 20]
+"""
+import argparse
+import asyncio
+import logging
+import statistics
+import time
+import uuid
+
+import httpx
+
+from app.api import auth
+from app.main import app
+from app.middleware.rate_limit import RateLimitMiddleware
+from app.middleware.request_id import RequestIDMiddleware
+from app.utils.auth import pwd_context
+from bench_middleware import use_middleware
+
+
+async def verify_inline(plain: str, hashed: str) -> bool:
+    return pwd_context.verify(plain, hashed)
+
+
+async def probe(client: httpx.AsyncClient, latencies: list[float], stop: asyncio.Event):
+    while not stop.is_set():
+        start = time.perf_counter()
+        await client.get("/health")
+        latencies.append(time.perf_counter() - start)
+        await asyncio.sleep(0.01)
+
+
+async def storm(client: httpx.AsyncClient, credentials: dict, total: int, concurrency: int):
+    remaining = iter(range(total))
+    latencies: list[float] = []
+    stop = asyncio.Event()
+
+    async def worker():
+        for _ in remaining:
+            response = await client.post("/api/v1/auth/login", json=credentials)
+            response.raise_for_status()
+
+    prober = asyncio.create_task(probe(client, latencies, stop))
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    stop.set()
+    await prober
+    latencies.sort()
+    p95 = latencies[int(len(latencies) * 0.95)] if latencies else 0.0
+    return total / elapsed, statistics.median(latencies or [0.0]), p95
+
+
+async def main(total: int, concurrency: int):
+    logging.disable(logging.INFO)
+    use_middleware(RequestIDMiddleware, RateLimitMiddleware)  # lifts the rate limits
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=60) as client:
+        credentials = {"email": f"bench-{uuid.uuid4().hex[:8]}@example.com", "password": "bench-password"}
+        r = await client.post("/api/v1/auth/register", json={"name": "Bench", **credentials})
+        r.raise_for_status()
+
+        pooled = auth.verify_password
+        print(f"{total} logins, concurrency {concurrency}")
+        for label, verify in (("inline bcrypt", verify_inline), ("hashing pool", pooled)):
+            auth.verify_password = verify
+            rate, median, p95 = await storm(client, credentials, total, concurrency)
+            print(
+                f"  {label:<14} {rate:6.1f} logins/s   "
+                f"/health median {median * 1000:6.1f}ms  p95 {p95 * 1000:6.1f}ms"
+            )
+        auth.verify_password = pooled
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--logins", type=int, default=100)
+    parser.add_argument("--concurrency", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(main(args.logins, args.concurrency))
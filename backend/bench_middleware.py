@@ -0,0 +1,132 @@
+"""
+Micro-benchmark for the HTTP middleware stack.
+
+Drives the app in-process (no network, no uvicorn) with the current raw ASGI
+middlewares and with their previous BaseHTTPMiddleware equivalents, and prints
+requests/sec for ``/health`` and ``list_tasks``. Registers a throwaway user
+with a few dozen tasks, so point it at a development database.
+
+Usage:
+    cd backend
+    python -m bench_middleware [--requests 2000] [--concurrency 20]
+"""
+import argparse
+import asyncio
+import logging
+import time
+import uuid
+
+import httpx
+from fastapi import Request
+from starlette.middleware import Middleware
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from app.main import app
+from app.middleware.query_counter import server_timing, track_queries
+from app.middleware.rate_limit import MemoryBackend, RateLimitMiddleware, RateLimitPolicy
+from app.middleware.request_id import RequestIDMiddleware
+
+UNLIMITED = 10**9
+
+
+class LegacyRequestIDMiddleware(BaseHTTPMiddleware):
+    """RequestIDMiddleware as it was before moving to raw ASGI."""
+
+    async def dispatch(self, request: Request, call_next):
+        request_id = request.headers.get("X-Request-ID", str(uuid.uuid4()))
+        start = time.perf_counter()
+        with track_queries() as queries:
+            response = await call_next(request)
+        elapsed = round((time.perf_counter() - start) * 1000, 1)
+        response.headers["X-Request-ID"] = request_id
+        response.headers["Server-Timing"] = server_timing(queries)
+        logging.getLogger("planview").info(
+            "%s %s %s %sms [%s]", request.method, request.url.path, response.status_code, elapsed, request_id
+        )
+        return response
+
+
+class LegacyRateLimitMiddleware(BaseHTTPMiddleware):
+    """Pass-through BaseHTTPMiddleware standing in for the old rate limiter."""
+
+    def __init__(self, app, requests_per_minute: int):
+        super().__init__(app)
+        self.rpm = requests_per_minute
+
+    async def dispatch(self, request: Request, call_next):
+        response = await call_next(request)
+        response.headers["X-RateLimit-Limit"] = str(self.rpm)
+        return response
+
+
+def use_middleware(request_id_cls, rate_limit_cls) -> None:
+    """Swap the request ID and rate limit middlewares and rebuild the stack."""
+    if rate_limit_cls is RateLimitMiddleware:
+        rate_limit = Middleware(
+            rate_limit_cls, policies=(RateLimitPolicy("bench", UNLIMITED, 60),), backend=MemoryBackend(),
+        )
+    else:
+        rate_limit = Middleware(rate_limit_cls, requests_per_minute=UNLIMITED)
+    replacements = {
+        RequestIDMiddleware: Middleware(request_id_cls),
+        RateLimitMiddleware: rate_limit,
+        LegacyRequestIDMiddleware: Middleware(request_id_cls),
+        LegacyRateLimitMiddleware: rate_limit,
+    }
+    app.user_middleware = [replacements.get(m.cls, m) for m in app.user_middleware]
+    app.middleware_stack = None
+
+
+async def run(client: httpx.AsyncClient, url: str, total: int, concurrency: int) -> float:
+    remaining = iter(range(total))
+
+    async def worker():
+        for _ in remaining:
+            response = await client.get(url)
+            response.raise_for_status()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return total / (time.perf_counter() - start)
+
+
+async def main(total: int, concurrency: int):
+    logging.disable(logging.INFO)
+    use_middleware(RequestIDMiddleware, RateLimitMiddleware)
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        email = f"bench-{uuid.uuid4().hex[:8]}@example.com"
+        r = await client.post("/api/v1/auth/register", json={
+            "name": "Bench", "email": email, "password": "bench-password",
+        })
+        r.raise_for_status()
+        client.headers["Authorization"] = f"Bearer {r.json()['access_token']}"
+        workspace_id = (await client.get("/api/v1/auth/me")).json()["workspace_id"]
+        await client.post(f"/api/v1/workspaces/{workspace_id}/tasks/bulk", json={
+            "tasks": [{"name": f"Task {i}"} for i in range(50)],
+        })
+
+        routes = {
+            "/health": "/health",
+            "list_tasks": f"/api/v1/workspaces/{workspace_id}/tasks",
+        }
+        stacks = {
+            "BaseHTTPMiddleware": (LegacyRequestIDMiddleware, LegacyRateLimitMiddleware),
+            "raw ASGI": (RequestIDMiddleware, RateLimitMiddleware),
+        }
+        print(f"{total} requests, concurrency {concurrency}")
+        for label, url in routes.items():
+            for stack, classes in stacks.items():
+                use_middleware(*classes)
+                await run(client, url, min(total, 100), concurrency)  # warm up
+                rps = await run(client, url, total, concurrency)
+                print(f"  {label:<12} {stack:<20} {rps:8.0f} req/s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.concurrency))
@@ -0,0 +1,104 @@
+"""
+Micro-benchmark for JSON serialisation of task lists.
+
+Registers a throwaway user with 2000 tasks, times ``list_tasks`` end to end,
+then breaks the full-view response down on the loaded tasks: validating ORM
+rows against the endpoint's union response model versus the concrete list
+type, and encoding through Pydantic's ``dump_json`` (what FastAPI does for a
+``response_model``), ``jsonable_encoder`` + ``json.dumps`` (what it does for a
+custom response class) and orjson. Point it at a development database.
+
+Usage:
+    cd backend
+    python -m bench_serialization [--tasks 2000] [--repeat 20]
+"""
+import argparse
+import asyncio
+import json
+import logging
+import time
+import uuid
+
+import httpx
+import orjson
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+
+from app.database import async_session
+from app.main import app
+from app.schemas.task import TaskListNormalised, TaskResponse, TaskSummary
+from app.services.task_query_service import task_response_query
+from app.utils.serialization import dumps
+
+BULK_SIZE = 500
+
+
+def timed(repeat: int, fn) -> float:
+    fn()  # warm up
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+async def timed_get(client: httpx.AsyncClient, url: str, repeat: int) -> float:
+    (await client.get(url)).raise_for_status()  # warm up
+    start = time.perf_counter()
+    for _ in range(repeat):
+        (await client.get(url)).raise_for_status()
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+async def main(total: int, repeat: int):
+    logging.disable(logging.INFO)
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        email = f"bench-{uuid.uuid4().hex[:8]}@example.com"
+        r = await client.post("/api/v1/auth/register", json={
+            "name": "Bench", "email": email, "password": "bench-password",
+        })
+        r.raise_for_status()
+        client.headers["Authorization"] = f"Bearer {r.json()['access_token']}"
+        me = (await client.get("/api/v1/auth/me")).json()
+        workspace_id = me["workspace_id"]
+        project = (await client.post(f"/api/v1/workspaces/{workspace_id}/projects", json={"name": "Bench"})).json()
+        for first in range(0, total, BULK_SIZE):
+            r = await client.post(f"/api/v1/workspaces/{workspace_id}/tasks/bulk", json={"tasks": [
+                {"name": f"Task {i}", "project_id": project["id"], "assignee_ids": [me["id"]]}
+                for i in range(first, min(first + BULK_SIZE, total))
+            ]})
+            r.raise_for_status()
+
+        print(f"list_tasks, {total} tasks, mean of {repeat}")
+        url = f"/api/v1/workspaces/{workspace_id}/tasks?limit={total}"
+        for view in ("view=full", "view=summary", "format=normalised"):
+            print(f"  {view:<40} {await timed_get(client, f'{url}&{view}', repeat):8.1f} ms")
+
+    async with async_session() as db:
+        result = await db.execute(task_response_query(uuid.UUID(workspace_id)).limit(total))
+        tasks = result.scalars().unique().all()
+
+    union = TypeAdapter(list[TaskResponse] | list[TaskSummary] | TaskListNormalised)
+    concrete = TypeAdapter(list[TaskResponse])
+    models = concrete.validate_python(tasks, from_attributes=True)
+    event = {"type": "task.updated", "data": concrete.dump_python(models[:1], mode="json")[0]}
+    cases = {
+        "validate ORM rows, union model": lambda: union.validate_python(tasks, from_attributes=True),
+        "validate ORM rows, concrete model": lambda: concrete.validate_python(tasks, from_attributes=True),
+        "encode, dump_json": lambda: concrete.dump_json(models),
+        "encode, jsonable_encoder + json.dumps": lambda: json.dumps(jsonable_encoder(models)).encode(),
+        "encode, dump_python + orjson": lambda: orjson.dumps(concrete.dump_python(models, mode="json")),
+        "WS event x1000, json.dumps": lambda: [json.dumps(event) for _ in range(1000)],
+        "WS event x1000, orjson": lambda: [dumps(event).decode() for _ in range(1000)],
+    }
+    print(f"Full view breakdown, {total} tasks, mean of {repeat}")
+    for label, fn in cases.items():
+        print(f"  {label:<40} {timed(repeat, fn):8.1f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--tasks", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(main(args.tasks, args.repeat))
@@ -51,7 +51,7 @@ async def seed():
         for name, email, colour, initials in users_data:
             u = User(
                 name=name, email=email, colour=colour, initials=initials,
-                password_hash=hash_password("admin" if email == "admin@admin.com" else "password123"),
+                password_hash=await hash_password("admin" if email == "admin@admin.com" else "password123"),
                 role="owner" if email == "admin@admin.com" else "regular",
                 workspace_id=ws.id,
             )
@@ -0,0 +1,25 @@
+import asyncio
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.database import engine
+
+
+async def _database_reachable() -> bool:
+    try:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+    except (OSError, SQLAlchemyError):
+        return False
+    finally:
+        await engine.dispose()
+    return True
+
+
+@pytest.fixture(scope="session")
+def database():
+    """Skip tests that drive the app against ``DATABASE_URL`` when it's unreachable."""
+    if not asyncio.run(_database_reachable()):
+        pytest.skip("database not reachable")
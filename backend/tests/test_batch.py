@@ -0,0 +1,57 @@
+"""
+Batched GETs, driven through the app in-process against the configured
+database (set ``DATABASE_URL``). Skipped when the database is unreachable.
+"""
+import asyncio
+import uuid
+
+import httpx
+import pytest
+
+from app.database import engine
+from app.main import app
+
+pytestmark = pytest.mark.usefixtures("database")
+
+
+async def _run_batch() -> tuple[httpx.Response, httpx.Response, httpx.Response, str]:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        r = await client.post("/api/v1/auth/register", json={
+            "name": "Batch", "email": f"batch-{uuid.uuid4().hex[:8]}@example.com", "password": "password1",
+        })
+        r.raise_for_status()
+        client.headers["Authorization"] = f"Bearer {r.json()['access_token']}"
+        me = (await client.get("/api/v1/auth/me")).json()
+        base = f"/workspaces/{me['workspace_id']}"
+        await client.post(f"/api/v1{base}/tasks", json={"name": "A"})
+        projects = await client.get(f"/api/v1{base}/projects")
+        before = await client.get("/api/v1/auth/me")
+
+        batch = await client.post("/api/v1/batch", json={"requests": [
+            {"url": f"{base}/tasks?view=summary", "id": "tasks"},
+            {"url": f"{base}/projects", "headers": {"If-None-Match": projects.headers["etag"]}},
+            {"url": f"{base}/nope"},
+            {"url": f"/workspaces/{uuid.uuid4()}/stats"},
+            {"url": "/auth/me"},
+        ]})
+        after = await client.get("/api/v1/auth/me")
+    await engine.dispose()
+    return before, batch, after, me["id"]
+
+
+def test_batch_runs_each_request_through_the_app():
+    before, batch, after, user_id = asyncio.run(_run_batch())
+
+    assert batch.status_code == 200, batch.text
+    tasks, projects, missing_route, other_workspace, me = batch.json()["responses"]
+    assert (tasks["id"], tasks["status"], [t["name"] for t in tasks["body"]]) == ("tasks", 200, ["A"])
+    assert (projects["status"], projects["body"]) == (304, None)
+    assert (missing_route["status"], missing_route["body"]) == (404, {"detail": "Not Found"})
+    assert other_workspace["status"] == 404
+    assert me["body"]["id"] == user_id
+    # Sub-requests go through the middleware stack...
+    assert "x-request-id" in me["headers"]
+    # ...but only the batch itself is rate limited (the bucket may refill a little meanwhile)
+    spent = int(before.headers["x-ratelimit-remaining"]) - int(after.headers["x-ratelimit-remaining"])
+    assert spent <= 2
@@ -0,0 +1,80 @@
+"""
+Statement counting and budget checks, against an in-memory SQLite engine.
+"""
+import pytest
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.exc import OperationalError
+from starlette.requests import Request
+
+from app.config import settings
+from app.middleware import query_counter
+from app.middleware.query_counter import (
+    REPEAT_THRESHOLD,
+    QueryBudgetExceeded,
+    check_query_budget,
+    track_queries,
+)
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://")
+    event.listen(engine, "before_cursor_execute", query_counter._before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", query_counter._after_cursor_execute)
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE t (x INTEGER)"))
+    yield engine
+    engine.dispose()
+
+
+def _request(method: str, path: str) -> Request:
+    return Request({"type": "http", "method": method, "path": path, "query_string": b"", "headers": []})
+
+
+def test_counts_statements_in_the_tracked_context(engine):
+    with engine.begin() as conn:
+        conn.execute(text("SELECT 1"))  # untracked
+        with track_queries() as stats:
+            conn.execute(text("SELECT 1"))
+            conn.execute(text("INSERT INTO t VALUES (:x)"), [{"x": 1}, {"x": 2}])
+            conn.execute(text("SELECT 1"))
+
+    assert stats.count == 3
+    assert stats.duration > 0
+    # executemany batches count once and stay out of the repeat tally
+    assert stats.statements == {"SELECT 1": 2}
+
+
+def test_repeated_statements_are_reported(engine):
+    with engine.begin() as conn, track_queries() as stats:
+        for _ in range(REPEAT_THRESHOLD):
+            conn.execute(text("SELECT x FROM t"))
+        conn.execute(text("SELECT 1"))
+
+    assert stats.repeated() == [("SELECT x FROM t", REPEAT_THRESHOLD)]
+
+
+def test_budget_is_enforced_in_raise_mode(engine, monkeypatch):
+    monkeypatch.setattr(query_counter, "QUERY_BUDGETS", {("GET", "/api/v1/auth/me"): 2})
+    with engine.begin() as conn, track_queries() as stats:
+        for _ in range(3):
+            conn.execute(text("SELECT 1"))
+
+    monkeypatch.setattr(settings, "query_budgets", "warn")
+    check_query_budget(_request("GET", "/api/v1/auth/me"), stats)
+    check_query_budget(_request("POST", "/api/v1/auth/me"), stats)  # no budget
+
+    monkeypatch.setattr(settings, "query_budgets", "raise")
+    with pytest.raises(QueryBudgetExceeded, match=r"ran 3 queries \(budget 2\)"):
+        check_query_budget(_request("GET", "/api/v1/auth/me"), stats)
+
+
+def test_failed_statements_leave_no_state_on_the_connection(engine):
+    with engine.connect() as conn, track_queries() as stats:
+        with pytest.raises(OperationalError):
+            conn.execute(text("SELECT * FROM missing"))
+        conn.rollback()
+        conn.execute(text("SELECT 1"))
+
+        assert "query_start" not in conn.info
+    assert stats.count == 1
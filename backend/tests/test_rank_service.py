@@ -0,0 +1,58 @@
+"""
+Rank key arithmetic. Pure functions, no database needed.
+"""
+import itertools
+
+import pytest
+
+from app.services.rank_service import DIGITS, REBALANCE_LENGTH, even_keys, key_between
+
+
+def _append(start: str | None, count: int) -> list[str]:
+    keys = []
+    key = start
+    for _ in range(count):
+        key = key_between(key, None)
+        keys.append(key)
+    return keys
+
+
+def _assert_valid(keys: list[str]) -> None:
+    assert all(a < b for a, b in itertools.pairwise(keys))
+    assert not any(key.endswith(DIGITS[0]) for key in keys)
+
+
+def test_appends_keep_keys_short():
+    keys = _append(None, 20_000)
+    _assert_valid(keys)
+    assert max(len(key) for key in keys) <= 6
+
+
+@pytest.mark.parametrize("start", ["C000F", "y", "zzzzz", "V" * REBALANCE_LENGTH])
+def test_appends_after_existing_keys_stay_bounded(start):
+    keys = _append(start, 5_000)
+    _assert_valid([start, *keys])
+    assert max(len(key) for key in keys) <= len(start) + 6
+
+
+def test_prepends_and_inserts_sort_between_neighbours():
+    keys = ["V"]
+    for _ in range(200):
+        keys.insert(0, key_between(None, keys[0]))
+        keys.insert(len(keys) // 2, key_between(keys[len(keys) // 2 - 1], keys[len(keys) // 2]))
+    _assert_valid(keys)
+
+
+def test_key_between_rejects_out_of_order_neighbours():
+    with pytest.raises(ValueError):
+        key_between("b", "a")
+    with pytest.raises(ValueError):
+        key_between("a", "a")
+
+
+def test_even_keys_leave_room_on_both_sides():
+    keys = even_keys(1_000)
+    _assert_valid(keys)
+    assert len(keys) == 1_000
+    assert key_between(None, keys[0]) < keys[0]
+    assert key_between(keys[-1], None) > keys[-1]
@@ -0,0 +1,16 @@
+"""
+Quick search input handling. Blank queries return before touching the database.
+"""
+import asyncio
+import uuid
+
+import pytest
+
+from app.services.search_service import quick_search
+
+
+@pytest.mark.parametrize("text", ["", " ", "\t\n "])
+def test_blank_quick_search_matches_nothing(text):
+    result = asyncio.run(quick_search(None, uuid.uuid4(), text))
+
+    assert result == {"tasks": [], "projects": [], "teams": [], "users": [], "clients": []}
@@ -0,0 +1,53 @@
+"""
+JSON encoding for payloads and JSON columns.
+"""
+import datetime
+import uuid
+from decimal import Decimal
+
+import orjson
+import pytest
+from pydantic import BaseModel
+
+from app.utils.serialization import Encoded, dumps, dumps_column
+
+
+class _Model(BaseModel):
+    id: uuid.UUID
+    name: str
+
+
+class _SubclassedUUID(uuid.UUID):
+    """Stands in for asyncpg's UUID type, which orjson doesn't encode natively."""
+
+
+def test_non_string_keys_become_strings():
+    day = datetime.date(2026, 1, 2)
+    value = {1: "a", 2.5: "b", day: "c", None: "d"}
+    expected = {"1": "a", "2.5": "b", "2026-01-02": "c", "null": "d"}
+
+    assert orjson.loads(dumps(value)) == expected
+    assert orjson.loads(dumps_column(value)) == expected
+
+
+def test_dumps_falls_back_to_str():
+    value = {"amount": Decimal("1.50"), "id": _SubclassedUUID(int=1)}
+
+    assert orjson.loads(dumps(value)) == {"amount": "1.50", "id": str(uuid.UUID(int=1))}
+
+
+def test_dumps_embeds_encoded_models_verbatim():
+    encoded = Encoded(_Model(id=uuid.UUID(int=2), name="x"))
+
+    assert dumps({"task": encoded}) == b'{"task":' + encoded.json + b"}"
+    assert dumps_column({"task": encoded}) == '{"task":' + encoded.json.decode() + "}"
+
+
+def test_dumps_column_writes_uuid_subclasses_as_strings():
+    assert dumps_column([_SubclassedUUID(int=3)]) == f'["{uuid.UUID(int=3)}"]'
+
+
+@pytest.mark.parametrize("value", [Decimal("1.50"), object(), {1, 2}])
+def test_dumps_column_rejects_unsupported_types(value):
+    with pytest.raises(TypeError):
+        dumps_column({"value": value})
@@ -0,0 +1,96 @@
+"""
+Statement counts for the task write endpoints.
+
+Drives the app in-process against the configured database (set
+``DATABASE_URL``) with ``query_budgets="raise"``, so the middleware enforces
+each endpoint's entry in ``QUERY_BUDGETS``. The statements themselves are
+captured with a ``before_cursor_execute`` listener; only those issued from
+the request's own context count, as after-commit event handlers run in a
+fresh one. Skipped when the database is unreachable.
+"""
+import asyncio
+import contextvars
+import re
+import uuid
+
+import httpx
+import pytest
+from sqlalchemy import event
+
+from app.config import settings
+from app.database import engine
+from app.main import app
+from app.middleware.query_counter import QUERY_BUDGETS
+
+TASKS = "/api/v1/workspaces/{workspace_id}/tasks"
+ENDPOINTS = {
+    "create": ("POST", TASKS),
+    "update": ("PUT", TASKS + "/{task_id}"),
+    "duplicate": ("POST", TASKS + "/{task_id}/duplicate"),
+}
+
+pytestmark = pytest.mark.usefixtures("database")
+
+_statements: contextvars.ContextVar[list[str] | None] = contextvars.ContextVar("statements", default=None)
+
+
+def _record(conn, cursor, statement, parameters, context, executemany):
+    statements = _statements.get()
+    if statements is not None:
+        statements.append(statement)
+
+
+def _query_count(response: httpx.Response) -> int:
+    """Statements the middleware counted, from its Server-Timing header."""
+    return int(re.search(r'desc="(\d+) queries"', response.headers["Server-Timing"]).group(1))
+
+
+async def _measure() -> dict[str, tuple[int, list[str]]]:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        r = await client.post("/api/v1/auth/register", json={
+            "name": "Statements", "email": f"stmts-{uuid.uuid4().hex[:8]}@example.com", "password": "password1",
+        })
+        r.raise_for_status()
+        client.headers["Authorization"] = f"Bearer {r.json()['access_token']}"
+        me = (await client.get("/api/v1/auth/me")).json()
+        base = f"/api/v1/workspaces/{me['workspace_id']}"
+        project = (await client.post(f"{base}/projects", json={"name": "P"})).json()
+        tag = (await client.post(f"{base}/projects/{project['id']}/tags", json={"name": "t"})).json()
+
+        async def measure(method: str, url: str, **kwargs) -> tuple[httpx.Response, tuple[int, list[str]]]:
+            statements: list[str] = []
+            token = _statements.set(statements)
+            try:
+                response = await client.request(method, url, **kwargs)
+            finally:
+                _statements.reset(token)
+            assert response.is_success, response.text
+            return response, (_query_count(response), statements)
+
+        measured = {}
+        event.listen(engine.sync_engine, "before_cursor_execute", _record)
+        try:
+            r, measured["create"] = await measure("POST", f"{base}/tasks", json={
+                "name": "A", "project_id": project["id"], "assignee_ids": [me["id"]], "tag_ids": [tag["id"]],
+            })
+            task_url = f"{base}/tasks/{r.json()['id']}"
+            _, measured["update"] = await measure("PUT", task_url, json={"name": "A2"})
+            _, measured["duplicate"] = await measure("POST", f"{task_url}/duplicate")
+        finally:
+            event.remove(engine.sync_engine, "before_cursor_execute", _record)
+    await engine.dispose()
+    return measured
+
+
+def test_task_writes_stay_within_statement_budgets(monkeypatch):
+    # Over budget, the middleware raises out of the request
+    monkeypatch.setattr(settings, "query_budgets", "raise")
+    measured = asyncio.run(_measure())
+
+    for name, (count, statements) in measured.items():
+        assert count <= QUERY_BUDGETS[ENDPOINTS[name]], statements
+        # Responses are built from the written rows, never re-selected
+        writes = [s for s in statements if s.startswith(("INSERT INTO tasks", "UPDATE tasks"))]
+        assert writes, name
+        assert not any("search_vector" in s for s in writes), name
@@ -2,8 +2,6 @@ import { BrowserRouter, Routes, Route, Navigate, Outlet } from 'react-router-dom
 import { useEffect, useMemo, useState } from 'react';
 import { useAuthStore } from './stores/authStore';
 import { useWorkspaceStore } from './stores/workspaceStore';
-import { useTeamStore } from './stores/teamStore';
-import { useProjectStore } from './stores/projectStore';
 import { useUIStore } from './stores/uiStore';
 import { useNotificationStore } from './stores/notificationStore';
 import { WebSocketProvider, useWSEvent } from './hooks/WebSocketContext';
@@ -34,8 +32,7 @@ function ProtectedLayout() {
   const fetchMe = useAuthStore((s) => s.fetchMe);
   const fetchWorkspaces = useWorkspaceStore((s) => s.fetchWorkspaces);
   const currentWorkspace = useWorkspaceStore((s) => s.currentWorkspace);
-  const fetchTeams = useTeamStore((s) => s.fetchTeams);
-  const fetchProjects = useProjectStore((s) => s.fetchProjects);
+  const bootstrap = useWorkspaceStore((s) => s.bootstrap);
   const setZoom = useUIStore((s) => s.setZoomLevel);
   const toggleSidebar = useUIStore((s) => s.toggleSidebar);
   const setTaskboxOpen = useUIStore((s) => s.setTaskboxOpen);
@@ -68,10 +65,9 @@ function ProtectedLayout() {
 
   useEffect(() => {
     if (currentWorkspace) {
-      fetchTeams(currentWorkspace.id);
-      fetchProjects(currentWorkspace.id);
+      bootstrap(currentWorkspace.id);
     }
-  }, [currentWorkspace, fetchTeams, fetchProjects]);
+  }, [currentWorkspace, bootstrap]);
 
   // Listen for real-time notification events
   useWSEvent('notification.new', (data) => {
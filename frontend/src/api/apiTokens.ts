@@ -0,0 +1,28 @@
+import { api } from './client';
+
+export type ApiTokenScope = 'read' | 'write';
+
+export interface ApiToken {
+  id: string;
+  name: string;
+  token_prefix: string;
+  scopes: ApiTokenScope[];
+  expires_at: string | null;
+  last_used_at: string | null;
+  created_at: string;
+}
+
+export interface ApiTokenCreated extends ApiToken {
+  token: string;
+}
+
+export const apiTokensApi = {
+  list: (workspaceId: string) =>
+    api.get<ApiToken[]>(`/workspaces/${workspaceId}/api-tokens`),
+
+  create: (workspaceId: string, data: { name: string; scopes: ApiTokenScope[]; expires_in_days?: number }) =>
+    api.post<ApiTokenCreated>(`/workspaces/${workspaceId}/api-tokens`, data),
+
+  revoke: (workspaceId: string, tokenId: string) =>
+    api.delete(`/workspaces/${workspaceId}/api-tokens/${tokenId}`),
+};
@@ -0,0 +1,30 @@
+import { api } from './client';
+
+export interface BatchSubRequest {
+  id?: string;
+  method?: 'GET';
+  url: string;
+  headers?: Record<string, string>;
+}
+
+export interface BatchSubResponse<T = unknown> {
+  id: string;
+  status: number;
+  headers: Record<string, string>;
+  body: T;
+}
+
+export const batchApi = {
+  run: (requests: BatchSubRequest[]) =>
+    api.post<{ responses: BatchSubResponse[] }>('/batch', { requests }),
+};
+
+/** Fetch several API paths in one round trip; rejects if any of them failed. */
+export async function batchGet<T extends unknown[]>(...urls: string[]): Promise<T> {
+  const { data } = await batchApi.run(urls.map((url) => ({ url })));
+  const failed = data.responses.find((r) => r.status >= 400);
+  if (failed) {
+    throw new Error(`GET ${urls[Number(failed.id)]} failed with ${failed.status}`);
+  }
+  return data.responses.map((r) => r.body) as T;
+}
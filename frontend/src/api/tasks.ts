@@ -46,6 +46,7 @@ export interface Task {
   is_recurring: boolean;
   recurrence_rule: string | null;
   sort_order: number;
+  rank: string | null;
   project_id: string | null;
   segment_id: string | null;
   parent_id: string | null;
@@ -59,6 +60,47 @@ export interface Task {
   updated_at: string;
 }
 
+export interface BulkTaskUpdateResult {
+  task_ids: string[];
+  changes: Partial<Task>;
+  assignees: User[] | null;
+  tags: TaskTag[] | null;
+  updated_at: string | null;
+}
+
+/** Apply a bulk update result (or `tasks.bulk_updated` event) to one task. */
+export function applyBulkUpdate(task: Task, result: BulkTaskUpdateResult): Task {
+  return {
+    ...task,
+    ...result.changes,
+    ...(result.assignees ? { assignees: result.assignees } : {}),
+    ...(result.tags ? { tags: result.tags } : {}),
+    updated_at: result.updated_at ?? task.updated_at,
+  };
+}
+
+export interface ReorderItem {
+  id: string;
+  sort_order: number;
+}
+
+export interface ReorderedTask extends ReorderItem {
+  rank: string;
+}
+
+export interface TaskMove {
+  after_id?: string | null;
+  before_id?: string | null;
+  status?: string;
+}
+
+export interface TaskMoveResult {
+  id: string;
+  rank: string;
+  status: string;
+  updated_at: string;
+}
+
 export const tasksApi = {
   list: (workspaceId: string, params?: Record<string, string>) =>
     api.get<Task[]>(`/workspaces/${workspaceId}/tasks`, { params }),
@@ -75,9 +117,15 @@ export const tasksApi = {
   duplicate: (workspaceId: string, taskId: string) =>
     api.post<Task>(`/workspaces/${workspaceId}/tasks/${taskId}/duplicate`),
 
+  bulkCreate: (workspaceId: string, tasks: (Partial<Task> & { name: string; assignee_ids?: string[]; tag_ids?: string[] })[]) =>
+    api.post<Task[]>(`/workspaces/${workspaceId}/tasks/bulk`, { tasks }),
+
   bulkUpdate: (workspaceId: string, data: { task_ids: string[] } & Partial<Task> & { assignee_ids?: string[] }) =>
-    api.put<Task[]>(`/workspaces/${workspaceId}/tasks`, data),
+    api.put<BulkTaskUpdateResult>(`/workspaces/${workspaceId}/tasks`, data),
+
+  reorder: (workspaceId: string, items: ReorderItem[]) =>
+    api.put<ReorderedTask[]>(`/workspaces/${workspaceId}/tasks/reorder`, { items }),
 
-  reorder: (workspaceId: string, items: { id: string; sort_order: number }[]) =>
-    api.put<Task[]>(`/workspaces/${workspaceId}/tasks/reorder`, { items }),
+  move: (workspaceId: string, taskId: string, data: TaskMove) =>
+    api.post<TaskMoveResult>(`/workspaces/${workspaceId}/tasks/${taskId}/move`, data),
 };
@@ -1,4 +1,12 @@
 import { api } from './client';
+import type { Client } from './clients';
+import type { CustomField } from './customFields';
+import type { Milestone } from './milestones';
+import type { Project } from './projects';
+import type { Tag } from './tags';
+import type { Team } from './teams';
+import type { TaskTemplate } from './templates';
+import type { User } from './users';
 
 export interface Workspace {
   id: string;
@@ -7,11 +15,27 @@ export interface Workspace {
   updated_at: string;
 }
 
+export interface WorkspaceBootstrap {
+  workspace: Workspace;
+  members: User[];
+  teams: Team[];
+  projects: Project[];
+  tags: Tag[];
+  custom_fields: CustomField[];
+  templates: TaskTemplate[];
+  milestones: Milestone[];
+  clients: Client[];
+  unread_notifications: number;
+}
+
 export const workspacesApi = {
   list: () => api.get<Workspace[]>('/workspaces'),
 
   get: (workspaceId: string) => api.get<Workspace>(`/workspaces/${workspaceId}`),
 
+  bootstrap: (workspaceId: string) =>
+    api.get<WorkspaceBootstrap>(`/workspaces/${workspaceId}/bootstrap`),
+
   create: (data: { name: string }) => api.post<Workspace>('/workspaces', data),
 
   update: (workspaceId: string, data: { name?: string }) =>
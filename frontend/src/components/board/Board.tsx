@@ -15,6 +15,7 @@ import { BoardColumn } from './BoardColumn';
 import { BoardCard } from './BoardCard';
 import { DEFAULT_STATUSES } from '../../utils/constants';
 import { tasksApi, type Task } from '../../api/tasks';
+import { compareTaskOrder, keyBetween } from '../../utils/rank';
 import { useTaskStore } from '../../stores/taskStore';
 import { useWorkspaceStore } from '../../stores/workspaceStore';
 
@@ -30,18 +31,17 @@ export function Board({ tasks, onTaskClick, selectedIds, onToggleSelect }: Board
   const [overColumnId, setOverColumnId] = useState<string | null>(null);
   const workspace = useWorkspaceStore((s) => s.currentWorkspace);
   const updateTaskInStore = useTaskStore((s) => s.updateTask);
-  const setTasks = useTaskStore((s) => s.setTasks);
 
   const sensors = useSensors(
     useSensor(PointerSensor, { activationConstraint: { distance: 5 } })
   );
 
-  // Sort tasks by sort_order within each status column
+  // Sort tasks by rank within each status column
   const tasksByStatus = DEFAULT_STATUSES.reduce(
     (acc, status) => {
       acc[status.id] = tasks
         .filter((t) => t.status === status.id)
-        .sort((a, b) => a.sort_order - b.sort_order);
+        .sort(compareTaskOrder);
       return acc;
     },
     {} as Record<string, Task[]>
@@ -87,53 +87,43 @@ export function Board({ tasks, onTaskClick, selectedIds, onToggleSelect }: Board
         }
       }
 
-      const columnTasks = [...(tasksByStatus[targetStatus] || [])];
-
+      // Find the card's new neighbours; only the moved card is written
+      const columnTasks = tasksByStatus[targetStatus] || [];
+      let placed: Task[];
       if (task.status === targetStatus) {
-        // Reorder within same column
         const oldIndex = columnTasks.findIndex((t) => t.id === task.id);
-        let newIndex = targetTaskId
+        const newIndex = targetTaskId
           ? columnTasks.findIndex((t) => t.id === targetTaskId)
-          : columnTasks.length;
-
+          : columnTasks.length - 1;
         if (oldIndex === -1 || oldIndex === newIndex) return;
-
-        const reordered = arrayMove(columnTasks, oldIndex, newIndex);
-        const reorderItems = reordered.map((t, i) => ({ id: t.id, sort_order: i }));
-
-        // Optimistic update
-        const updatedTasks = tasks.map((t) => {
-          const item = reorderItems.find((r) => r.id === t.id);
-          return item ? { ...t, sort_order: item.sort_order } : t;
-        });
-        setTasks(updatedTasks);
-
-        try {
-          await tasksApi.reorder(workspace.id, reorderItems);
-        } catch {
-          // Revert on failure
-          setTasks(tasks);
-        }
+        placed = arrayMove(columnTasks, oldIndex, newIndex);
       } else {
-        // Move to different column
-        const newSortOrder = targetTaskId
-          ? (columnTasks.find((t) => t.id === targetTaskId)?.sort_order ?? columnTasks.length)
-          : columnTasks.length;
-
-        const updated = { ...task, status: targetStatus, sort_order: newSortOrder };
-        updateTaskInStore(updated);
+        const targetIndex = columnTasks.findIndex((t) => t.id === targetTaskId);
+        placed = [...columnTasks];
+        placed.splice(targetIndex === -1 ? columnTasks.length : targetIndex, 0, task);
+      }
+      const position = placed.findIndex((t) => t.id === task.id);
+      const after = placed[position - 1] ?? null;
+      const before = placed[position + 1] ?? null;
+
+      // Optimistic update; the server's key replaces ours when it responds
+      const optimisticRank = keyBetween(after?.rank ?? null, before?.rank ?? null);
+      if (optimisticRank) {
+        updateTaskInStore({ ...task, status: targetStatus, rank: optimisticRank });
+      }
 
-        try {
-          await tasksApi.update(workspace.id, task.id, {
-            status: targetStatus,
-            sort_order: newSortOrder,
-          });
-        } catch {
-          updateTaskInStore(task);
-        }
+      try {
+        const { data } = await tasksApi.move(workspace.id, task.id, {
+          after_id: after?.id ?? null,
+          before_id: before?.id ?? null,
+          ...(task.status !== targetStatus ? { status: targetStatus } : {}),
+        });
+        updateTaskInStore({ ...task, status: data.status, rank: data.rank, updated_at: data.updated_at });
+      } catch {
+        updateTaskInStore(task);
       }
     },
-    [tasks, tasksByStatus, workspace, updateTaskInStore, setTasks]
+    [tasks, tasksByStatus, workspace, updateTaskInStore]
   );
 
   return (
@@ -20,17 +20,10 @@ export function NotificationBell() {
     toggle,
     setOpen,
     fetchNotifications,
-    fetchUnreadCount,
     markRead,
     markAllRead,
   } = useNotificationStore();
 
-  useEffect(() => {
-    if (workspace) {
-      fetchUnreadCount(workspace.id);
-    }
-  }, [workspace, fetchUnreadCount]);
-
   useEffect(() => {
     if (isOpen && workspace) {
       fetchNotifications(workspace.id);
@@ -1,7 +1,7 @@
 import { useCallback } from 'react';
 import { useAuthStore } from '../stores/authStore';
 import { useWSEvent } from './WebSocketContext';
-import type { Task } from '../api/tasks';
+import { applyBulkUpdate, type BulkTaskUpdateResult, type Task, type TaskMoveResult } from '../api/tasks';
 
 /**
  * Subscribes to real-time task events and updates local state.
@@ -28,6 +28,17 @@ export function useRealtimeTasks(
     });
   }, [setTasks, filter, userId]);
 
+  const handleBulkCreated = useCallback((data: Record<string, unknown>) => {
+    if (data.actor_id === userId) return;
+
+    const created = (data.tasks as Task[]).filter((t) => !filter || filter(t));
+    if (!created.length) return;
+    setTasks((prev) => {
+      const known = new Set(prev.map((t) => t.id));
+      return [...prev, ...created.filter((t) => !known.has(t.id))];
+    });
+  }, [setTasks, filter, userId]);
+
   const handleUpdated = useCallback((data: Record<string, unknown>) => {
     const task = data.task as Task;
     setTasks((prev) => {
@@ -44,12 +55,26 @@ export function useRealtimeTasks(
     });
   }, [setTasks, filter]);
 
+  const handleBulkUpdated = useCallback((data: Record<string, unknown>) => {
+    const result = data as unknown as BulkTaskUpdateResult;
+    const ids = new Set(result.task_ids);
+    setTasks((prev) => prev.map((t) => (ids.has(t.id) ? applyBulkUpdate(t, result) : t)));
+  }, [setTasks]);
+
+  const handleMoved = useCallback((data: Record<string, unknown>) => {
+    const { id, rank, status, updated_at } = data as unknown as TaskMoveResult;
+    setTasks((prev) => prev.map((t) => (t.id === id ? { ...t, rank, status, updated_at } : t)));
+  }, [setTasks]);
+
   const handleDeleted = useCallback((data: Record<string, unknown>) => {
     const taskId = data.task_id as string;
     setTasks((prev) => prev.filter((t) => t.id !== taskId));
   }, [setTasks]);
 
   useWSEvent('task.created', handleCreated, [handleCreated]);
+  useWSEvent('tasks.bulk_created', handleBulkCreated, [handleBulkCreated]);
   useWSEvent('task.updated', handleUpdated, [handleUpdated]);
+  useWSEvent('tasks.bulk_updated', handleBulkUpdated, [handleBulkUpdated]);
+  useWSEvent('task.moved', handleMoved, [handleMoved]);
   useWSEvent('task.deleted', handleDeleted, [handleDeleted]);
 }
@@ -18,7 +18,9 @@ export function useWebSocket(workspaceId: string | undefined) {
   const connect = useCallback(() => {
     if (!workspaceId) return;
 
-    const ws = new WebSocket(`${WS_BASE}/ws/${workspaceId}`);
+    // Read on every (re)connect so a refreshed access token is picked up
+    const token = localStorage.getItem('access_token') ?? '';
+    const ws = new WebSocket(`${WS_BASE}/ws/${workspaceId}?token=${encodeURIComponent(token)}`);
 
     ws.onopen = () => {
       reconnectDelay.current = 1000;
@@ -6,8 +6,9 @@ import {
 } from 'lucide-react';
 import { useWorkspaceStore } from '../stores/workspaceStore';
 import { useAuthStore } from '../stores/authStore';
-import { statsApi, type WorkspaceStats } from '../api/stats';
-import { activityApi, type Activity as ActivityType } from '../api/activity';
+import type { WorkspaceStats } from '../api/stats';
+import type { Activity as ActivityType } from '../api/activity';
+import { batchGet } from '../api/batch';
 import { Avatar } from '../components/shared/Avatar';
 import { DashboardSkeleton } from '../components/shared/Skeleton';
 
@@ -70,12 +71,12 @@ export function DashboardPage() {
   useEffect(() => {
     if (!workspace) return;
     setLoading(true);
-    Promise.all([
-      statsApi.get(workspace.id),
-      activityApi.list(workspace.id, { limit: 15 }),
-    ]).then(([statsRes, actRes]) => {
-      setStats(statsRes.data);
-      setActivities(actRes.data);
+    batchGet<[WorkspaceStats, ActivityType[]]>(
+      `/workspaces/${workspace.id}/stats`,
+      `/workspaces/${workspace.id}/activity?limit=15`,
+    ).then(([statsData, activityData]) => {
+      setStats(statsData);
+      setActivities(activityData);
       setLoading(false);
     }).catch(() => setLoading(false));
   }, [workspace]);
@@ -6,10 +6,10 @@ import { EmptyState } from '../components/shared/EmptyState';
 import { useWorkspaceStore } from '../stores/workspaceStore';
 import { useAuthStore } from '../stores/authStore';
 import { useUIStore } from '../stores/uiStore';
-import { timelineApi } from '../api/timeline';
-import { milestonesApi } from '../api/milestones';
+import { batchGet } from '../api/batch';
+import type { Milestone } from '../api/milestones';
 import { tasksApi } from '../api/tasks';
-import { membersApi, type User } from '../api/users';
+import type { User } from '../api/users';
 import type { Task } from '../api/tasks';
 import { addDays, format, startOfWeek } from '../utils/dates';
 import { ZOOM_CONFIGS } from '../utils/dates';
@@ -44,14 +44,15 @@ export function MyWorkPage() {
     const since = format(startDate, 'yyyy-MM-dd');
     const until = format(addDays(startDate, config.daysVisible), 'yyyy-MM-dd');
 
-    Promise.all([
-      timelineApi.get(workspace.id, { since, until, users: user.id }),
-      milestonesApi.list(workspace.id),
-      membersApi.list(workspace.id),
-    ]).then(([tasksRes, milestonesRes, membersRes]) => {
-      setTasks(tasksRes.data);
-      setMilestones(milestonesRes.data);
-      setMembers(membersRes.data);
+    const params = new URLSearchParams({ since, until, users: user.id });
+    batchGet<[Task[], Milestone[], User[]]>(
+      `/workspaces/${workspace.id}/timeline?${params}`,
+      `/workspaces/${workspace.id}/milestones`,
+      `/workspaces/${workspace.id}/members`,
+    ).then(([tasksData, milestonesData, membersData]) => {
+      setTasks(tasksData);
+      setMilestones(milestonesData);
+      setMembers(membersData);
     });
   }, [workspace, user, zoom, startDate]);
 
@@ -10,7 +10,14 @@ import { useTaskStore } from '../stores/taskStore';
 import { useProjectStore } from '../stores/projectStore';
 import { useAuthStore } from '../stores/authStore';
 import { useWSEvent } from '../hooks/WebSocketContext';
-import { tasksApi, type Task } from '../api/tasks';
+import {
+  applyBulkUpdate,
+  tasksApi,
+  type BulkTaskUpdateResult,
+  type ReorderedTask,
+  type Task,
+  type TaskMoveResult,
+} from '../api/tasks';
 import { membersApi, type User } from '../api/users';
 import { EmptyState } from '../components/shared/EmptyState';
 import { Toast } from '../components/shared/Toast';
@@ -40,6 +47,12 @@ export function ProjectBoardPage() {
     if (task.project_id === projectId) addTask(task);
   }, [userId, projectId, addTask]);
 
+  // Real-time: batch created in one request
+  useWSEvent('tasks.bulk_created', (data) => {
+    if (data.actor_id === userId) return;
+    (data.tasks as Task[]).filter((t) => t.project_id === projectId).forEach(addTask);
+  }, [userId, projectId, addTask]);
+
   // Real-time: task updated
   useWSEvent('task.updated', (data) => {
     const task = data.task as Task;
@@ -51,6 +64,37 @@ export function ProjectBoardPage() {
     }
   }, [projectId, updateTaskInStore, removeTaskFromStore]);
 
+  // Real-time: bulk update (one event for the whole batch)
+  const applyBulkResult = useCallback((result: BulkTaskUpdateResult) => {
+    const ids = new Set(result.task_ids);
+    useTaskStore.getState().tasks
+      .filter((t) => ids.has(t.id))
+      .forEach((t) => updateTaskInStore(applyBulkUpdate(t, result)));
+  }, [updateTaskInStore]);
+
+  useWSEvent('tasks.bulk_updated', (data) => {
+    applyBulkResult(data as unknown as BulkTaskUpdateResult);
+  }, [applyBulkResult]);
+
+  // Real-time: cards reordered by another user, or rank keys rebalanced
+  useWSEvent('tasks.reordered', (data) => {
+    if (data.actor_id === userId) return;
+    const items = new Map((data.items as Partial<ReorderedTask>[]).map((i) => [i.id, i]));
+    const { tasks: current, setTasks } = useTaskStore.getState();
+    setTasks(current.map((t) => {
+      const item = items.get(t.id);
+      return item ? { ...t, sort_order: item.sort_order ?? t.sort_order, rank: item.rank ?? t.rank } : t;
+    }));
+  }, [userId]);
+
+  // Real-time: a single card moved by another user
+  useWSEvent('task.moved', (data) => {
+    if (data.actor_id === userId) return;
+    const moved = data as unknown as TaskMoveResult;
+    const task = useTaskStore.getState().tasks.find((t) => t.id === moved.id);
+    if (task) updateTaskInStore({ ...task, rank: moved.rank, status: moved.status, updated_at: moved.updated_at });
+  }, [userId, updateTaskInStore]);
+
   // Real-time: task deleted
   useWSEvent('task.deleted', (data) => {
     removeTaskFromStore(data.task_id as string);
@@ -103,20 +147,20 @@ export function ProjectBoardPage() {
     const ids = Array.from(selectedIds);
     try {
       const { data } = await tasksApi.bulkUpdate(workspace.id, { task_ids: ids, status });
-      data.forEach((t) => updateTaskInStore(t));
+      applyBulkResult(data);
       setSelectedIds(new Set());
     } catch (err) { console.error('Bulk status failed:', err); }
-  }, [workspace, selectedIds, updateTaskInStore]);
+  }, [workspace, selectedIds, applyBulkResult]);
 
   const handleBulkAssign = useCallback(async (userId: string) => {
     if (!workspace) return;
     const ids = Array.from(selectedIds);
     try {
       const { data } = await tasksApi.bulkUpdate(workspace.id, { task_ids: ids, assignee_ids: [userId] });
-      data.forEach((t) => updateTaskInStore(t));
+      applyBulkResult(data);
       setSelectedIds(new Set());
     } catch (err) { console.error('Bulk assign failed:', err); }
-  }, [workspace, selectedIds, updateTaskInStore]);
+  }, [workspace, selectedIds, applyBulkResult]);
 
   const pendingDeleteRef = useRef<ReturnType<typeof setTimeout>>(undefined);
 
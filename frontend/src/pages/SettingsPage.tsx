@@ -1,5 +1,5 @@
 import { useState, useEffect, useRef } from 'react';
-import { User, Palette, Bell, Shield, LogOut, Sun, Moon, Users, UserPlus, Trash2, Copy, Check, Download, Upload, AlertTriangle, Webhook, Lock, Sliders, Plus } from 'lucide-react';
+import { User, Palette, Bell, Shield, LogOut, Sun, Moon, Users, UserPlus, Trash2, Copy, Check, Download, Upload, AlertTriangle, Webhook, Lock, Sliders, Plus, KeyRound } from 'lucide-react';
 import { useAuthStore } from '../stores/authStore';
 import { useWorkspaceStore } from '../stores/workspaceStore';
 import { useUIStore } from '../stores/uiStore';
@@ -7,6 +7,7 @@ import { authApi, membersApi, type User as UserType } from '../api/users';
 import { workspacesApi } from '../api/workspaces';
 import { importsApi } from '../api/imports';
 import { webhooksApi, type Webhook as WebhookType } from '../api/webhooks';
+import { apiTokensApi, type ApiToken } from '../api/apiTokens';
 import { customFieldsApi, type CustomField } from '../api/customFields';
 import { templatesApi, type TaskTemplate } from '../api/templates';
 import { api } from '../api/client';
@@ -14,7 +15,7 @@ import { ColourPicker } from '../components/task/ColourPicker';
 import { Avatar } from '../components/shared/Avatar';
 import { Toast } from '../components/shared/Toast';
 
-type Tab = 'profile' | 'workspace' | 'members' | 'appearance' | 'notifications' | 'data' | 'security' | 'webhooks' | 'fields' | 'templates';
+type Tab = 'profile' | 'workspace' | 'members' | 'appearance' | 'notifications' | 'data' | 'security' | 'webhooks' | 'api-tokens' | 'fields' | 'templates';
 
 export function SettingsPage() {
   const user = useAuthStore((s) => s.user);
@@ -105,6 +106,7 @@ export function SettingsPage() {
     { id: 'data', label: 'Import / Export', icon: <Download size={16} /> },
     { id: 'security', label: 'Security', icon: <Lock size={16} /> },
     { id: 'webhooks', label: 'Webhooks', icon: <Webhook size={16} /> },
+    { id: 'api-tokens', label: 'API Tokens', icon: <KeyRound size={16} /> },
     { id: 'fields', label: 'Custom Fields', icon: <Sliders size={16} /> },
     { id: 'templates', label: 'Templates', icon: <Copy size={16} /> },
   ];
@@ -441,6 +443,10 @@ export function SettingsPage() {
             <WebhooksTab workspaceId={workspace?.id} />
           )}
 
+          {tab === 'api-tokens' && (
+            <ApiTokensTab workspaceId={workspace?.id} />
+          )}
+
           {tab === 'fields' && (
             <CustomFieldsTab workspaceId={workspace?.id} />
           )}
@@ -994,7 +1000,7 @@ function WebhooksTab({ workspaceId }: { workspaceId?: string }) {
   };
 
   const AVAILABLE_EVENTS = [
-    'task.created', 'task.updated', 'task.deleted',
+    'task.created', 'task.updated', 'task.deleted', 'task.moved', 'tasks.bulk_created', 'tasks.bulk_updated',
     'comment.created', 'project.created', 'project.updated',
   ];
 
@@ -1104,6 +1110,177 @@ function WebhooksTab({ workspaceId }: { workspaceId?: string }) {
   );
 }
 
+function ApiTokensTab({ workspaceId }: { workspaceId?: string }) {
+  const [tokens, setTokens] = useState<ApiToken[]>([]);
+  const [adding, setAdding] = useState(false);
+  const [name, setName] = useState('');
+  const [canWrite, setCanWrite] = useState(false);
+  const [expiresInDays, setExpiresInDays] = useState('');
+  const [newToken, setNewToken] = useState<string | null>(null);
+  const [copied, setCopied] = useState(false);
+
+  useEffect(() => {
+    if (!workspaceId) return;
+    apiTokensApi.list(workspaceId).then((res) => setTokens(res.data));
+  }, [workspaceId]);
+
+  const handleCreate = async () => {
+    if (!workspaceId || !name.trim()) return;
+    try {
+      const { data } = await apiTokensApi.create(workspaceId, {
+        name: name.trim(),
+        scopes: canWrite ? ['read', 'write'] : ['read'],
+        expires_in_days: expiresInDays ? Number(expiresInDays) : undefined,
+      });
+      const { token, ...created } = data;
+      setTokens((prev) => [created, ...prev]);
+      setNewToken(token);
+      setAdding(false);
+      setName('');
+      setCanWrite(false);
+      setExpiresInDays('');
+    } catch {
+      Toast.show('Failed to create API token');
+    }
+  };
+
+  const handleRevoke = async (id: string) => {
+    if (!workspaceId) return;
+    await apiTokensApi.revoke(workspaceId, id);
+    setTokens((prev) => prev.filter((t) => t.id !== id));
+    Toast.show('API token revoked');
+  };
+
+  return (
+    <div className="space-y-5">
+      <div className="flex items-center justify-between">
+        <h3 className="text-lg font-medium" style={{ color: 'var(--color-text)' }}>API Tokens</h3>
+        <button
+          onClick={() => setAdding(true)}
+          className="flex items-center gap-1.5 px-3 py-1.5 text-white rounded-lg text-sm font-medium"
+          style={{ backgroundColor: 'var(--color-primary)' }}
+        >
+          <Plus size={14} />
+          New Token
+        </button>
+      </div>
+
+      <p className="text-xs" style={{ color: 'var(--color-text-secondary)' }}>
+        Personal tokens let scripts and integrations call the API as you. Send them as <code>Authorization: Bearer pv_...</code>.
+      </p>
+
+      {newToken && (
+        <div className="p-4 rounded-lg border space-y-2" style={{ borderColor: 'var(--color-border)', backgroundColor: 'var(--color-grey-1)' }}>
+          <p className="text-sm" style={{ color: 'var(--color-text)' }}>
+            Copy this token now — it won't be shown again.
+          </p>
+          <div className="flex items-center gap-2">
+            <code className="flex-1 px-3 py-2 text-xs rounded-lg break-all" style={{ backgroundColor: 'var(--color-surface)', color: 'var(--color-text)' }}>
+              {newToken}
+            </code>
+            <button
+              onClick={() => {
+                navigator.clipboard.writeText(newToken);
+                setCopied(true);
+                setTimeout(() => setCopied(false), 2000);
+              }}
+              className="p-2 rounded-lg hover:bg-[var(--color-grey-2)]"
+              style={{ color: 'var(--color-text-secondary)' }}
+            >
+              {copied ? <Check size={16} /> : <Copy size={16} />}
+            </button>
+          </div>
+          <button
+            onClick={() => { setNewToken(null); setCopied(false); }}
+            className="text-xs"
+            style={{ color: 'var(--color-text-secondary)' }}
+          >
+            Done
+          </button>
+        </div>
+      )}
+
+      {adding && (
+        <div className="p-4 rounded-lg border space-y-3" style={{ borderColor: 'var(--color-border)', backgroundColor: 'var(--color-grey-1)' }}>
+          <input
+            autoFocus
+            value={name}
+            onChange={(e) => setName(e.target.value)}
+            placeholder="Token name, e.g. CI pipeline"
+            className="w-full px-3 py-2 text-sm border rounded-lg outline-none"
+            style={{ borderColor: 'var(--color-border)', backgroundColor: 'var(--color-surface)', color: 'var(--color-text)' }}
+          />
+          <label className="flex items-center gap-2 text-sm" style={{ color: 'var(--color-text)' }}>
+            <input type="checkbox" checked={canWrite} onChange={(e) => setCanWrite(e.target.checked)} />
+            Allow changes (otherwise read-only)
+          </label>
+          <div>
+            <label className="text-xs mb-1 block" style={{ color: 'var(--color-text-secondary)' }}>
+              Expires after (days, blank for never)
+            </label>
+            <input
+              type="number"
+              min={1}
+              value={expiresInDays}
+              onChange={(e) => setExpiresInDays(e.target.value)}
+              className="w-32 px-3 py-2 text-sm border rounded-lg outline-none"
+              style={{ borderColor: 'var(--color-border)', backgroundColor: 'var(--color-surface)', color: 'var(--color-text)' }}
+            />
+          </div>
+          <div className="flex gap-2">
+            <button
+              onClick={handleCreate}
+              disabled={!name.trim()}
+              className="px-4 py-2 text-white rounded-lg text-sm font-medium disabled:opacity-50"
+              style={{ backgroundColor: 'var(--color-primary)' }}
+            >
+              Create
+            </button>
+            <button
+              onClick={() => setAdding(false)}
+              className="px-3 py-2 text-sm rounded-lg"
+              style={{ color: 'var(--color-text-secondary)' }}
+            >
+              Cancel
+            </button>
+          </div>
+        </div>
+      )}
+
+      {tokens.length === 0 && !adding && (
+        <p className="text-sm" style={{ color: 'var(--color-text-secondary)' }}>No API tokens.</p>
+      )}
+
+      <div className="space-y-2">
+        {tokens.map((t) => (
+          <div
+            key={t.id}
+            className="flex items-center gap-3 p-3 rounded-lg border"
+            style={{ borderColor: 'var(--color-border)', backgroundColor: 'var(--color-surface)' }}
+          >
+            <div className="flex-1 min-w-0">
+              <p className="text-sm font-medium truncate" style={{ color: 'var(--color-text)' }}>
+                {t.name} <span className="text-xs font-normal">({t.scopes.includes('write') ? 'read & write' : 'read-only'})</span>
+              </p>
+              <p className="text-xs truncate" style={{ color: 'var(--color-text-secondary)' }}>
+                {t.token_prefix}… · {t.last_used_at ? `last used ${new Date(t.last_used_at).toLocaleDateString()}` : 'never used'}
+                {t.expires_at && ` · expires ${new Date(t.expires_at).toLocaleDateString()}`}
+              </p>
+            </div>
+            <button
+              onClick={() => handleRevoke(t.id)}
+              className="p-1.5 rounded hover:bg-[var(--color-grey-2)]"
+              style={{ color: 'var(--color-danger, #ef4444)' }}
+            >
+              <Trash2 size={14} />
+            </button>
+          </div>
+        ))}
+      </div>
+    </div>
+  );
+}
+
 function CustomFieldsTab({ workspaceId }: { workspaceId?: string }) {
   const [fields, setFields] = useState<CustomField[]>([]);
   const [adding, setAdding] = useState(false);
@@ -1,5 +1,9 @@
 import { create } from 'zustand';
 import { api } from '../api/client';
+import { workspacesApi, type WorkspaceBootstrap } from '../api/workspaces';
+import { useNotificationStore } from './notificationStore';
+import { useProjectStore } from './projectStore';
+import { useTeamStore } from './teamStore';
 
 interface Workspace {
   id: string;
@@ -8,16 +12,24 @@ interface Workspace {
   updated_at: string;
 }
 
+type ReferenceData = Pick<
+  WorkspaceBootstrap,
+  'members' | 'tags' | 'custom_fields' | 'templates' | 'milestones' | 'clients'
+>;
+
 interface WorkspaceState {
   workspaces: Workspace[];
   currentWorkspace: Workspace | null;
+  reference: ReferenceData | null;
   fetchWorkspaces: () => Promise<void>;
   setCurrentWorkspace: (workspace: Workspace) => void;
+  bootstrap: (workspaceId: string) => Promise<void>;
 }
 
 export const useWorkspaceStore = create<WorkspaceState>((set) => ({
   workspaces: [],
   currentWorkspace: null,
+  reference: null,
 
   fetchWorkspaces: async () => {
     const { data } = await api.get<Workspace[]>('/workspaces');
@@ -28,4 +40,17 @@ export const useWorkspaceStore = create<WorkspaceState>((set) => ({
   },
 
   setCurrentWorkspace: (workspace) => set({ currentWorkspace: workspace }),
+
+  // One request for everything the app shell needs, fanned out to the stores
+  bootstrap: async (workspaceId) => {
+    const { data } = await workspacesApi.bootstrap(workspaceId);
+    const { workspace, teams, projects, unread_notifications, ...reference } = data;
+    useTeamStore.setState({ teams, isLoading: false });
+    useProjectStore.setState({ projects, isLoading: false });
+    useNotificationStore.setState({ unreadCount: unread_notifications });
+    set((state) => ({
+      reference,
+      workspaces: state.workspaces.map((w) => (w.id === workspace.id ? workspace : w)),
+    }));
+  },
 }));
@@ -0,0 +1,43 @@
+// Mirrors backend app/services/rank_service.py so the board can place a
+// moved card optimistically; the server's key is applied once it responds.
+const DIGITS = '0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz';
+const BASE = DIGITS.length;
+
+function midpoint(a: string, b: string | null): string {
+  if (b !== null) {
+    let n = 0;
+    while (n < b.length && (a[n] ?? '0') === b[n]) n++;
+    if (n > 0) return b.slice(0, n) + midpoint(a.slice(n), b.slice(n));
+  }
+  const lo = a ? DIGITS.indexOf(a[0]) : 0;
+  const hi = b ? DIGITS.indexOf(b[0]) : BASE;
+  if (hi - lo > 1) return DIGITS[Math.floor((lo + hi) / 2)];
+  if (b && b.length > 1) return b[0];
+  return DIGITS[lo] + midpoint(a.slice(1), null);
+}
+
+/** Key after `a` and before `b`; null when the neighbours are out of order. */
+export function keyBetween(a: string | null, b: string | null): string | null {
+  if (a !== null && b !== null && a >= b) return null;
+  if (a && b === null) {
+    for (let i = 0; i < a.length; i++) {
+      const digit = DIGITS.indexOf(a[i]);
+      if (digit < BASE - 1) return a.slice(0, i) + DIGITS[digit + 1];
+    }
+    return a + DIGITS[BASE / 2];
+  }
+  return midpoint(a ?? '', b);
+}
+
+/** Board order: rank (unranked last), then the legacy sort_order. */
+export function compareTaskOrder(
+  a: { rank: string | null; sort_order: number },
+  b: { rank: string | null; sort_order: number },
+): number {
+  if (a.rank !== b.rank) {
+    if (a.rank === null) return 1;
+    if (b.rank === null) return -1;
+    return a.rank < b.rank ? -1 : 1;
+  }
+  return a.sort_order - b.sort_order;
+}